@@ -0,0 +1,233 @@
+"""
+Check that each stage of the parsing pipeline takes time proportional to
+the length of its input, using generated inputs that are known to make
+parsers slow: deep nesting, long runs of digits, repeated scale words,
+long Chinese strings, many hyphenated compound numbers, postfix operators
+and huge exponents.
+
+Each shape of input is generated at increasing sizes, and the time of
+every stage is compared with its time for the previous size. A stage is
+reported, along with the input to the pipeline, when its time grows by
+more than TOLERANCE times the growth of the stage's own input, which is
+measured in characters for strings and lists of tokens alike.
+
+Evaluation uses a limit on the size of results, as any service evaluating
+untrusted text should, so that huge exponents are refused rather than
+computed.
+
+Usage: python -m benchmarks.adversarial_inputs
+"""
+import sys
+import time
+from mathparse import mathparse
+
+
+SIZES = [1000, 4000, 16000]
+
+# Allowed growth of a stage's time, relative to the growth of its input
+TOLERANCE = 3
+
+# Times below this many seconds are treated as this long, so that the
+# timer's resolution is not mistaken for growth
+MINIMUM_SECONDS = 0.00005
+
+REPEAT = 3
+
+LIMITS = mathparse.EvaluationLimits(
+    max_length=None, max_tokens=None, max_depth=None, timeout=None
+)
+
+
+def repeat_to_size(text, size, end=''):
+    return text * max(1, (size - len(end)) // len(text)) + end
+
+
+SHAPES = {
+    'deep nesting': (None, lambda size: (
+        '(' * (size // 2) + '1' + ')' * (size // 2)
+    )),
+    'unclosed nesting': (None, lambda size: '(' * size + '1'),
+    'long digit runs': (None, lambda size: (
+        '9' * (size // 2) + '+' + '9' * (size // 2)
+    )),
+    'long decimals': (None, lambda size: (
+        '9' * (size // 2) + '.' + '9' * (size // 2)
+    )),
+    'long sums': (None, lambda size: repeat_to_size('12 + ', size, '1')),
+    'huge exponents': (None, lambda size: (
+        repeat_to_size('9 ^ ', size, '9')
+    )),
+    'repeated scale words': ('ENG', lambda size: (
+        'one' + repeat_to_size(' hundred thousand', size)
+    )),
+    'scale words and numbers': ('ENG', lambda size: (
+        repeat_to_size('nine hundred ninety nine thousand ', size, 'one')
+    )),
+    'hyphenated compounds': ('ENG', lambda size: (
+        repeat_to_size('twenty-one plus ', size, 'one')
+    )),
+    'postfix operators': ('ENG', lambda size: (
+        repeat_to_size('(1 + 2) squared times ', size, 'one cubed')
+    )),
+    'long chinese strings': ('CHI', lambda size: (
+        repeat_to_size('三百二十一加', size, '一')
+    )),
+    'chinese without operators': ('CHI', lambda size: (
+        repeat_to_size('九', size)
+    )),
+}
+
+
+def pipeline(string, language):
+    """
+    Yield the name and a function for each stage that parse() and
+    extract_expression() run for the string. Each function is given the
+    output of the previous stage.
+    """
+    if language == 'CHI':
+        yield 'replace_word_tokens', (
+            mathparse.replace_word_tokens_simplified_chinese
+        )
+    elif language:
+        yield 'replace_word_tokens', lambda value: (
+            mathparse.replace_word_tokens(value, language)
+        )
+
+    yield 'tokenize', lambda value: mathparse.tokenize(value, language)
+    yield 'preprocess_unary_operators', mathparse.preprocess_unary_operators
+    yield 'to_postfix', mathparse.to_postfix
+    yield 'evaluate_postfix', lambda value: (
+        mathparse.evaluate_postfix(value, LIMITS)
+    )
+
+
+def numeric_pipeline(string, language):
+    """
+    Yield the stages of the numeric fast path, when parse() would use it.
+    """
+    if not language and mathparse.is_numeric_expression(string):
+        yield 'scan_numeric_expression', mathparse.scan_numeric_expression
+        yield 'evaluate_infix', lambda value: (
+            mathparse.evaluate_infix(value, LIMITS)
+        )
+
+
+def extraction(string, language):
+    yield 'extract_expression', lambda value: (
+        mathparse.extract_expression(value, language)
+    )
+
+
+def input_size(value):
+    """
+    Return the number of characters in a string, or in all of the tokens
+    of a list.
+    """
+    if isinstance(value, str):
+        return len(value)
+    return sum(len(str(token)) for token in value)
+
+
+def time_stages(string, language):
+    """
+    Return dictionaries of the shortest time taken by each stage over
+    REPEAT runs, of the length of each stage's input, and of the unexpected
+    exceptions raised by any stage. A stage that raises an exception ends
+    its pipeline.
+    """
+    times = {}
+    sizes = {}
+    errors = {}
+
+    for stages in [pipeline, numeric_pipeline, extraction]:
+        for _ in range(REPEAT):
+            value = string
+
+            for name, function in stages(string, language):
+                sizes[name] = input_size(value)
+                started = time.perf_counter()
+                try:
+                    value = function(value)
+                except mathparse.PostfixTokenEvaluationException:
+                    value = None
+                except Exception as error:
+                    errors[name] = error
+                    value = None
+                seconds = time.perf_counter() - started
+
+                times[name] = min(seconds, times.get(name, seconds))
+
+                if value is None:
+                    break
+
+    return times, sizes, errors
+
+
+def describe(string, length=60):
+    if len(string) <= length:
+        return repr(string)
+    return '{}... ({} characters)'.format(repr(string[:length]), len(string))
+
+
+def main():
+    failures = []
+
+    print('{:<26} {:<28} {:>8} {:>10} {:>10}'.format(
+        'shape', 'stage', 'size', 'ms', 'growth'
+    ))
+
+    for shape, (language, create) in SHAPES.items():
+        previous = None
+
+        for size in SIZES:
+            string = create(size)
+            times, sizes, errors = time_stages(string, language)
+
+            for stage, error in errors.items():
+                failures.append((shape, stage, string, '{} raised {}'.format(
+                    stage, repr(error)
+                )))
+
+            for stage, seconds in times.items():
+                growth = ''
+
+                if previous and stage in previous[0]:
+                    previous_times, previous_sizes = previous
+                    ratio = max(sizes[stage], 1) / max(
+                        previous_sizes[stage], 1
+                    )
+                    budget = TOLERANCE * ratio * max(
+                        previous_times[stage], MINIMUM_SECONDS
+                    )
+                    growth = '{:.1f}x'.format(
+                        seconds / max(previous_times[stage], MINIMUM_SECONDS)
+                    )
+
+                    if seconds > budget:
+                        failures.append((
+                            shape, stage, string,
+                            '{} took {:.3f} ms, over its budget of {:.3f} '
+                            'ms'.format(stage, seconds * 1000, budget * 1000)
+                        ))
+
+                print('{:<26} {:<28} {:>8} {:>10.3f} {:>10}'.format(
+                    shape, stage, sizes[stage], seconds * 1000, growth
+                ))
+
+            previous = (times, sizes)
+
+    for shape, stage, string, message in failures:
+        print()
+        print('{} for {} input'.format(message, shape))
+        print('Input: {}'.format(describe(string)))
+
+    if failures:
+        return 1
+
+    print()
+    print('Every stage stayed within its budget')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Compare the completion latency of cheap expressions in a mixed batch when
+the batch is evaluated in its original order and in order of estimated cost.
+
+Usage: python -m benchmarks.batch_scheduling
+"""
+import time
+from mathparse import mathparse
+
+
+CHEAP_EXPRESSIONS = ['12 * (3 + 4)', '100 / 7', 'sqrt 16 + 2', '5 - 3 * 2']
+EXPENSIVE_EXPRESSIONS = ['7 ^ 200000', '3 ^ 400000']
+
+
+def build_batch(size=2000, expensive_every=100):
+    batch = []
+    for index in range(size):
+        if index % expensive_every == 0:
+            batch.append(EXPENSIVE_EXPRESSIONS[index % 2])
+        else:
+            batch.append(CHEAP_EXPRESSIONS[index % len(CHEAP_EXPRESSIONS)])
+    return batch
+
+
+def completion_latencies(expressions, order):
+    """
+    Evaluate the expressions in the given order and return the time at
+    which each cheap expression completed, relative to the batch start.
+    """
+    latencies = []
+    started = time.perf_counter()
+
+    for index in order:
+        expressions[index].evaluate()
+        if expressions[index].postfix[-1] != '^':
+            latencies.append(time.perf_counter() - started)
+
+    return sorted(latencies)
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    batch = build_batch()
+    expressions = [mathparse.compile(string) for string in batch]
+
+    estimate_started = time.perf_counter()
+    costs = [mathparse.estimate_cost(expression) for expression in expressions]
+    estimate_time = time.perf_counter() - estimate_started
+
+    orders = {
+        'fifo': list(range(len(batch))),
+        'cost': sorted(range(len(batch)), key=costs.__getitem__),
+    }
+
+    print('{} expressions, cost estimation took {:.2f} ms'.format(
+        len(batch), estimate_time * 1000
+    ))
+    print('{:<6} {:>10} {:>10} {:>10} {:>10}'.format(
+        'order', 'p50 ms', 'p95 ms', 'p99 ms', 'max ms'
+    ))
+
+    for name, order in orders.items():
+        latencies = completion_latencies(expressions, order)
+        print('{:<6} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.2f}'.format(
+            name,
+            percentile(latencies, 0.50) * 1000,
+            percentile(latencies, 0.95) * 1000,
+            percentile(latencies, 0.99) * 1000,
+            latencies[-1] * 1000
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Compare the memory used by a large number of compiled expressions when
+they are stored as lists of postfix tokens and as Bytecode, and the time
+taken to evaluate and deserialize them.
+
+Usage: python -m benchmarks.bytecode_memory
+"""
+import random
+import timeit
+import tracemalloc
+from mathparse import mathparse
+
+
+def build_expressions(count=100000, seed=0):
+    generator = random.Random(seed)
+    operators = ['+', '-', '*', '/']
+    expressions = []
+
+    for _ in range(count):
+        terms = [
+            str(generator.randint(1, 500))
+            for _ in range(generator.randint(2, 8))
+        ]
+        expression = terms[0]
+        for term in terms[1:]:
+            expression += ' {} {}'.format(generator.choice(operators), term)
+        expressions.append(expression)
+
+    return expressions
+
+
+def measure(build):
+    tracemalloc.start()
+    programs = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return programs, size
+
+
+def main():
+    expressions = build_expressions()
+
+    # Compile with the general tokenizer so that the operands are strings,
+    # as they are for expressions that contain words
+    def compile_all():
+        return [
+            mathparse.CompiledExpression(
+                mathparse.to_postfix(mathparse.tokenize(expression))
+            )
+            for expression in expressions
+        ]
+
+    serialized = [
+        expression.to_bytecode().to_bytes() for expression in compile_all()
+    ]
+    bytecode, bytecode_size = measure(lambda: [
+        mathparse.Bytecode.from_bytes(data) for data in serialized
+    ])
+    compiled, postfix_size = measure(compile_all)
+
+    print('{} expressions'.format(len(expressions)))
+    print('{:<24} {:>12}'.format('format', 'MiB'))
+    print('{:<24} {:>12.2f}'.format('postfix lists', postfix_size / 2 ** 20))
+    print('{:<24} {:>12.2f}'.format('bytecode', bytecode_size / 2 ** 20))
+    print('{:<24} {:>12.2f}'.format(
+        'serialized bytes', sum(map(len, serialized)) / 2 ** 20
+    ))
+
+    sample = range(0, len(expressions), 100)
+    number = 10
+
+    def evaluate_postfix():
+        for index in sample:
+            compiled[index].evaluate()
+
+    def evaluate_bytecode():
+        for index in sample:
+            bytecode[index].evaluate()
+
+    def load_and_evaluate():
+        for index in sample:
+            mathparse.Bytecode.from_bytes(serialized[index]).evaluate()
+
+    print('{:<24} {:>12}'.format('evaluation', 'us each'))
+    for name, function in [
+        ('postfix list', evaluate_postfix),
+        ('bytecode', evaluate_bytecode),
+        ('from_bytes + bytecode', load_and_evaluate),
+    ]:
+        seconds = timeit.timeit(function, number=number)
+        print('{:<24} {:>12.2f}'.format(
+            name, seconds / number / len(sample) * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Compare loading a large number of compiled expressions into memory with
+opening them as a memory-mapped catalog, and the latency of evaluating
+individual expressions from each.
+
+Usage: python -m benchmarks.expression_catalog
+"""
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from mathparse import mathparse
+
+
+def build_expressions(count, seed=0):
+    generator = random.Random(seed)
+    operators = ['+', '-', '*', '/']
+    expressions = {}
+
+    for index in range(count):
+        terms = [
+            str(generator.randint(1, 500))
+            for _ in range(generator.randint(2, 8))
+        ]
+        expression = terms[0]
+        for term in terms[1:]:
+            expression += ' {} {}'.format(generator.choice(operators), term)
+        expressions['formula-{}'.format(index)] = expression
+
+    return expressions
+
+
+def measure(load):
+    """
+    Return the result of the load function, the time it took, and the
+    memory that it allocated, which is measured in a second call so that
+    tracing does not affect the time.
+    """
+    started = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    traced = load()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    if isinstance(traced, mathparse.ExpressionCatalog):
+        traced.close()
+
+    return result, elapsed, size
+
+
+def latencies(evaluate, keys):
+    results = []
+    for key in keys:
+        started = time.perf_counter()
+        evaluate(key)
+        results.append(time.perf_counter() - started)
+    return sorted(results)
+
+
+def main(count=200000, lookups=10000):
+    expressions = build_expressions(count)
+    builder = mathparse.CatalogBuilder()
+
+    started = time.perf_counter()
+    for key, expression in expressions.items():
+        builder.add(key, expression)
+    build_time = time.perf_counter() - started
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'expressions.catalog')
+    builder.write(path)
+    serialized = dict(builder.programs)
+    del builder
+
+    print('{} expressions, compiled in {:.2f} s, catalog is {:.2f} MiB'.format(
+        count, build_time, os.path.getsize(path) / 2 ** 20
+    ))
+
+    loaded, load_time, load_size = measure(lambda: {
+        key: mathparse.Bytecode.from_bytes(data)
+        for key, data in serialized.items()
+    })
+    catalog, open_time, open_size = measure(
+        lambda: mathparse.ExpressionCatalog(path)
+    )
+
+    keys = random.Random(1).choices(list(expressions), k=lookups)
+    in_memory = latencies(lambda key: loaded[key].evaluate(), keys)
+    mapped = latencies(catalog.evaluate, keys)
+
+    print('{:<12} {:>10} {:>12} {:>10} {:>10}'.format(
+        'storage', 'load ms', 'heap MiB', 'p50 us', 'p99 us'
+    ))
+    for name, load, size, timings in [
+        ('in memory', load_time, load_size, in_memory),
+        ('mmap', open_time, open_size, mapped),
+    ]:
+        print('{:<12} {:>10.2f} {:>12.2f} {:>10.2f} {:>10.2f}'.format(
+            name,
+            load * 1000,
+            size / 2 ** 20,
+            timings[len(timings) // 2] * 1e6,
+            timings[int(len(timings) * 0.99)] * 1e6
+        ))
+
+    catalog.close()
+    os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
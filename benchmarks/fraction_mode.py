@@ -0,0 +1,90 @@
+"""
+Compare evaluating compiled expressions without a numeric mode, where
+every division produces a Decimal, with the 'fraction' numeric mode, both
+when every number is a Fraction and when integers are kept as int until a
+division or a negative power needs a Fraction, which is what the mode
+uses.
+
+The last column shows whether the result without a numeric mode, which is
+rounded after every division, equals the exact result.
+
+Usage: python -m benchmarks.fraction_mode
+"""
+import timeit
+from fractions import Fraction
+from mathparse import mathparse
+
+
+def division_chain(length):
+    return ' / '.join(['1000000'] + [str(3 + index % 7) for index in range(
+        length
+    )])
+
+
+def sum_of_quotients(length):
+    return ' + '.join(
+        '{} / {}'.format(index + 1, index + 2) for index in range(length)
+    )
+
+
+def integer_sum(length):
+    return ' + '.join('{} * {}'.format(index, index + 1) for index in range(
+        length
+    ))
+
+
+EXPRESSIONS = {
+    'divisions 10': division_chain(10),
+    'divisions 100': division_chain(100),
+    'quotients 10': sum_of_quotients(10),
+    'quotients 100': sum_of_quotients(100),
+    'third times three': '1 / 3 * 3',
+    'integers 100': integer_sum(100),
+}
+
+
+def all_fractions(postfix):
+    return [
+        Fraction(token) if isinstance(token, int) else token
+        for token in postfix
+    ]
+
+
+def measure(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main(number=200):
+    print('{:<20} {:>12} {:>14} {:>12} {:>8} {:>6}'.format(
+        'expression', 'decimal us', 'fractions us', 'int us', 'speedup',
+        'exact'
+    ))
+
+    for name, string in EXPRESSIONS.items():
+        decimal = mathparse.compile(string)
+        exact = mathparse.compile(string, numeric_mode='fraction')
+        fractions = all_fractions(exact.postfix)
+
+        result = exact.evaluate()
+        assert mathparse.evaluate_postfix(
+            fractions, numeric_mode='fraction'
+        ) == result
+
+        decimal_seconds = measure(decimal.evaluate, number)
+        fraction_seconds = measure(lambda: mathparse.evaluate_postfix(
+            fractions, numeric_mode='fraction'
+        ), number)
+        int_seconds = measure(exact.evaluate, number)
+
+        print('{:<20} {:>12.2f} {:>14.2f} {:>12.2f} {:>7.2f}x {:>6}'.format(
+            name,
+            decimal_seconds * 1e6,
+            fraction_seconds * 1e6,
+            int_seconds * 1e6,
+            fraction_seconds / int_seconds,
+            str(decimal.evaluate() == result)
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compare evaluating tokens by building a postfix list and then walking it
+with evaluating them in a single pass using the fused engine.
+
+Usage: python -m benchmarks.fused_engine
+"""
+import timeit
+from mathparse import mathparse
+
+
+EXPRESSIONS = [
+    ('five plus three', 'ENG'),
+    ('(seven times nine) plus 8 minus (45 plus two)', 'ENG'),
+    ('square root of sixteen times three', 'ENG'),
+    ('2 + 3 * 4 - 1 / 2', None),
+]
+
+
+def main(number=5000):
+    print('{:<48} {:>12} {:>12} {:>8}'.format(
+        'expression', 'postfix us', 'fused us', 'speedup'
+    ))
+
+    for string, language in EXPRESSIONS:
+        if language:
+            string = mathparse.replace_word_tokens(string, language)
+        tokens = mathparse.preprocess_unary_operators(
+            mathparse.tokenize(string, language)
+        )
+
+        assert mathparse.evaluate_infix(tokens) == mathparse.evaluate_postfix(
+            mathparse.to_postfix(tokens)
+        )
+
+        postfix = timeit.timeit(
+            lambda: mathparse.evaluate_postfix(mathparse.to_postfix(tokens)),
+            number=number
+        ) / number
+        fused = timeit.timeit(
+            lambda: mathparse.evaluate_infix(tokens), number=number
+        ) / number
+
+        label = string if len(string) <= 48 else string[:45] + '...'
+        print('{:<48} {:>12.2f} {:>12.2f} {:>7.2f}x'.format(
+            label, postfix * 1e6, fused * 1e6, postfix / fused
+        ))
+
+
+if __name__ == '__main__':
+    main()
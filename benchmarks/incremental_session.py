@@ -0,0 +1,61 @@
+"""
+Compare the time per keystroke of calling parse() on every version of an
+expression as it is typed with updating a ParseSession.
+
+Usage: python -m benchmarks.incremental_session
+"""
+import time
+from mathparse import mathparse
+
+
+def type_expression(evaluate, string):
+    """
+    Evaluate every prefix of the string, as a calculator would while it
+    is being typed, and return the time taken for each keystroke.
+    """
+    timings = []
+
+    for end in range(1, len(string) + 1):
+        started = time.perf_counter()
+        try:
+            evaluate(string[:end])
+        except Exception:
+            # Most prefixes, such as '12 +', are incomplete expressions
+            pass
+        timings.append(time.perf_counter() - started)
+
+    return timings
+
+
+def main():
+    print('{:<10} {:>8} {:>12} {:>12} {:>14} {:>16}'.format(
+        'terms', 'chars', 'parse us', 'session us',
+        'parse last us', 'session last us'
+    ))
+
+    for terms in [10, 100, 1000]:
+        string = ' + '.join(
+            '{} * {}'.format(number, number % 7 + 1)
+            for number in range(terms)
+        )
+
+        parse_timings = type_expression(mathparse.parse, string)
+        session_timings = type_expression(
+            mathparse.ParseSession().update, string
+        )
+
+        # The last keystrokes show the cost of editing a long expression
+        last = slice(-50, None)
+
+        print('{:<10} {:>8} {:>12.2f} {:>12.2f} {:>14.2f} {:>16.2f}'.format(
+            terms,
+            len(string),
+            sum(parse_timings) / len(string) * 1e6,
+            sum(session_timings) / len(string) * 1e6,
+            sum(parse_timings[last]) / 50 * 1e6,
+            sum(session_timings[last]) / 50 * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
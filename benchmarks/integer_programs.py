@@ -0,0 +1,67 @@
+"""
+Compare the time taken to evaluate compiled expressions that only use
+integers and the operators +, -, * and ^, with the general evaluator and
+with plain int arithmetic, which is what CompiledExpression.evaluate()
+uses for them.
+
+The general evaluator checks the type of every token and converts each
+operand with to_number(). The integer programs are classified, and their
+numbers converted, once, when the expression is compiled. The time of
+that classification pass is shown for comparison.
+
+Usage: python -m benchmarks.integer_programs
+"""
+import timeit
+from mathparse import mathparse
+
+
+EXPRESSIONS = {
+    'product words': ('ENG', 'forty two times one hundred'),
+    'power words': ('ENG', 'two to the power of ten minus five'),
+    'negative words': ('ENG', 'negative three times four plus nine'),
+    'sum of 10': (None, ' + '.join(str(index) for index in range(10))),
+    'sum of 100': (None, ' + '.join(str(index) for index in range(100))),
+    'products 100': (None, ' - '.join(
+        '{} * {}'.format(index, index + 7) for index in range(100)
+    )),
+}
+
+
+def measure(function, number):
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def main(number=2000):
+    print('{:<16} {:>8} {:>12} {:>12} {:>8} {:>14}'.format(
+        'expression', 'tokens', 'general us', 'integer us', 'speedup',
+        'classify us'
+    ))
+
+    for name, (language, string) in EXPRESSIONS.items():
+        expression = mathparse.compile(string, language)
+        postfix = expression.postfix
+        integers = expression.integer_postfix
+
+        assert integers is not None
+        assert mathparse.evaluate_integer_postfix(integers) == (
+            mathparse.evaluate_postfix(postfix)
+        )
+
+        general = measure(
+            lambda: mathparse.evaluate_postfix(postfix), number
+        )
+        integer = measure(
+            lambda: mathparse.evaluate_integer_postfix(integers), number
+        )
+        classify = measure(
+            lambda: mathparse.to_integer_postfix(postfix), number
+        )
+
+        print('{:<16} {:>8} {:>12.2f} {:>12.2f} {:>7.2f}x {:>14.2f}'.format(
+            name, len(postfix), general * 1e6, integer * 1e6,
+            general / integer, classify * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Measure how the time taken to replace the words of long numbers grows
+with the length of the number.
+
+Each number repeats a phrase such as 'nine hundred nine thousand', so a
+number with ten times as many phrases should take about ten times as long.
+
+Usage: python -m benchmarks.number_phrases
+"""
+import timeit
+from mathparse import mathparse
+
+
+PHRASE = 'nine hundred ninety nine thousand'
+
+
+def main():
+    print('{:>8} {:>10} {:>12} {:>14}'.format(
+        'phrases', 'chars', 'total ms', 'us per phrase'
+    ))
+
+    for count in [10, 100, 1000, 10000]:
+        string = ' '.join([PHRASE] * count)
+        number = max(1, 10000 // count)
+
+        seconds = timeit.timeit(
+            lambda: mathparse.replace_word_tokens(string, 'ENG'),
+            number=number
+        ) / number
+
+        print('{:>8} {:>10} {:>12.2f} {:>14.2f}'.format(
+            count, len(string), seconds * 1000, seconds / count * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare the time taken to replace number words with digits for every
+supported language, searching for each word with its own pattern and
+searching for all of the words with one combined pattern, which is what
+replace_word_tokens() uses.
+
+Each string contains every number word of its language, separated by
+spaces.
+
+Usage: python -m benchmarks.number_words
+"""
+import re
+import timeit
+from mathparse import mathparse, mathwords
+
+
+def replace_each_word(string, numbers):
+    for number in frozenset(numbers.keys()):
+        pattern = mathparse.create_unicode_word_boundary_pattern(number)
+        if re.search(pattern, string):
+            string = re.sub(pattern, str(numbers[number]), string)
+    return string
+
+
+def replace_all_words(string, numbers):
+    return mathparse.number_word_pattern(numbers).sub(
+        lambda match: str(numbers[match.group()]), string
+    )
+
+
+def main(number=200):
+    print('{:<10} {:>8} {:>14} {:>14} {:>8}'.format(
+        'language', 'words', 'each word us', 'combined us', 'speedup'
+    ))
+
+    total_each = total_combined = 0
+
+    for language in mathwords.LANGUAGE_CODES:
+        numbers = mathwords.word_groups_for_language(language)['numbers']
+        string = ' '.join(numbers)
+
+        each = timeit.timeit(
+            lambda: replace_each_word(string, numbers), number=number
+        ) / number
+        combined = timeit.timeit(
+            lambda: replace_all_words(string, numbers), number=number
+        ) / number
+
+        total_each += each
+        total_combined += combined
+
+        print('{:<10} {:>8} {:>14.2f} {:>14.2f} {:>7.2f}x'.format(
+            language, len(numbers), each * 1e6, combined * 1e6,
+            each / combined
+        ))
+
+    print('{:<10} {:>8} {:>14.2f} {:>14.2f} {:>7.2f}x'.format(
+        'all', '', total_each * 1e6, total_combined * 1e6,
+        total_each / total_combined
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare the time taken to parse numeric expressions using the general
+tokenizer and using the numeric fast path that parse() selects for them.
+
+Usage: python -m benchmarks.numeric_fast_path
+"""
+import timeit
+from mathparse import mathparse
+
+
+EXPRESSIONS = [
+    '12.5 * (3 + 4)',
+    '2 + 3 * 4',
+    '-3.25 / (1.5 - 0.75) ^ 2',
+    'sqrt 16 + log 100 * pi',
+    ' + '.join(str(number) for number in range(100)),
+]
+
+
+def parse_general(string):
+    tokens = mathparse.tokenize(string)
+    tokens = mathparse.preprocess_unary_operators(tokens)
+    postfix = mathparse.to_postfix(tokens)
+    return mathparse.evaluate_postfix(postfix)
+
+
+def main(number=2000):
+    print('{:<32} {:>12} {:>12} {:>8}'.format(
+        'expression', 'general us', 'fast us', 'speedup'
+    ))
+
+    for string in EXPRESSIONS:
+        assert parse_general(string) == mathparse.parse(string)
+
+        general = timeit.timeit(
+            lambda: parse_general(string), number=number
+        ) / number
+        fast = timeit.timeit(
+            lambda: mathparse.parse(string), number=number
+        ) / number
+
+        label = string if len(string) <= 32 else string[:29] + '...'
+        print('{:<32} {:>12.2f} {:>12.2f} {:>7.2f}x'.format(
+            label, general * 1e6, fast * 1e6, general / fast
+        ))
+
+
+if __name__ == '__main__':
+    main()
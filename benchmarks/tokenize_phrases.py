@@ -0,0 +1,73 @@
+"""
+Compare the time that tokenize() spends on the phrases of a language,
+before and after the phrases were computed once for each language.
+
+Before, every phrase of the language was joined with spaces and replaced
+in the string, and every phrase was escaped, on each call. After, spaced
+phrases are replaced in a single scan for languages written without
+spaces between words, and only phrases that contain spaces are escaped.
+
+Usage: python -m benchmarks.tokenize_phrases
+"""
+import timeit
+from mathparse import mathparse, mathwords
+
+
+EXPRESSIONS = {
+    'ENG': 'what is twenty two divided by the square root of sixteen',
+    'CHI': '二十二 除 以 十六 的 平 方 根 加 上 三',
+}
+
+
+def phrases_before(string, language, escape='___'):
+    words = mathwords.words_for_language(language)
+
+    for phrase in sorted(words, key=len, reverse=True):
+        if len(phrase) > 1:
+            string = string.replace(' '.join(phrase), phrase)
+
+    for phrase in mathwords.words_for_language(language):
+        string = string.replace(phrase, phrase.replace(' ', escape))
+
+    return string
+
+
+def phrases_after(string, language, escape='___'):
+    spaced_phrases, phrases_with_spaces = mathparse._tokenize_phrases(
+        language
+    )
+
+    if spaced_phrases and ' ' in string:
+        pattern, phrases = spaced_phrases
+        string = pattern.sub(lambda match: phrases[match.group()], string)
+
+    for phrase in phrases_with_spaces:
+        if phrase in string:
+            string = string.replace(phrase, phrase.replace(' ', escape))
+
+    return string
+
+
+def main(number=2000):
+    print('{:<10} {:>12} {:>12} {:>8} {:>14}'.format(
+        'language', 'before us', 'after us', 'speedup', 'tokenize us'
+    ))
+
+    for language, string in EXPRESSIONS.items():
+        before = timeit.timeit(
+            lambda: phrases_before(string, language), number=number
+        ) / number
+        after = timeit.timeit(
+            lambda: phrases_after(string, language), number=number
+        ) / number
+        total = timeit.timeit(
+            lambda: mathparse.tokenize(string, language), number=number
+        ) / number
+
+        print('{:<10} {:>12.2f} {:>12.2f} {:>7.2f}x {:>14.2f}'.format(
+            language, before * 1e6, after * 1e6, before / after, total * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
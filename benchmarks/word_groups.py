@@ -0,0 +1,65 @@
+"""
+Measure the time taken to find groups of numbers and scale words in
+adversarial strings of 1 KB, 10 KB and 100 KB.
+
+The strings are shapes that make backtracking patterns slow, such as long
+runs of digits followed by long runs of spaces. The time for each shape
+should grow in proportion to the length of the string, so the time per KB
+should stay about the same for every size.
+
+Usage: python -m benchmarks.word_groups
+"""
+import timeit
+from mathparse import mathparse, mathwords
+
+
+SCALES = mathwords.word_groups_for_language('ENG')['scales']
+
+SHAPES = {
+    'digits': lambda size: '9' * size,
+    'digits then spaces': lambda size: (
+        '1' * (size // 2) + ' ' * (size // 2 - 1) + 'x'
+    ),
+    'number then spaces': lambda size: '1' + ' ' * (size - 1),
+    'numbers and spaces': lambda size: '1 ' * (size // 2),
+    'scale words': lambda size: '1' + ' hundred' * (size // 8),
+    'joined scale words': lambda size: '1 ' + 'hundred' * (size // 7),
+    'unfinished phrases': lambda size: '1 hundred 2 ' * (size // 12) + '.',
+}
+
+
+def measure(function, string):
+    number = 3
+    return min(timeit.repeat(
+        lambda: function(string), number=number, repeat=3
+    )) / number
+
+
+def main():
+    functions = {
+        'find_word_groups': lambda string: mathparse.find_word_groups(
+            string, list(SCALES)
+        ),
+        'replace_number_phrases': lambda string: (
+            mathparse.replace_number_phrases(string, SCALES)
+        ),
+    }
+
+    print('{:<24} {:<20} {:>8} {:>10} {:>10}'.format(
+        'function', 'shape', 'KB', 'ms', 'ms per KB'
+    ))
+
+    for function_name, function in functions.items():
+        for shape, create in SHAPES.items():
+            for kilobytes in [1, 10, 100]:
+                string = create(kilobytes * 1024)
+                seconds = measure(function, string)
+
+                print('{:<24} {:<20} {:>8} {:>10.3f} {:>10.4f}'.format(
+                    function_name, shape, kilobytes, seconds * 1000,
+                    seconds * 1000 / kilobytes
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+An in-memory cache of results and compiled expressions, limited by its
+number of entries, by the approximate size of its entries and by time.
+"""
+from collections import OrderedDict
+from fractions import Fraction
+from .mathparse import CacheInfo, CompiledExpression
+import threading
+import time
+import sys
+
+
+CACHE_POLICIES = ('lru', 'lfu')
+
+
+def approximate_size(value) -> int:
+    """
+    Return the approximate number of bytes of memory used by a value,
+    including the numbers in a Fraction and the tokens of a compiled
+    expression.
+
+    Examples:
+        >>> approximate_size(2 ** 8000) > approximate_size(2 ** 80)
+        True
+    """
+    if isinstance(value, Fraction):
+        return sys.getsizeof(value) + sys.getsizeof(
+            value.numerator
+        ) + sys.getsizeof(value.denominator)
+
+    if isinstance(value, CompiledExpression):
+        return sys.getsizeof(value) + approximate_size(value.postfix)
+
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(
+            approximate_size(item) for item in value
+        )
+
+    return sys.getsizeof(value)
+
+
+class _CacheEntry:
+
+    __slots__ = ('value', 'size', 'expires', 'count')
+
+    def __init__(self, value, size: int, expires: float):
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.count = 1
+
+
+class ResultCache:
+    """
+    An in-memory cache of results and compiled expressions that can be
+    passed to ``parse()`` and ``compile()``.
+
+    The cache holds at most maxsize entries and, if maxbytes is set, at
+    most about maxbytes bytes of keys and values, as measured by
+    ``approximate_size()``. A value larger than maxbytes is not cached.
+    When either limit is reached, the least recently used entry is
+    removed, or with the 'lfu' policy the least frequently used entry.
+    If ttl is set, entries expire that many seconds after they were
+    cached. Expired entries are removed when they are next looked up or
+    evicted, and are counted as evictions. A cache can be shared between
+    threads.
+
+    Args:
+        maxsize (int): The maximum number of entries.
+
+        maxbytes (int, optional): The maximum approximate size of the
+            entries in bytes.
+
+        ttl (float, optional): The number of seconds that an entry is
+            kept for.
+
+        policy (str): 'lru' or 'lfu'.
+
+        timer (callable): The clock used for expiry, which defaults to
+            ``time.monotonic()``.
+
+    Examples:
+        >>> cache = ResultCache(maxsize=1000, maxbytes=10 ** 7, ttl=3600)
+        >>> parse('two to the power of twenty', language='ENG', cache=cache)
+        1048576
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        maxbytes: int = None,
+        ttl: float = None,
+        policy: str = 'lru',
+        timer=time.monotonic
+    ):
+        if maxsize < 1:
+            raise ValueError('The maximum size must be at least 1')
+
+        if policy not in CACHE_POLICIES:
+            raise ValueError(
+                '{} is not an available cache policy, expected one of '
+                '{}'.format(policy, ', '.join(CACHE_POLICIES))
+            )
+
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.policy = policy
+        self.timer = timer
+        self.currbytes = 0
+        self._entries = OrderedDict()
+        # Keys of the 'lfu' policy grouped by their count of uses, with
+        # the least recently used key of each group first
+        self._counts = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str):
+        """
+        Return the cached value for a key, or None if there is none.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires is not None and (
+                self.timer() >= entry.expires
+            ):
+                self._remove(key)
+                self._evictions += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+
+            if self.policy == 'lfu':
+                self._uncount(key, entry)
+                entry.count += 1
+                self._counts.setdefault(entry.count, OrderedDict())[key] = None
+            else:
+                self._entries.move_to_end(key)
+
+            return entry.value
+
+    def set(self, key: str, value):
+        """
+        Cache a value for a key, removing entries as needed to stay within
+        the limits.
+        """
+        size = approximate_size(key) + approximate_size(value)
+        expires = None
+
+        if self.ttl is not None:
+            expires = self.timer() + self.ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+
+            while len(self._entries) >= self.maxsize or (
+                self.maxbytes is not None and
+                self.currbytes + size > self.maxbytes
+            ):
+                self._remove(self._victim())
+                self._evictions += 1
+
+            self._entries[key] = _CacheEntry(value, size, expires)
+            self.currbytes += size
+
+            if self.policy == 'lfu':
+                self._counts.setdefault(1, OrderedDict())[key] = None
+
+    def _victim(self) -> str:
+        if self.policy == 'lfu':
+            return next(iter(self._counts[min(self._counts)]))
+        return next(iter(self._entries))
+
+    def _uncount(self, key: str, entry: _CacheEntry):
+        keys = self._counts[entry.count]
+        del keys[key]
+        if not keys:
+            del self._counts[entry.count]
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self.currbytes -= entry.size
+
+        if self.policy == 'lfu':
+            self._uncount(key, entry)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the number of hits, misses and evictions, and the maximum
+        and current number of entries.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries)
+            )
+
+    def clear(self):
+        """
+        Remove every entry and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._counts.clear()
+            self.currbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
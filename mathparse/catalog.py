@@ -0,0 +1,238 @@
+"""
+Catalogs of compiled expressions that are written to a file once and
+memory-mapped by every process that evaluates them.
+"""
+from decimal import Decimal, Context
+from fractions import Fraction
+from typing import Union
+from .mathparse import (
+    BYTECODE_VERSION, _BYTECODE_READABLE_VERSIONS, Bytecode,
+    CompiledExpression, EvaluationLimits, compile
+)
+import struct
+import mmap
+import os
+
+
+CATALOG_VERSION = 1
+
+# The header is the magic bytes, the catalog version, the bytecode version
+# and the number of expressions. It is followed by an index entry for each
+# expression, sorted by key, then the keys and the bytecode they refer to.
+_CATALOG_MAGIC = b'MPEC'
+_CATALOG_HEADER = struct.Struct('<4sHHQ')
+
+# The offset and length of the key, then of the bytecode, in the file
+_CATALOG_ENTRY = struct.Struct('<QIQI')
+
+
+class CatalogBuilder:
+    """
+    Collects compiled expressions and writes them to a catalog file that
+    can be opened with ExpressionCatalog.
+
+    Strings are compiled using the language, stopwords and numeric_mode
+    that the builder was created with.
+
+    Examples:
+        >>> builder = CatalogBuilder(language='ENG')
+        >>> builder.add('total', 'five plus three')
+        >>> builder.write('expressions.catalog')
+    """
+
+    def __init__(
+        self,
+        language: str = None,
+        stopwords: set[str] = None,
+        numeric_mode: str = None
+    ):
+        self.language = language
+        self.stopwords = stopwords
+        self.numeric_mode = numeric_mode
+        self.programs = {}
+
+    def __len__(self):
+        return len(self.programs)
+
+    def add(
+        self,
+        key: str,
+        expression: Union[str, CompiledExpression, Bytecode]
+    ):
+        """
+        Add an expression to the catalog, replacing any expression that
+        was already added with the same key.
+        """
+        if isinstance(expression, str):
+            expression = compile(
+                expression,
+                self.language,
+                self.stopwords,
+                numeric_mode=self.numeric_mode
+            )
+
+        if isinstance(expression, CompiledExpression):
+            expression = expression.to_bytecode()
+
+        self.programs[key] = expression.to_bytes()
+
+    def write(self, path: str):
+        """
+        Write the catalog to a file. The file is replaced atomically, once
+        its contents are on disk, so processes that have the previous
+        catalog open are not affected.
+        """
+        entries = sorted(
+            (key.encode('utf-8'), program)
+            for key, program in self.programs.items()
+        )
+
+        offset = _CATALOG_HEADER.size + _CATALOG_ENTRY.size * len(entries)
+        index = bytearray()
+
+        for key, program in entries:
+            index += _CATALOG_ENTRY.pack(
+                offset, len(key), offset + len(key), len(program)
+            )
+            offset += len(key) + len(program)
+
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+
+        try:
+            with open(temporary_path, 'wb') as catalog_file:
+                catalog_file.write(_CATALOG_HEADER.pack(
+                    _CATALOG_MAGIC, CATALOG_VERSION, BYTECODE_VERSION,
+                    len(entries)
+                ))
+                catalog_file.write(index)
+                for key, program in entries:
+                    catalog_file.write(key)
+                    catalog_file.write(program)
+
+                # The catalog must be on disk before it replaces the old
+                # one, so that a crash cannot leave a truncated catalog
+                catalog_file.flush()
+                os.fsync(catalog_file.fileno())
+
+            os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+
+
+class ExpressionCatalog:
+    """
+    A read-only catalog of compiled expressions that is memory-mapped from
+    a file written by CatalogBuilder.
+
+    Expressions are looked up by binary search of the index in the file
+    and decoded only when they are requested, so opening a catalog is fast
+    regardless of its size. Processes that open the same catalog share a
+    single copy of it in memory.
+
+    Examples:
+        >>> with ExpressionCatalog('expressions.catalog') as catalog:
+        ...     catalog.evaluate('total')
+        8
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as catalog_file:
+            self._mmap = mmap.mmap(
+                catalog_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        self._view = memoryview(self._mmap)
+
+        try:
+            magic, version, bytecode_version, count = (
+                _CATALOG_HEADER.unpack_from(self._view)
+            )
+        except struct.error:
+            magic = None
+
+        if magic != _CATALOG_MAGIC or version != CATALOG_VERSION or (
+            bytecode_version not in _BYTECODE_READABLE_VERSIONS
+        ):
+            self.close()
+            raise ValueError(
+                'Unsupported expression catalog format in "{}"'.format(path)
+            )
+
+        self._count = count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+
+    def __getitem__(self, key: str) -> Bytecode:
+        entry = self._find(key)
+
+        if entry is None:
+            raise KeyError(key)
+
+        _, _, offset, length = entry
+        return Bytecode.from_bytes(self._view[offset:offset + length])
+
+    def __iter__(self):
+        return self.keys()
+
+    def _entry(self, position: int) -> tuple:
+        return _CATALOG_ENTRY.unpack_from(
+            self._view,
+            _CATALOG_HEADER.size + _CATALOG_ENTRY.size * position
+        )
+
+    def _find(self, key: str) -> Union[tuple, None]:
+        key = key.encode('utf-8')
+        low = 0
+        high = self._count
+
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            found = self._mmap[entry[0]:entry[0] + entry[1]]
+
+            if found == key:
+                return entry
+            elif found < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    def keys(self):
+        """
+        Iterate over the keys of the catalog in sorted order.
+        """
+        for position in range(self._count):
+            offset, length, _, _ = self._entry(position)
+            yield str(self._mmap[offset:offset + length], 'utf-8')
+
+    def evaluate(
+        self,
+        key: str,
+        limits: EvaluationLimits = None,
+        decimal_context: Context = None
+    ) -> Union[int, float, str, Decimal, Fraction]:
+        """
+        Calculate the result of the expression with the given key.
+        """
+        return self[key].evaluate(limits, decimal_context=decimal_context)
+
+    def close(self):
+        """
+        Unmap the catalog file.
+        """
+        self._view.release()
+        self._mmap.close()
@@ -0,0 +1,333 @@
+"""
+Command line interface for evaluating expressions in bulk.
+
+Expressions are read from files, or from standard input, one per line, and
+a JSON object is written to standard output for each of them:
+
+    $ echo "five plus three" | python -m mathparse --language ENG
+    {"file": "-", "line": 1, "expression": "five plus three", "result": 8}
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from fractions import Fraction
+from itertools import islice
+from . import mathparse, mathwords
+import argparse
+import json
+import math
+import csv
+import sys
+
+
+FORMATS = ('text', 'csv', 'jsonl')
+
+# Each process keeps the replaced words of the expressions it has seen
+_WORD_CACHE = mathparse.WordReplacementCache(maxsize=10000)
+
+
+class InputRecordException(Exception):
+    """
+    Exception to be raised when an expression cannot be read from a line
+    of the input.
+    """
+    pass
+
+
+def read_text(lines):
+    """
+    Yield the line number and expression of each line that is not blank.
+    """
+    for number, line in enumerate(lines, start=1):
+        expression = line.strip()
+        if expression:
+            yield number, expression
+
+
+def read_csv(lines, column: str = 'expression'):
+    """
+    Yield the line number and the value in a column of each row of CSV,
+    after the header row. The column can be the name of a column in the
+    header or its index, counting from 0.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+
+    if header is None:
+        return
+
+    if column in header:
+        index = header.index(column)
+    elif column.isdigit():
+        index = int(column)
+    else:
+        raise InputRecordException(
+            'The CSV header does not have a column named {}'.format(column)
+        )
+
+    for row in reader:
+        if not row:
+            continue
+
+        if index < len(row):
+            yield reader.line_num, row[index]
+        else:
+            yield reader.line_num, InputRecordException(
+                'Row has no column {}'.format(column)
+            )
+
+
+def read_jsonl(lines, field: str = 'expression'):
+    """
+    Yield the line number and the value of a field of the JSON object on
+    each line that is not blank.
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, InputRecordException(
+                'Line is not valid JSON: {}'.format(e)
+            )
+            continue
+
+        if not isinstance(record, dict) or field not in record:
+            yield number, InputRecordException(
+                'Line has no field named {}'.format(field)
+            )
+        elif not isinstance(record[field], str):
+            yield number, InputRecordException(
+                'Field {} is not a string'.format(field)
+            )
+        else:
+            yield number, record[field]
+
+
+def to_json_value(result):
+    """
+    Convert a result to a value that can be written as JSON. Integers and
+    finite floats are written as numbers, and other results as strings.
+    """
+    if isinstance(result, float) and not math.isfinite(result):
+        return str(result)
+
+    if isinstance(result, (Decimal, Fraction)):
+        return str(result)
+
+    return result
+
+
+def evaluate_record(
+    source: str,
+    line: int,
+    expression,
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: mathparse.EvaluationLimits = None
+) -> str:
+    """
+    Evaluate the expression from a line of the input and return a line of
+    JSON with either its result or the error that it raised. The
+    expression may be an exception raised while reading it.
+    """
+    output = {'file': source, 'line': line, 'expression': None}
+
+    try:
+        if isinstance(expression, Exception):
+            raise expression
+
+        output['expression'] = expression
+        result = mathparse.parse(
+            expression, language, stopwords, limits, word_cache=_WORD_CACHE
+        )
+
+        # Integers with too many digits raise a ValueError when written
+        return json.dumps(
+            dict(output, result=to_json_value(result)), ensure_ascii=False
+        )
+    except Exception as e:
+        output['error'] = '{}: {}'.format(type(e).__name__, e)
+
+    return json.dumps(output, ensure_ascii=False)
+
+
+def evaluate_chunk(
+    records: list,
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: mathparse.EvaluationLimits = None
+) -> list:
+    """
+    Evaluate a list of (source, line, expression) records. This is defined
+    at the module level so that it can be sent to a process pool.
+    """
+    return [
+        evaluate_record(source, line, expression, language, stopwords, limits)
+        for source, line, expression in records
+    ]
+
+
+def evaluate_records(
+    records,
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: mathparse.EvaluationLimits = None,
+    jobs: int = 1,
+    chunk_size: int = 100
+):
+    """
+    Yield a line of JSON for each record, in the order of the records.
+
+    Records are evaluated in chunks of chunk_size. With more than one job,
+    the chunks are evaluated by a pool of processes, and at most two
+    chunks per process are read ahead of the output, so that input of any
+    length can be streamed.
+    """
+    chunks = iter(lambda: list(islice(records, chunk_size)), [])
+
+    if jobs == 1:
+        for chunk in chunks:
+            yield from evaluate_chunk(chunk, language, stopwords, limits)
+        return
+
+    with ProcessPoolExecutor(jobs) as executor:
+        pending = deque()
+
+        for chunk in chunks:
+            pending.append(executor.submit(
+                evaluate_chunk, chunk, language, stopwords, limits
+            ))
+
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def read_records(paths: list, input_format: str, column: str, field: str):
+    """
+    Yield a (source, line, expression) record for each expression in the
+    files, where a path of '-' is standard input.
+    """
+    for path in paths:
+        if path == '-':
+            lines = sys.stdin
+        else:
+            lines = open(path, encoding='utf-8', newline='')
+
+        try:
+            if input_format == 'csv':
+                expressions = read_csv(lines, column)
+            elif input_format == 'jsonl':
+                expressions = read_jsonl(lines, field)
+            else:
+                expressions = read_text(lines)
+
+            for line, expression in expressions:
+                yield path, line, expression
+        finally:
+            if lines is not sys.stdin:
+                lines.close()
+
+
+def positive_integer(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError('must be at least 1')
+    return number
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m mathparse',
+        description=(
+            'Evaluate one expression per line of the input and write a '
+            'line of JSON with the result or error of each.'
+        )
+    )
+    parser.add_argument(
+        'files', nargs='*', default=['-'],
+        help='files to read, or - for standard input (the default)'
+    )
+    parser.add_argument(
+        '--format', choices=FORMATS, default='text', dest='input_format',
+        help='the format of the input (default: text)'
+    )
+    parser.add_argument(
+        '--column', default='expression',
+        help='the name or index of the CSV column of expressions '
+             '(default: expression)'
+    )
+    parser.add_argument(
+        '--field', default='expression',
+        help='the JSONL field of expressions (default: expression)'
+    )
+    parser.add_argument(
+        '--language', choices=mathwords.LANGUAGE_CODES,
+        help='the ISO 639-2 code of the language of word-based expressions'
+    )
+    parser.add_argument(
+        '--stopwords', default='',
+        help='a comma separated list of words to ignore'
+    )
+    parser.add_argument(
+        '--jobs', type=positive_integer, default=1,
+        help='the number of processes that evaluate expressions (default: 1)'
+    )
+    parser.add_argument(
+        '--chunk-size', type=positive_integer, default=100,
+        help='the number of expressions sent to a process at a time '
+             '(default: 100)'
+    )
+    parser.add_argument(
+        '--no-limits', action='store_true',
+        help='evaluate expressions without the default EvaluationLimits'
+    )
+
+    return parser
+
+
+def main(arguments: list = None) -> int:
+    """
+    Run the command line interface and return its exit status. If the
+    first argument is 'serve', the evaluation server is run instead.
+    """
+    if arguments is None:
+        arguments = sys.argv[1:]
+
+    if arguments[:1] == ['serve']:
+        from . import server
+        return server.main(arguments[1:])
+
+    options = create_parser().parse_args(arguments)
+
+    stopwords = {
+        word.strip() for word in options.stopwords.split(',') if word.strip()
+    } or None
+
+    limits = None if options.no_limits else mathparse.EvaluationLimits()
+
+    records = read_records(
+        options.files, options.input_format, options.column, options.field
+    )
+
+    try:
+        for output in evaluate_records(
+            records,
+            options.language,
+            stopwords,
+            limits,
+            options.jobs,
+            options.chunk_size
+        ):
+            sys.stdout.write(output + '\n')
+    except (OSError, InputRecordException) as e:
+        sys.stdout.flush()
+        print('mathparse: {}'.format(e), file=sys.stderr)
+        return 1
+
+    return 0
@@ -1,11 +1,27 @@
 """
 Methods for evaluating mathematical equations in strings.
 """
-from decimal import Decimal
-from typing import Union
+from array import array
+from collections import OrderedDict, namedtuple
+from decimal import (
+    Decimal, Context, InvalidOperation, Overflow, getcontext, localcontext
+)
+from fractions import Fraction
+from typing import TYPE_CHECKING, Protocol, Union
 from . import mathwords
+import unicodedata
+import threading
+import importlib
+import weakref
+import json
+import math
+import sys
+import time
 import re
 
+if TYPE_CHECKING:
+    from .slow_queries import SlowQueryLog
+
 
 class PostfixTokenEvaluationException(Exception):
     """
@@ -14,6 +30,169 @@ class PostfixTokenEvaluationException(Exception):
     pass
 
 
+class CircularReferenceException(Exception):
+    """
+    Exception to be raised when named expressions in a Workbook would
+    depend on each other in a cycle.
+    """
+    pass
+
+
+class EvaluationLimitException(PostfixTokenEvaluationException):
+    """
+    Exception to be raised when an expression exceeds one of the limits
+    set by an instance of EvaluationLimits.
+    """
+    pass
+
+
+class EvaluationLimits:
+    """
+    Bounds on the amount of work that can be done to evaluate a single
+    expression. Setting any limit to None disables it.
+
+    Args:
+        max_length (int): Maximum number of characters in the input string.
+
+        max_tokens (int): Maximum number of tokens in the expression.
+
+        max_depth (int): Maximum nesting depth of parentheses.
+
+        max_result_bits (int): Maximum size in bits of any value produced
+            during evaluation. Exponentiation is checked using the predicted
+            size of its result before it is computed.
+
+        timeout (float): Maximum number of seconds that parsing and
+            evaluating an expression may take.
+
+    Examples:
+        >>> parse('10 ^ 10000000', limits=EvaluationLimits())
+        Traceback (most recent call last):
+        ...
+        EvaluationLimitException: ...
+    """
+
+    def __init__(
+        self,
+        max_length: int = 10000,
+        max_tokens: int = 1000,
+        max_depth: int = 100,
+        max_result_bits: int = 100000,
+        timeout: float = 1.0
+    ):
+        self.max_length = max_length
+        self.max_tokens = max_tokens
+        self.max_depth = max_depth
+        self.max_result_bits = max_result_bits
+        self.timeout = timeout
+
+    def check_length(self, string: str):
+        """
+        Raise an exception if the string is longer than allowed.
+        """
+        if self.max_length is not None and len(string) > self.max_length:
+            raise EvaluationLimitException(
+                'Expression length of {} exceeds the limit of {}'.format(
+                    len(string), self.max_length
+                )
+            )
+
+    def check_tokens(self, tokens: list):
+        """
+        Raise an exception if there are more tokens than allowed.
+        """
+        if self.max_tokens is not None and len(tokens) > self.max_tokens:
+            raise EvaluationLimitException(
+                'Expression token count of {} exceeds the limit of {}'.format(
+                    len(tokens), self.max_tokens
+                )
+            )
+
+    def check_depth(self, depth: int):
+        """
+        Raise an exception if the nesting depth is deeper than allowed.
+        """
+        if self.max_depth is not None and depth > self.max_depth:
+            raise EvaluationLimitException(
+                'Expression nesting depth of {} exceeds the limit of '
+                '{}'.format(depth, self.max_depth)
+            )
+
+    def check_power(self, base, exponent):
+        """
+        Raise an exception if raising the base to the exponent would
+        produce a value larger than allowed.
+        """
+        if self.max_result_bits is None:
+            return
+
+        try:
+            if isinstance(exponent, (Decimal, Fraction)):
+                exponent = float(exponent)
+            magnitude = abs(base)
+            if isinstance(base, Fraction):
+                # The numerator and denominator are both raised to the power
+                magnitude = max(magnitude.numerator, magnitude.denominator)
+                exponent = abs(exponent)
+            if magnitude == 0 or magnitude == 1:
+                return
+            bits = math.log2(magnitude) * exponent
+        except OverflowError:
+            bits = math.inf
+        except (TypeError, ValueError):
+            # Leave values that are not real numbers to the evaluator
+            return
+
+        if bits > self.max_result_bits:
+            raise EvaluationLimitException(
+                'Result of exponentiation exceeds the limit of {} bits'.format(
+                    self.max_result_bits
+                )
+            )
+
+    def power(self, base, exponent):
+        """
+        Raise the base to the exponent after checking the size of the
+        result. A result that is too large for its numeric type, such as
+        a float or Decimal that overflows, raises an exception.
+        """
+        self.check_power(base, exponent)
+
+        try:
+            return base ** exponent
+        except (OverflowError, Overflow):
+            raise EvaluationLimitException(
+                'Result of exponentiation is too large to represent'
+            )
+
+    def check_result(self, value):
+        """
+        Raise an exception if an integer value is larger than allowed.
+        """
+        if (
+            self.max_result_bits is not None and isinstance(value, int) and
+            value.bit_length() > self.max_result_bits
+        ):
+            raise EvaluationLimitException(
+                'Result size of {} bits exceeds the limit of {} bits'.format(
+                    value.bit_length(), self.max_result_bits
+                )
+            )
+
+    def check_time(self, started: float):
+        """
+        Raise an exception if more time has passed since the started
+        value of ``time.perf_counter()`` than allowed.
+        """
+        if self.timeout is not None:
+            elapsed = time.perf_counter() - started
+            if elapsed > self.timeout:
+                raise EvaluationLimitException(
+                    'Evaluation time of {:.3f}s exceeds the limit of '
+                    '{}s'.format(elapsed, self.timeout)
+                )
+
+
 def is_int(string: str) -> bool:
     """
     Return true if string is an integer.
@@ -81,12 +260,27 @@ def is_word(word: str, language: str) -> bool:
     return word in words
 
 
-def to_number(val) -> Union[int, float, str, Decimal]:
+def _to_int(string: str) -> int:
+    """
+    Convert a string of digits to an int, raising an exception for numbers
+    with more digits than Python will convert.
+    """
+    try:
+        return int(string)
+    except ValueError:
+        raise PostfixTokenEvaluationException(
+            'Number with {} digits is too long to evaluate'.format(
+                len(string.lstrip('-'))
+            )
+        )
+
+
+def to_number(val) -> Union[int, float, str, Decimal, Fraction]:
     """
     Convert a string to an int or float if possible.
     """
-    # If already a number (int, float, Decimal), return as-is
-    if isinstance(val, (int, float, Decimal)):
+    # If already a number (int, float, Decimal, Fraction), return as-is
+    if isinstance(val, (int, float, Decimal, Fraction)):
         return val
 
     # Check if it's a constant and convert
@@ -95,13 +289,58 @@ def to_number(val) -> Union[int, float, str, Decimal]:
 
     # Otherwise, try to convert string to number
     if is_int(val):
-        return int(val)
+        return _to_int(val)
     elif is_float(val):
         return float(val)
 
     return val
 
 
+def combine_decimal_point(a, b) -> Union[int, float, Decimal]:
+    """
+    Treat decimal points as a binary operator that combines the
+    integer and fractional part of two numbers.
+    Example: 53 . 25 = 53.25, -3 . 5 = -3.5
+    """
+    # Convert b to number
+    numeric_b = to_number(b)
+
+    if numeric_b == 0:
+        # Convert a to number
+        numeric_a = to_number(a)
+        return Decimal(numeric_a)
+
+    # Check if 'a' has a negative sign (handles -0 case)
+    is_negative = str(a).startswith('-')
+
+    # Convert a to number for calculation
+    numeric_a = to_number(a)
+
+    # Count the digits in the original string b to preserve
+    # leading zeros (e.g., "01" has 2 digits, not 1)
+    digits = len(str(b))
+    divisor = 10 ** digits
+    fractional_part = numeric_b / divisor
+
+    # Handle negatives: -3 . 5 = -3.5, not -2.5
+    # Also -0 . 5 = -0.5 (check string since -0 == 0)
+    try:
+        if is_negative:
+            return numeric_a - fractional_part
+        else:
+            return numeric_a + fractional_part
+    except OverflowError:
+        raise PostfixTokenEvaluationException(
+            'Number with {} digits is too long to evaluate'.format(
+                len(str(a).lstrip('-'))
+            )
+        )
+
+
+# Boundary characters for non-ASCII words: whitespace, operators, parentheses
+UNICODE_WORD_BOUNDARY = r'[\s+\-*/^()]'
+
+
 def create_unicode_word_boundary_pattern(word: str) -> str:
     """
     Create a regex pattern with Unicode-aware word boundaries.
@@ -123,7 +362,7 @@ def create_unicode_word_boundary_pattern(word: str) -> str:
         '(?:^|(?<=[\\s+\\-*/^()]))दो(?:$|(?=[\\s+\\-*/^()]))'
     """
     # Check if word contains only ASCII alphanumeric characters
-    if word.isascii() and word.replace('-', '').replace("'", '').isalnum():
+    if has_ascii_word_boundaries(word):
         # For ASCII words, use standard word boundaries
         return r'\b' + re.escape(word) + r'\b'
     else:
@@ -132,28 +371,287 @@ def create_unicode_word_boundary_pattern(word: str) -> str:
         # - At the start of string OR preceded by whitespace/operator
         # - At the end of string OR followed by whitespace/operator
         escaped_word = re.escape(word)
-        # Boundary characters: whitespace, operators, parentheses
-        boundary = r'[\s+\-*/^()]'
+        boundary = UNICODE_WORD_BOUNDARY
         return f'(?:^|(?<={boundary})){escaped_word}(?:$|(?={boundary}))'
 
 
+def has_ascii_word_boundaries(word: str) -> bool:
+    """
+    Return true if the standard regex \\b word boundaries can be used to
+    find the word, which is the case for ASCII words made of letters,
+    digits, hyphens and apostrophes.
+    """
+    return word.isascii() and word.replace('-', '').replace("'", '').isalnum()
+
+
+_WORD_GROUP_PATTERNS = {}
+
+
+def word_group_pattern(words: list) -> re.Pattern:
+    """
+    Return a compiled pattern that matches groups of numbers and words in
+    the format "3 thousand 6 hundred 2". Patterns are compiled once for
+    each list of words.
+
+    Each group starts with a number that is not preceded by another digit,
+    and every following number or word comes after whitespace. Because the
+    parts of a group can only be told apart in one way, the pattern never
+    has to try a different split of the same text, so the time taken is
+    proportional to the length of the string.
+    """
+    key = tuple(words)
+    pattern = _WORD_GROUP_PATTERNS.get(key)
+
+    if pattern is None:
+        # Longer words are matched first, such as 'hunderttausend'
+        # before 'hundert'
+        word_patterns = '|'.join(
+            create_unicode_word_boundary_pattern(word)
+            for word in sorted(words, key=len, reverse=True)
+        )
+        pattern = re.compile(
+            r'(?<!\d)\d+(?:\s+(?:\d+|' + word_patterns + r'))+'
+        )
+        _WORD_GROUP_PATTERNS[key] = pattern
+
+    return pattern
+
+
 def find_word_groups(string: str, words: list) -> list:
     """
     Find matches for words in the format "3 thousand 6 hundred 2".
     The words parameter should be the list of words to check for
     such as "hundred".
+
+    Examples:
+        >>> find_word_groups('3 thousand 6 hundred 2 apples', [
+        ...     'hundred', 'thousand'
+        ... ])
+        ['3 thousand 6 hundred 2']
     """
-    scale_pattern = '|'.join(words)
-    # For example:
-    # (?:(?:\d+)\s+(?:hundred|thousand)*\s*)+(?:\d+|hundred|thousand)+
-    regex = re.compile(
-        r'(?:(?:\d+)\s+(?:' +
-        scale_pattern +
-        r')*\s*)+(?:\d+|' +
-        scale_pattern + r')+'
-    )
-    result = regex.findall(string)
-    return result
+    return word_group_pattern(words).findall(string)
+
+
+_NUMBER_WORD_PATTERNS = {}
+
+
+def number_word_pattern(numbers: dict) -> re.Pattern:
+    """
+    Return a compiled pattern that matches any of the number words of a
+    language. Patterns are compiled once for each set of number words.
+
+    The words have the same Unicode-aware boundaries as
+    ``create_unicode_word_boundary_pattern()``, to prevent partial matches
+    such as "nine" in "nineteen", and longer words are matched first, such
+    as "dix-sept" before "dix". Words that use the same boundaries share
+    them, so each position in a string is only checked once for each kind
+    of boundary.
+    """
+    key = tuple(sorted(numbers))
+    pattern = _NUMBER_WORD_PATTERNS.get(key)
+
+    if pattern is None:
+        ascii_words = []
+        unicode_words = []
+
+        for number in sorted(numbers, key=len, reverse=True):
+            if has_ascii_word_boundaries(number):
+                ascii_words.append(re.escape(number))
+            else:
+                unicode_words.append(re.escape(number))
+
+        # Words with Unicode boundaries are matched first, as they can
+        # start with an ASCII word, such as 'on üç' with 'on', but an
+        # ASCII word can never start with one of them
+        alternatives = []
+        boundary = UNICODE_WORD_BOUNDARY
+
+        if unicode_words:
+            alternatives.append('(?:^|(?<={})){}(?:$|(?={}))'.format(
+                boundary, '(?:' + '|'.join(unicode_words) + ')', boundary
+            ))
+
+        if ascii_words:
+            alternatives.append(r'\b(?:' + '|'.join(ascii_words) + r')\b')
+
+        pattern = re.compile('|'.join(alternatives))
+        _NUMBER_WORD_PATTERNS[key] = pattern
+
+    return pattern
+
+
+_NUMBER_PHRASE_PATTERNS = {}
+
+
+def _phrase_number(text: str) -> Union[int, Fraction, None]:
+    """
+    Return the value of an integer, a decimal number such as '2 . 5' or a
+    '(20 + 1)' compound number in a number phrase, or None if it has too
+    many digits to be converted.
+    """
+    try:
+        if text.startswith('('):
+            tens, units = text[1:-1].split(' + ')
+            return int(tens) + int(units)
+        if '.' in text:
+            whole, digits = (part.strip() for part in text.split('.'))
+            return Fraction(int(whole + digits), 10 ** len(digits))
+        return int(text)
+    except ValueError:
+        return None
+
+
+def _phrase_value(text: str, value: Union[int, Fraction]) -> str:
+    """
+    Return the digits of the value of a number phrase, or the text of the
+    phrase if the value has too many digits to be converted to a string.
+    """
+    try:
+        if isinstance(value, Fraction):
+            if value.denominator == 1:
+                return str(value.numerator)
+
+            # The denominator divides a power of ten, so the quotient has
+            # a finite number of digits that fits within this precision
+            with localcontext() as context:
+                context.prec = len(str(value.numerator)) + 4 * len(
+                    str(value.denominator)
+                )
+                return '{:f}'.format(
+                    Decimal(value.numerator) / value.denominator
+                )
+
+        return str(value)
+    except ValueError:
+        return text
+
+
+def number_phrase_pattern(scales: dict) -> re.Pattern:
+    """
+    Return a compiled pattern that matches the parts of number phrases:
+    an integer, a decimal number such as '2 . 5', a compound number such
+    as '(20 + 1)', or one of the scale words. Patterns are compiled once
+    for each set of scale words.
+
+    Integers that follow a decimal point are not matched on their own, so
+    that a phrase does not start with the digits after a decimal point.
+    """
+    key = tuple(sorted(scales))
+    pattern = _NUMBER_PHRASE_PATTERNS.get(key)
+
+    if pattern is None:
+        # Longer scale words are matched first, such as 'hunderttausend'
+        # before 'hundert'
+        scale_patterns = '|'.join(
+            create_unicode_word_boundary_pattern(scale)
+            for scale in sorted(scales, key=len, reverse=True)
+        )
+        pattern = re.compile(
+            r'(?<![\w.])(?<!\.\s)(\d+(?:\s?\.\s?\d+)?)(?![\w.])|'
+            r'\((\d+) \+ (\d+)\)|(' +
+            scale_patterns + ')'
+        )
+        _NUMBER_PHRASE_PATTERNS[key] = pattern
+
+    return pattern
+
+
+def replace_number_phrases(string: str, scales: dict) -> str:
+    """
+    Replace each phrase of numbers and scale words, such as
+    '3 thousand 6 hundred 2' or '5 million 200 thousand', with the
+    integer that it represents, such as '3602' or '5200000'.
+
+    The parts of a phrase are separated by whitespace. Besides integers,
+    a phrase can contain the compound numbers that ``replace_word_tokens()``
+    creates for words such as 'twenty one', which are written as
+    '(20 + 1)', and decimal numbers such as '2 . 5', so that
+    '2 . 5 thousand' is replaced with '2500'. Numbers that are not followed
+    or preceded by a scale word are left unchanged.
+
+    The string is scanned once, so the time taken is proportional to its
+    length.
+
+    Args:
+        string (str): A string where number words have been replaced with
+            digits.
+
+        scales (dict): The scale words of the language, and their values.
+
+    Examples:
+        >>> replace_number_phrases('3 thousand 6 hundred 2', {
+        ...     'hundred': 100, 'thousand': 1000
+        ... })
+        '3602'
+    """
+    pieces = []
+    copied = 0
+
+    # The start and end of the current phrase, its value so far and
+    # whether the last part was a scale word. Values below a scale of
+    # 1000 multiply the current group, such as '6 hundred 2', and larger
+    # scales add the group to the total.
+    start = end = None
+    total = current = 0
+    after_scale = has_scale = False
+
+    for match in number_phrase_pattern(scales).finditer(string):
+        scale = match.group(4)
+        adjacent = start is not None and not string[end:match.start()].strip()
+
+        if scale is not None:
+            if adjacent and current is None:
+                # Numbers are only converted when a scale word follows them,
+                # and numbers with too many digits to convert end the phrase
+                current = _phrase_number(string[start:end])
+                adjacent = current is not None
+
+            if adjacent:
+                value = scales[scale]
+                if after_scale and not current:
+                    total *= value
+                elif value < 1000:
+                    current *= value
+                else:
+                    total += current * value
+                    current = 0
+                after_scale = has_scale = True
+                end = match.end()
+                continue
+        elif adjacent and after_scale:
+            number = _phrase_number(match.group())
+
+            if number is not None:
+                current += number
+                after_scale = False
+                end = match.end()
+                continue
+
+        if has_scale:
+            pieces.append(string[copied:start])
+            pieces.append(_phrase_value(string[start:end], total + current))
+            copied = end
+            has_scale = False
+
+        if scale is not None:
+            # A scale word without a number before it is left unchanged
+            start = None
+            continue
+
+        start = match.start()
+        end = match.end()
+        total = 0
+        current = None
+        after_scale = False
+
+    if has_scale:
+        pieces.append(string[copied:start])
+        pieces.append(_phrase_value(string[start:end], total + current))
+        copied = end
+
+    pieces.append(string[copied:])
+
+    return ''.join(pieces)
 
 
 def replace_word_tokens_simplified_chinese(
@@ -214,53 +712,66 @@ def replace_word_tokens_simplified_chinese(
     digits_scales.update(words['scales'])
 
     # 九千八百万九千八百——> 98009800
-    def chinese_string_to_num(str):
-        if str == '':
-            return 0
-
-        if str in digits:
-            return digits_scales[str]
-
-        digits_scales.update(words['scales'])
-
-        for scale in scales:
-            index = str.find(scale)
-            if index >= 0:
-                t1 = chinese_string_to_num(str[:index])
-                t2 = digits_scales[scale]
-                t3 = chinese_string_to_num(str[index + 1:])
-                return t1 * t2 + t3
-        else:
-            return digits_scales[str]
+    def chinese_string_to_num(text):
+        # The value is the part before the first of the largest scale
+        # times the scale, plus the value of the rest. The rest can only
+        # contain the same or smaller scales, so the scales are searched
+        # once each from largest to smallest, keeping the recursion
+        # shallow and the time linear
+        total = position = scale_index = 0
+
+        while True:
+            rest = text[position:] if len(text) - position <= 2 else None
+
+            if rest == '':
+                return total
+
+            if rest in digits:
+                return total + digits_scales[rest]
+
+            while scale_index < len(scales):
+                index = text.find(scales[scale_index], position)
+                if index >= 0:
+                    break
+                scale_index += 1
+            else:
+                # A run of digits without scales, such as 一九八四
+                return total + int(''.join(
+                    str(digits_scales[char]) for char in text[position:]
+                ))
+
+            scale = scales[scale_index]
+            total += chinese_string_to_num(
+                text[position:index]
+            ) * digits_scales[scale]
+            position = index + 1
+
+    def replace_number(text):
+        try:
+            return str(chinese_string_to_num(text)) + ' '
+        except ValueError:
+            # Numbers with too many digits to convert are left unchanged
+            return text
 
     # 扫描看有没有汉字数字，有转化为阿拉伯数字
-    index = 0
-    start = end = 0
-    while True:
-        char = string[index]
+    pieces = []
+    start = None
 
+    for index, char in enumerate(string):
         if char in digits_scales:
-            end += 1
-            index += 1
+            if start is None:
+                start = index
         else:
-            if start < end:
-                num = str(chinese_string_to_num(string[start:end]))
+            if start is not None:
                 # 需要加多一个分隔符
-                num_str = str(num) + ' '
-                string = string[:start] + num_str + string[end:]
-                index = start + len(num_str)
-                start = end = index
-            else:
-                index += 1
-                start = end = index
+                pieces.append(replace_number(string[start:index]))
+                start = None
+            pieces.append(char)
 
-        if index >= len(string):
-            if start < end:
-                num = str(chinese_string_to_num(string[start:end]))
-                num_str = str(num) + ' '
-                string = string[:start] + num_str + string[end:]
+    if start is not None:
+        pieces.append(replace_number(string[start:]))
 
-            break
+    string = ''.join(pieces)
 
     return string
 
@@ -322,10 +833,11 @@ def replace_word_tokens(
         )
         for operator in sorted_postfix_operators:
             if operator in string:
-                # Captures the number/operand before the unary operator
-                pattern = r'(\w+)\s+' + re.escape(operator)
-                replacement = r'(\1 ' + postfix_unary_operators[operator] + ')'
-                string = re.sub(pattern, replacement, string)
+                # The operator is applied to the value or group before it
+                # by preprocess_unary_operators()
+                string = string.replace(
+                    operator, postfix_unary_operators[operator]
+                )
 
     # Handle compound numbers:
     # (e.g., "twenty one" -> "(20 + 1)", "fifty four" -> "(50 + 4)")
@@ -358,14 +870,10 @@ def replace_word_tokens(
             if re.search(compound_pattern, string):
                 string = re.sub(compound_pattern, compound_replacement, string)
 
-    # Replace number words with numeric values
-    for number in frozenset(numbers.keys()):
-        # Use Unicode-aware word boundaries to prevent partial matches
-        # (e.g., "nine" in "nineteen") and support non-ASCII scripts
-        # (e.g., Devanagari, Arabic, Hebrew, Chinese, etc.)
-        pattern = create_unicode_word_boundary_pattern(number)
-        if re.search(pattern, string):
-            string = re.sub(pattern, str(numbers[number]), string)
+    # Replace number words with numeric values in a single pass
+    string = number_word_pattern(numbers).sub(
+        lambda match: str(numbers[match.group()]), string
+    )
 
     # Remove words specified to be ignored
     if stopwords:
@@ -376,54 +884,148 @@ def replace_word_tokens(
                 filtered_words.append(word)
         string = ' '.join(filtered_words)
 
-    # Replace scaling multipliers with numeric values
-    scales = words['scales']
-    end_index_characters = mathwords.BINARY_OPERATORS | {'('}
+    # Replace phrases such as "3 thousand 6 hundred 2" with one number
+    string = replace_number_phrases(string, words['scales'])
 
-    word_matches = find_word_groups(string, frozenset(scales.keys()))
+    return string
 
-    for match in word_matches:
-        string = string.replace(match, '(' + match + ')')
 
-    for scale in frozenset(scales.keys()):
-        for _ in range(0, string.count(scale)):
-            start_index = string.find(scale) - 1
-            end_index = len(string)
+def replace_words(
+    string: str, language: str, stopwords: set[str] = None
+) -> str:
+    """
+    Replace word-based mathematical terms with their symbolic equivalents,
+    using ``replace_word_tokens_simplified_chinese()`` for Chinese and
+    ``replace_word_tokens()`` for every other language.
 
-            while is_int(string[start_index - 1]) and start_index > 0:
-                start_index -= 1
+    Runs of whitespace are replaced with a single space first, so that
+    phrasings that only differ in their spacing give the same result.
 
-            end_index = string.find(' ', start_index) + 1
-            end_index = string.find(' ', end_index) + 1
+    Examples:
+        >>> replace_words('five  plus\tthree', 'ENG')
+        '5 + 3'
+    """
+    string = ' '.join(string.split())
 
-            add = ' + '
-            if string[end_index] in end_index_characters:
-                add = ''
+    if language == 'CHI':
+        return replace_word_tokens_simplified_chinese(string, stopwords)
 
-            string = string[:start_index] + '(' + string[start_index:]
-            string = string.replace(
-                scale, '* ' + str(scales[scale]) + ')' + add,
-                1
-            )
+    return replace_word_tokens(string, language, stopwords)
 
-    string = string.replace(') (', ') + (')
 
-    # Remove extra parentheses around all scale expressions to simplify output
-    # Convert ((number * scale)) to (number * scale) for all scales
-    string = re.sub(r'\(\((\d+\s*\*\s*\d+)\)\)', r'(\1)', string)
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize']
+)
 
-    return string
+
+class WordReplacementCache:
+    """
+    A bounded cache of the output of ``replace_words()``, which is the
+    first stage of parsing expressions that contain words. The same
+    phrasing, such as "what is twenty five times four", often recurs in
+    different expressions, so caching this stage separately avoids
+    repeating the word replacement.
+
+    Entries are keyed by the string with its whitespace normalized, the
+    language and the stopwords. When the cache is full, the least recently
+    used entry is removed. A cache can be shared between threads.
+
+    Args:
+        maxsize (int): The maximum number of entries.
+
+    Examples:
+        >>> cache = WordReplacementCache(maxsize=1000)
+        >>> parse('five plus three', language='ENG', word_cache=cache)
+        8
+        >>> parse('five  plus three', language='ENG', word_cache=cache)
+        8
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=1, evictions=0, maxsize=1000, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError('The maximum size must be at least 1')
+
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def replace_words(
+        self, string: str, language: str, stopwords: set[str] = None
+    ) -> str:
+        """
+        Return the result of ``replace_words()`` for the arguments, from
+        the cache if possible.
+        """
+        string = ' '.join(string.split())
+        key = (string, language, frozenset(stopwords) if stopwords else None)
+
+        with self._lock:
+            result = self._entries.get(key)
+
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result
+
+        result = replace_words(string, language, stopwords)
+
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = result
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the number of hits, misses and evictions, and the maximum
+        and current number of entries.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries)
+            )
+
+    def clear(self):
+        """
+        Remove every entry and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 def preprocess_unary_operators(tokens: list) -> list:
     """
-    Preprocess tokens to convert unary minus to the 'neg' function.
+    Preprocess tokens to convert unary minus to the 'neg' function, and
+    postfix operators such as '²' to exponentiation.
 
     A minus sign is considered unary (negative) if it appears:
     * At the beginning of the expression
     * After an opening parenthesis '('
     * After a binary operator `(+, -, *, /, ^)`
     * After a unary function `(sqrt, log, neg)`
+
+    A postfix operator is applied to the number, constant or parenthesized
+    group before it, before any other operator. For example, the tokens
+    of '2 * (1 + 2) ²' become '2 * ( ( 1 + 2 ) ^ 2 )'. The sign of a
+    negative number is applied after the postfix operator, so '-2 ²' is
+    -4, the same as '- 2 ²'.
     """
     if not tokens:
         return tokens
@@ -433,7 +1035,33 @@ def preprocess_unary_operators(tokens: list) -> list:
     # A following minus sign should be treated as unary (negative)
     unary_contexts = mathwords.BINARY_OPERATORS | {'('}
 
+    # The positions where the last value and each open group started.
+    # Postfix operators add an opening parenthesis at the start of their
+    # value, which is inserted once every token has been processed.
+    operand_start = None
+    group_starts = []
+    wrapped = {}
+    negated = set()
+
     for i, token in enumerate(tokens):
+        if token in mathwords.POSTFIX_OPERATORS:
+            if operand_start is None:
+                raise PostfixTokenEvaluationException(
+                    'Expected a value before "{}"'.format(token)
+                )
+
+            operand = processed_tokens[operand_start]
+            if operand.startswith('-') and operand != '-':
+                # The sign of a negative number is applied to the result
+                processed_tokens[operand_start] = operand[1:]
+                negated.add(operand_start)
+
+            wrapped[operand_start] = wrapped.get(operand_start, 0) + 1
+            processed_tokens.extend([
+                '^', str(mathwords.POSTFIX_OPERATORS[token]), ')'
+            ])
+            continue
+
         if token == '-':
             # Check if this minus should be treated as unary
             is_unary_minus = False
@@ -450,40 +1078,68 @@ def preprocess_unary_operators(tokens: list) -> list:
 
             if is_unary_minus:
                 # Convert the unary minus to 'neg' function
-                processed_tokens.append('neg')
-            else:
-                # Keep as binary minus
-                processed_tokens.append(token)
-        else:
-            processed_tokens.append(token)
+                token = 'neg'
+
+        if token == '(':
+            group_starts.append(len(processed_tokens))
+            operand_start = None
+        elif token == ')':
+            operand_start = group_starts.pop() if group_starts else None
+        elif token == '.':
+            # The decimal point joins the values on either side of it
+            pass
+        elif token in mathwords.BINARY_OPERATORS or is_unary(token):
+            operand_start = None
+        elif operand_start is None or processed_tokens[-1] != '.':
+            operand_start = len(processed_tokens)
+
+        processed_tokens.append(token)
+
+    if wrapped:
+        wrapped_tokens = []
+        for index, token in enumerate(processed_tokens):
+            if index in negated:
+                wrapped_tokens.append('neg')
+            wrapped_tokens.extend(['('] * wrapped.get(index, 0))
+            wrapped_tokens.append(token)
+        processed_tokens = wrapped_tokens
 
     return processed_tokens
 
 
-def to_postfix(tokens: list) -> list:
+OPERATOR_PRECEDENCE = {
+    '.': 5,
+    '/': 4,
+    '*': 4,
+    '+': 3,
+    '-': 3,
+    '^': 2,
+    '(': 1
+}
+
+# Unary functions have a higher precedence than binary operators
+UNARY_PRECEDENCE = max(OPERATOR_PRECEDENCE.values()) + 1
+
+
+def to_postfix(tokens: list, limits: EvaluationLimits = None) -> list:
     """
     Convert a list of evaluatable tokens to postfix format.
-    """
-    precedence = {
-        '.': 5,
-        '/': 4,
-        '*': 4,
-        '+': 3,
-        '-': 3,
-        '^': 2,
-        '(': 1
-    }
 
-    # Unary functions have a higher precedence than binary operators
-    unary_precedence = max(precedence.values()) + 1
+    If limits are provided, an EvaluationLimitException is raised when
+    parentheses are nested deeper than allowed.
+    """
+    precedence = OPERATOR_PRECEDENCE
+    unary_precedence = UNARY_PRECEDENCE
 
     postfix = []
     opstack = []
+    depth = 0
 
     for token in tokens:
-        if is_int(token):
+        if not isinstance(token, str):
+            # Numbers that were converted when the expression was scanned
             postfix.append(token)
-        elif is_float(token):
+        elif is_int(token):
             postfix.append(token)
         elif token in mathwords.CONSTANTS:
             postfix.append(token)
@@ -491,7 +1147,11 @@ def to_postfix(tokens: list) -> list:
             opstack.append(token)
         elif token == '(':
             opstack.append(token)
+            depth += 1
+            if limits:
+                limits.check_depth(depth)
         elif token == ')':
+            depth -= 1
             top_token = opstack.pop()
             while top_token != '(':
                 postfix.append(top_token)
@@ -506,13 +1166,17 @@ def to_postfix(tokens: list) -> list:
                     )
                 ) or
                 (
-                    is_unary(
+                    # The decimal point joins the parts of a single number,
+                    # so it is applied before any unary function
+                    token != '.' and is_unary(
                         opstack[-1]
                     ) and unary_precedence >= precedence[token]
                 )
             ):
                 postfix.append(opstack.pop())
             opstack.append(token)
+        elif is_float(token):
+            postfix.append(token)
         else:
             # Raise exception for unsupported mathematical terms
             raise PostfixTokenEvaluationException(
@@ -525,149 +1189,1295 @@ def to_postfix(tokens: list) -> list:
     return postfix
 
 
-def evaluate_postfix(tokens: list) -> Union[int, float, str, Decimal]:
+class ExpressionNode:
     """
-    Given a list of evaluatable tokens in postfix format,
-    calculate a solution.
+    Base class for the nodes of an expression tree.
+
+    Nodes are immutable and interned, so building a node that is equal to
+    an existing one returns the existing node. Identical subexpressions
+    are therefore shared between trees, and two trees are equal exactly
+    when they are the same object, which makes them cheap to hash and to
+    use as dictionary keys.
     """
-    stack = []
 
-    for token in tokens:
-        total = None
+    __slots__ = ('__weakref__',)
 
-        if is_int(token) or is_float(token) or is_constant(token):
-            stack.append(token)
-        elif is_unary(token):
-            a = stack.pop()
-            # Convert token (string) to number for unary function evaluation
-            a = to_number(a)
-            total = mathwords.UNARY_FUNCTIONS[token](a)
-        elif len(stack) == 1:
-            raise PostfixTokenEvaluationException(
-                'Insufficient values in expression for operator "{}"'.format(
-                    token
-                )
-            )
-        elif len(stack) > 1:
-            b = stack.pop()
-            a = stack.pop()
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            '{} objects are immutable'.format(type(self).__name__)
+        )
 
-            if token == '+':
-                total = to_number(a) + to_number(b)
-            elif token == '-':
-                total = to_number(a) - to_number(b)
-            elif token == '*':
-                total = to_number(a) * to_number(b)
-            elif token == '^':
-                total = to_number(a) ** to_number(b)
-            elif token == '/':
-                if Decimal(str(b)) == 0:
-                    total = 'undefined'
-                else:
-                    total = Decimal(str(a)) / Decimal(str(b))
-            elif token == '.':
-                # Treat decimal points as a binary operator that combines the
-                # integer and fractional part of two numbers
-                # Example: 53 . 25 = 53.25, -3 . 5 = -3.5
-
-                # Convert b to number
-                numeric_b = to_number(b)
-
-                if numeric_b == 0:
-                    # Convert a to number
-                    numeric_a = to_number(a)
-                    total = Decimal(numeric_a)
-                else:
-                    # Check if 'a' has a negative sign (handles -0 case)
-                    is_negative = str(a).startswith('-')
-
-                    # Convert a to number for calculation
-                    numeric_a = to_number(a)
-
-                    # Count the digits in the original string b to preserve
-                    # leading zeros (e.g., "01" has 2 digits, not 1)
-                    digits = len(str(b))
-                    divisor = 10 ** digits
-                    fractional_part = numeric_b / divisor
-
-                    # Handle negatives: -3 . 5 = -3.5, not -2.5
-                    # Also -0 . 5 = -0.5 (check string since -0 == 0)
-                    if is_negative:
-                        total = numeric_a - fractional_part
-                    else:
-                        total = numeric_a + fractional_part
+    def __reduce__(self):
+        return (type(self), self._fields())
+
+    def __repr__(self):
+        return '<{} {}>'.format(type(self).__name__, ' '.join(
+            str(token) for token in self.to_postfix()
+        ))
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_postfix(self) -> list:
+        """
+        Return the tokens of the expression in postfix format, which can
+        be evaluated by ``evaluate_postfix()``.
+        """
+        # Visit each node before its children, right to left, then reverse
+        # the result, which avoids recursing through deeply nested trees
+        postfix = []
+        nodes = [self]
+
+        while nodes:
+            node = nodes.pop()
+
+            if isinstance(node, Operand):
+                postfix.append(node.value)
+            elif isinstance(node, UnaryOperation):
+                postfix.append(node.operator)
+                nodes.append(node.operand)
             else:
-                raise PostfixTokenEvaluationException(
-                    'Unknown token "{}"'.format(token)
-                )
-
-        if total is not None:
-            stack.append(total)
-
-    # If the stack is empty the tokens could not be evaluated
-    if not stack:
-        raise PostfixTokenEvaluationException(
-            'The postfix expression resulted in an empty stack'
-        )
+                postfix.append(node.operator)
+                nodes.append(node.left)
+                nodes.append(node.right)
 
-    result = stack.pop()
+        postfix.reverse()
+        return postfix
 
-    # Convert final result from string to number if needed
-    if isinstance(result, str):
-        if is_int(result):
-            result = int(result)
-        elif is_float(result):
-            result = float(result)
 
-    return result
+_INTERNED_NODES = weakref.WeakValueDictionary()
+_INTERNED_NODES_LOCK = threading.Lock()
 
 
-def tokenize(string: str, language: str = None, escape: str = '___') -> list:
+def _intern_node(cls, key: tuple, fields: tuple) -> ExpressionNode:
     """
-    Convert a string into a list of mathematical tokens for processing.
+    Return the interned node for the key, creating it from the fields if
+    it does not exist yet.
+    """
+    with _INTERNED_NODES_LOCK:
+        node = _INTERNED_NODES.get(key)
 
-    Args:
-        string (str): The input string containing a mathematical expression.
+        if node is None:
+            node = object.__new__(cls)
+            for name, value in zip(cls.__slots__, fields):
+                object.__setattr__(node, name, value)
+            _INTERNED_NODES[key] = node
 
-        language (str, optional): ISO 639-2 language code for word-based
-            parsing. If None, only numeric expressions
-            are supported.
+    return node
 
-        escape (str, optional): A string used to temporarily replace spaces
-            in multi-word phrases during tokenization.
-            Default is '___'.
 
-    Returns:
-        list: A list of tokens extracted from the input string.
+class Operand(ExpressionNode):
+    """
+    A number or constant in an expression tree.
     """
-    # Set all words to lowercase
-    string = string.lower()
-
-    # Ignore punctuation
-    if len(string) and not string[-1].isalnum():
-        character = string[-1]
-        string = string[:-1] + ' ' + character
 
-    # If language is specified, normalize compound operators by removing
-    # spaces between their characters. This handles cases like '乘 以'
-    # which should be treated as the single compound operator '乘以'.
-    # Process by length (longest first) to avoid partial matches.
-    if language:
-        words = mathwords.words_for_language(language)
+    __slots__ = ('value',)
 
-        # Sort all phrases by length (longest first) to handle cases where
-        # a shorter phrase is a substring of a longer one
-        phrases_by_length = sorted(words, key=len, reverse=True)
+    def __new__(cls, value):
+        # The type and text are part of the key so that values which
+        # compare equal, such as 1 and 1.0 or 0 and -0, are kept apart
+        text = value if isinstance(value, (int, str)) else str(value)
+        return _intern_node(cls, (cls, type(value), text), (value, ))
 
-        for phrase in phrases_by_length:
-            # For multi-character phrases, create a spaced version
-            # and replace it with the non-spaced version
-            if len(phrase) > 1:
-                # Create pattern with optional spaces between each character
-                # For example, '乘以' could appear as '乘 以' or '乘  以'
-                spaced_phrase = ' '.join(phrase)
-                # Replace spaced version with non-spaced version
-                string = string.replace(spaced_phrase, phrase)
+
+class UnaryOperation(ExpressionNode):
+    """
+    A unary function, such as sqrt, applied to an operand.
+    """
+
+    __slots__ = ('operator', 'operand')
+
+    def __new__(cls, operator: str, operand: ExpressionNode):
+        return _intern_node(
+            cls, (cls, operator, operand), (operator, operand)
+        )
+
+
+class BinaryOperation(ExpressionNode):
+    """
+    A binary operator applied to a left and a right operand.
+    """
+
+    __slots__ = ('operator', 'left', 'right')
+
+    def __new__(cls, operator: str, left: ExpressionNode,
+                right: ExpressionNode):
+        return _intern_node(
+            cls, (cls, operator, left, right), (operator, left, right)
+        )
+
+
+def to_tree(tokens: list, limits: EvaluationLimits = None) -> ExpressionNode:
+    """
+    Convert a list of evaluatable tokens to an expression tree.
+
+    The tree is built by precedence climbing, using the same operator
+    precedence as ``to_postfix()``, so converting the tree back to postfix
+    gives the same tokens for any well formed expression. A
+    PostfixTokenEvaluationException is raised for malformed expressions.
+
+    If limits are provided, an EvaluationLimitException is raised when
+    parentheses are nested deeper than allowed.
+    """
+    precedence = OPERATOR_PRECEDENCE
+    position = 0
+    depth = 0
+
+    def parse_operand() -> ExpressionNode:
+        nonlocal position, depth
+
+        if position == len(tokens):
+            raise PostfixTokenEvaluationException(
+                'Expected a value at the end of the expression'
+            )
+
+        token = tokens[position]
+        position += 1
+
+        if not isinstance(token, str):
+            # Numbers that were converted when the expression was scanned
+            return Operand(token)
+        elif is_unary(token):
+            # A unary function applies to the next value, including its
+            # decimal point, before any other binary operator
+            return UnaryOperation(token, parse_expression(precedence['.']))
+        elif token == '(':
+            depth += 1
+            if limits:
+                limits.check_depth(depth)
+
+            node = parse_expression(0)
+
+            if position == len(tokens) or tokens[position] != ')':
+                raise PostfixTokenEvaluationException(
+                    'Missing closing parenthesis in expression'
+                )
+
+            position += 1
+            depth -= 1
+            return node
+        elif token == ')' or is_binary(token):
+            raise PostfixTokenEvaluationException(
+                'Expected a value but found "{}"'.format(token)
+            )
+        elif is_int(token) or is_float(token) or is_constant(token):
+            return Operand(token)
+
+        raise PostfixTokenEvaluationException(
+            'Unsupported mathematical term: "{}"'.format(token)
+        )
+
+    def parse_expression(minimum_precedence: int) -> ExpressionNode:
+        nonlocal position
+
+        node = parse_operand()
+
+        while position < len(tokens):
+            token = tokens[position]
+
+            if not isinstance(token, str) or not is_binary(token) or (
+                precedence[token] < minimum_precedence
+            ):
+                break
+
+            position += 1
+
+            # Operators are left associative, so the right operand only
+            # includes operators that have a higher precedence
+            node = BinaryOperation(
+                token, node, parse_expression(precedence[token] + 1)
+            )
+
+        return node
+
+    try:
+        tree = parse_expression(0)
+    except RecursionError:
+        raise PostfixTokenEvaluationException(
+            'The expression is nested too deeply to be converted to a tree'
+        )
+
+    if position < len(tokens):
+        token = tokens[position]
+
+        if isinstance(token, str) and not is_symbol(token):
+            raise PostfixTokenEvaluationException(
+                'Unsupported mathematical term: "{}"'.format(token)
+            )
+
+        raise PostfixTokenEvaluationException(
+            'Unexpected term in expression: "{}"'.format(token)
+        )
+
+    return tree
+
+
+def apply_binary_operator(
+    token: str, a, b, limits: EvaluationLimits = None
+) -> Union[int, float, str, Decimal]:
+    """
+    Calculate the result of a binary operator for two operands, which may
+    be numbers or the strings of numbers and constants.
+    """
+    if token == '+':
+        return to_number(a) + to_number(b)
+    elif token == '-':
+        return to_number(a) - to_number(b)
+    elif token == '*':
+        return to_number(a) * to_number(b)
+    elif token == '^':
+        a = to_number(a)
+        b = to_number(b)
+        if limits:
+            return limits.power(a, b)
+        return a ** b
+    elif token == '/':
+        if Decimal(str(b)) == 0:
+            return 'undefined'
+        else:
+            return Decimal(str(a)) / Decimal(str(b))
+    elif token == '.':
+        return combine_decimal_point(a, b)
+    else:
+        raise PostfixTokenEvaluationException(
+            'Unknown token "{}"'.format(token)
+        )
+
+
+def evaluate_postfix(
+    tokens: Union[list, ExpressionNode],
+    limits: EvaluationLimits = None,
+    started: float = None,
+    numeric_mode: str = None,
+    decimal_context: Context = None
+) -> Union[int, float, str, Decimal, Fraction]:
+    """
+    Given a list of evaluatable tokens in postfix format,
+    calculate a solution.
+
+    If limits are provided, an EvaluationLimitException is raised as soon
+    as evaluation exceeds them. The started argument is the value of
+    ``time.perf_counter()`` that the time limit is measured from, and
+    defaults to the time that evaluation begins.
+
+    If a numeric_mode from NUMERIC_MODES is provided, every value is
+    calculated using that numeric type. Otherwise integers, floats and
+    decimals are mixed, with division always producing a Decimal.
+
+    An expression tree from ``to_tree()``, or any other iterable of postfix
+    tokens such as Bytecode, can be evaluated in place of a list.
+    """
+    if isinstance(tokens, ExpressionNode):
+        tokens = tokens.to_postfix()
+
+    if numeric_mode:
+        return _evaluate_numeric(
+            tokens, numeric_mode, limits, started, decimal_context
+        )
+
+    stack = []
+
+    if limits and started is None:
+        started = time.perf_counter()
+
+    for token in tokens:
+        total = None
+
+        if limits:
+            limits.check_time(started)
+
+        if not isinstance(token, str):
+            # Numbers that were converted when the expression was scanned
+            stack.append(token)
+        elif is_unary(token):
+            if not stack:
+                raise PostfixTokenEvaluationException(
+                    'Insufficient values in expression for operator '
+                    '"{}"'.format(token)
+                )
+            a = stack.pop()
+            # Convert token (string) to number for unary function evaluation
+            a = to_number(a)
+            total = mathwords.UNARY_FUNCTIONS[token](a)
+        elif token not in mathwords.BINARY_OPERATORS and (
+            is_int(token) or is_float(token) or is_constant(token)
+        ):
+            stack.append(token)
+        elif len(stack) == 1:
+            raise PostfixTokenEvaluationException(
+                'Insufficient values in expression for operator "{}"'.format(
+                    token
+                )
+            )
+        elif len(stack) > 1:
+            b = stack.pop()
+            a = stack.pop()
+
+            total = apply_binary_operator(token, a, b, limits)
+
+        if total is not None:
+            if limits:
+                limits.check_result(total)
+            stack.append(total)
+
+    # If the stack is empty the tokens could not be evaluated
+    if not stack:
+        raise PostfixTokenEvaluationException(
+            'The postfix expression resulted in an empty stack'
+        )
+
+    result = stack.pop()
+
+    # Convert final result from string to number if needed
+    if isinstance(result, str):
+        if is_int(result):
+            result = int(result)
+        elif is_float(result):
+            result = float(result)
+
+    return result
+
+
+# The operators of programs that can be evaluated with int arithmetic
+INTEGER_OPERATORS = frozenset(('+', '-', '*', '^', 'neg'))
+
+
+def to_integer_postfix(postfix: list) -> Union[list, None]:
+    """
+    Classify a postfix expression, returning a copy with every number
+    converted to an int if it only contains integers and the operators in
+    INTEGER_OPERATORS, and None otherwise.
+
+    Expressions with divisions, decimal points, floats, constants or other
+    functions are not integer programs, and neither are expressions that
+    would leave too few or too many values on the stack, so that the
+    general evaluator reports their errors.
+
+    Examples:
+        >>> to_integer_postfix(['40', '2', '+', '100', '*'])
+        [40, 2, '+', 100, '*']
+        >>> to_integer_postfix(['1', '3', '/']) is None
+        True
+    """
+    integers = []
+    depth = 0
+
+    for token in postfix:
+        if type(token) is int:
+            depth += 1
+        elif not isinstance(token, str):
+            return None
+        elif token in INTEGER_OPERATORS:
+            if token == 'neg':
+                if depth < 1:
+                    return None
+            elif depth < 2:
+                return None
+            else:
+                depth -= 1
+        elif is_int(token):
+            try:
+                token = _to_int(token)
+            except PostfixTokenEvaluationException:
+                # Left for the general evaluator to raise when evaluated
+                return None
+            depth += 1
+        else:
+            return None
+
+        integers.append(token)
+
+    if depth != 1:
+        return None
+
+    return integers
+
+
+def evaluate_integer_postfix(
+    integers: list,
+    limits: EvaluationLimits = None,
+    started: float = None
+) -> Union[int, float]:
+    """
+    Calculate the result of a postfix expression from
+    ``to_integer_postfix()`` using int arithmetic, without converting any
+    tokens. The result is the same as that of ``evaluate_postfix()``.
+
+    Raising a number to a negative power does not produce an int, so the
+    rest of the expression is then evaluated by ``evaluate_postfix()``,
+    starting from the values on the stack.
+    """
+    stack = []
+    push = stack.append
+    pop = stack.pop
+
+    if limits and started is None:
+        started = time.perf_counter()
+
+    for index, token in enumerate(integers):
+        if type(token) is int:
+            push(token)
+            continue
+
+        if limits:
+            limits.check_time(started)
+
+        if token == 'neg':
+            total = -pop()
+        else:
+            b = pop()
+            a = pop()
+
+            if token == '+':
+                total = a + b
+            elif token == '-':
+                total = a - b
+            elif token == '*':
+                total = a * b
+            else:
+                if b < 0:
+                    return evaluate_postfix(
+                        stack + [a, b] + integers[index:], limits, started
+                    )
+                if limits:
+                    limits.check_power(a, b)
+                total = a ** b
+
+        if limits:
+            limits.check_result(total)
+        push(total)
+
+    return stack[0]
+
+
+NUMERIC_MODES = ('float', 'decimal', 'fraction')
+
+
+def _fraction_sqrt(x) -> Fraction:
+    """
+    Calculate the square root of a Fraction or int without converting it
+    to a float, which would overflow for large values. The result is exact
+    for perfect squares, and has at least 64 significant bits otherwise.
+    """
+    x = Fraction(x)
+    if x < 0:
+        raise ValueError('math domain error')
+
+    # sqrt(n / d) is sqrt(n * d) / d, scaled by a power of two
+    product = x.numerator * x.denominator
+    shift = max(0, 64 - product.bit_length() // 2)
+    return Fraction(
+        math.isqrt(product << 2 * shift), x.denominator << shift
+    )
+
+
+def _fraction_log10(x) -> Fraction:
+    """
+    Calculate the base 10 logarithm of a Fraction or int. The numerator
+    and denominator are ints, which math.log10 accepts at any size.
+    """
+    x = Fraction(x)
+    if x <= 0:
+        raise ValueError('math domain error')
+
+    return (
+        Fraction(math.log10(x.numerator)) -
+        Fraction(math.log10(x.denominator))
+    )
+
+
+# Functions used to calculate unary functions in each numeric mode. Results
+# of irrational functions are converted back to the type used by the mode.
+NUMERIC_UNARY_FUNCTIONS = {
+    'float': {
+        'sqrt': math.sqrt,
+        'log': math.log10,
+        'neg': lambda x: -x
+    },
+    'decimal': {
+        'sqrt': Decimal.sqrt,
+        'log': Decimal.log10,
+        'neg': lambda x: -x
+    },
+    'fraction': {
+        'sqrt': _fraction_sqrt,
+        'log': _fraction_log10,
+        'neg': lambda x: -x
+    }
+}
+
+NUMERIC_BINARY_OPERATORS = {
+    '+': lambda a, b: a + b,
+    '-': lambda a, b: a - b,
+    '*': lambda a, b: a * b
+}
+
+
+def check_numeric_mode(numeric_mode: str):
+    """
+    Raise a ValueError if the numeric mode is not supported.
+    """
+    if numeric_mode is not None and numeric_mode not in NUMERIC_MODES:
+        raise ValueError(
+            '{} is not an available numeric mode, expected one of {}'.format(
+                numeric_mode, ', '.join(NUMERIC_MODES)
+            )
+        )
+
+
+def to_numeric_mode(token: str, numeric_mode: str):
+    """
+    Convert a number or constant token to the type used by a numeric mode.
+
+    In the 'fraction' mode integers are kept as int, since integer
+    arithmetic is much faster than that of Fraction, and only become a
+    Fraction when a division or a negative power is not a whole number.
+    """
+    if is_constant(token):
+        token = str(mathwords.CONSTANTS[token])
+
+    if numeric_mode == 'float':
+        return float(token)
+    elif numeric_mode == 'decimal':
+        return Decimal(token)
+    elif is_int(token):
+        return _to_int(token)
+    else:
+        return Fraction(token)
+
+
+def from_fraction(
+    value, numeric_mode: str = None, decimal_context: Context = None
+):
+    """
+    Convert an exact result of the 'fraction' numeric mode to the type used
+    by another numeric mode, so that it is rounded once at the end instead
+    of after every operation. Without a numeric_mode, whole numbers become
+    an int and other values a Decimal, like the results of division when
+    no numeric mode is used. Values that are not numbers, such as
+    'undefined', are returned unchanged.
+
+    Examples:
+        >>> from_fraction(parse('1 / 3 * 3', numeric_mode='fraction'))
+        1
+        >>> from_fraction(Fraction(1, 3), 'float')
+        0.3333333333333333
+    """
+    check_numeric_mode(numeric_mode)
+
+    if not isinstance(value, (int, Fraction)):
+        return value
+
+    if numeric_mode == 'fraction':
+        return Fraction(value)
+
+    if numeric_mode == 'float':
+        return float(value)
+
+    if numeric_mode is None and value.denominator == 1:
+        return int(value)
+
+    with localcontext(decimal_context):
+        return Decimal(value.numerator) / Decimal(value.denominator)
+
+
+def join_decimal_points(tokens: list) -> list:
+    """
+    Combine the tokens of numbers that were split at the decimal point,
+    such as ['53', '.', '25'], into a single token like '53.25'.
+    """
+    joined = []
+    index = 0
+
+    while index < len(tokens):
+        if (
+            index + 2 < len(tokens) and tokens[index + 1] == '.' and
+            is_int(tokens[index]) and tokens[index + 2].isdigit()
+        ):
+            joined.append(tokens[index] + '.' + tokens[index + 2])
+            index += 3
+        else:
+            joined.append(tokens[index])
+            index += 1
+
+    return joined
+
+
+def to_numeric_postfix(postfix: list, numeric_mode: str) -> list:
+    """
+    Convert the numbers in a list of postfix tokens to the type used by a
+    numeric mode. Numbers that were split at the decimal point, such as
+    ['53', '25', '.'], are converted to a single number.
+    """
+    converted = []
+    index = 0
+
+    while index < len(postfix):
+        token = postfix[index]
+
+        if isinstance(token, int) and numeric_mode == 'fraction':
+            converted.append(token)
+        elif isinstance(token, (int, float, Decimal, Fraction)):
+            converted.append(to_numeric_mode(str(token), numeric_mode))
+        elif not isinstance(token, str):
+            # Other objects, such as references to named expressions,
+            # are left for the caller to replace
+            converted.append(token)
+        elif (
+            index + 2 < len(postfix) and postfix[index + 2] == '.' and
+            is_int(token) and isinstance(postfix[index + 1], str) and
+            postfix[index + 1].isdigit()
+        ):
+            converted.append(to_numeric_mode(
+                token + '.' + postfix[index + 1], numeric_mode
+            ))
+            index += 2
+        elif token not in mathwords.BINARY_OPERATORS and (
+            is_int(token) or is_float(token) or is_constant(token)
+        ):
+            converted.append(to_numeric_mode(token, numeric_mode))
+        else:
+            converted.append(token)
+
+        index += 1
+
+    return converted
+
+
+def apply_numeric_function(token: str, a, numeric_mode: str):
+    """
+    Calculate the result of a unary function for an operand that has been
+    converted to the type used by a numeric mode.
+
+    Results that are not real numbers, such as the square root of a
+    negative number or the logarithm of zero, are 'undefined' in every
+    numeric mode.
+    """
+    if isinstance(a, str):
+        raise PostfixTokenEvaluationException(
+            'Undefined values cannot be used with operator "{}"'.format(token)
+        )
+
+    try:
+        total = NUMERIC_UNARY_FUNCTIONS[numeric_mode][token](a)
+    except (ValueError, InvalidOperation):
+        return 'undefined'
+    except (OverflowError, Overflow):
+        raise PostfixTokenEvaluationException(
+            'Result of operator "{}" is too large to represent'.format(token)
+        )
+
+    if isinstance(total, Decimal) and not total.is_finite():
+        # Decimal.log10(0) is -Infinity rather than an error
+        return 'undefined'
+
+    return total
+
+
+def apply_numeric_operator(
+    token: str, a, b, numeric_mode: str, limits: EvaluationLimits = None
+) -> Union[float, str, Decimal, Fraction]:
+    """
+    Calculate the result of a binary operator for two operands that have
+    been converted to the type used by a numeric mode.
+
+    Every numeric mode handles the same inputs in the same way. Results
+    that are not real numbers, such as a division by zero, a negative
+    power of zero or a fractional power of a negative number, are
+    'undefined'. Results that are too large for the numeric type raise a
+    PostfixTokenEvaluationException.
+    """
+    exact = numeric_mode == 'fraction'
+
+    if token == '/' and b == 0:
+        return 'undefined'
+
+    if isinstance(a, str) or isinstance(b, str):
+        # Numbers would repeat the string 'undefined' rather than fail
+        raise PostfixTokenEvaluationException(
+            'Undefined values cannot be used with operator "{}"'.format(token)
+        )
+
+    try:
+        if token in NUMERIC_BINARY_OPERATORS:
+            total = NUMERIC_BINARY_OPERATORS[token](a, b)
+        elif token == '/':
+            if exact and isinstance(a, int) and isinstance(b, int):
+                return a // b if a % b == 0 else Fraction(a, b)
+            total = a / b
+        elif token == '^':
+            if a == 0 and b < 0:
+                # The same as dividing by zero
+                return 'undefined'
+            if b == 0:
+                # Decimal raises an error for 0 ^ 0, which is 1 otherwise
+                return type(a)(1)
+            if exact and isinstance(a, int) and not (
+                isinstance(b, int) and b >= 0
+            ):
+                # Only whole powers of an int are calculated as an int
+                a = Fraction(a)
+            if limits:
+                total = limits.power(a, b)
+            else:
+                total = a ** b
+            if isinstance(total, complex):
+                # A fractional power of a negative number
+                return 'undefined'
+            if exact and isinstance(total, float):
+                total = Fraction(total)
+        elif token == '.':
+            # Decimal points that could not be joined when the
+            # expression was compiled, such as '(1 + 2) . 5'
+            digits = len(str(abs(int(b))))
+            if exact:
+                fractional_part = Fraction(b, 10 ** digits)
+            else:
+                fractional_part = b / 10 ** digits
+            if a < 0:
+                total = a - fractional_part
+            else:
+                total = a + fractional_part
+        else:
+            raise PostfixTokenEvaluationException(
+                'Unknown token "{}"'.format(token)
+            )
+    except (OverflowError, Overflow):
+        total = math.inf
+    except InvalidOperation:
+        # A fractional power of a negative Decimal
+        return 'undefined'
+
+    if isinstance(total, float) and not math.isfinite(total):
+        if token == '^':
+            raise PostfixTokenEvaluationException(
+                'Result of exponentiation is too large to represent'
+            )
+        raise PostfixTokenEvaluationException(
+            'Result of operator "{}" is too large to represent'.format(token)
+        )
+
+    return total
+
+
+def _evaluate_numeric(
+    tokens: list,
+    numeric_mode: str,
+    limits: EvaluationLimits,
+    started: float,
+    decimal_context: Context
+) -> Union[float, str, Decimal, Fraction]:
+    """
+    Evaluate a list of postfix tokens using a single numeric type.
+    Operands may be strings or numbers that have already been converted
+    to the type used by the numeric mode.
+    """
+    check_numeric_mode(numeric_mode)
+
+    unary_functions = NUMERIC_UNARY_FUNCTIONS[numeric_mode]
+    stack = []
+
+    if limits and started is None:
+        started = time.perf_counter()
+
+    with localcontext(decimal_context):
+        for token in tokens:
+            if limits:
+                limits.check_time(started)
+
+            if not isinstance(token, str):
+                stack.append(token)
+                continue
+
+            if token in unary_functions:
+                if not stack:
+                    raise PostfixTokenEvaluationException(
+                        'Insufficient values in expression for operator '
+                        '"{}"'.format(token)
+                    )
+                stack.append(apply_numeric_function(
+                    token, stack.pop(), numeric_mode
+                ))
+                continue
+
+            if token not in mathwords.BINARY_OPERATORS:
+                if not is_symbol(token):
+                    raise PostfixTokenEvaluationException(
+                        'Unknown token "{}"'.format(token)
+                    )
+                stack.append(to_numeric_mode(token, numeric_mode))
+                continue
+
+            if len(stack) < 2:
+                raise PostfixTokenEvaluationException(
+                    'Insufficient values in expression for operator '
+                    '"{}"'.format(token)
+                )
+
+            b = stack.pop()
+            a = stack.pop()
+            total = apply_numeric_operator(token, a, b, numeric_mode, limits)
+
+            if limits:
+                limits.check_result(total)
+
+            stack.append(total)
+
+    if not stack:
+        raise PostfixTokenEvaluationException(
+            'The postfix expression resulted in an empty stack'
+        )
+
+    result = stack.pop()
+
+    if numeric_mode == 'fraction' and isinstance(result, int):
+        result = Fraction(result)
+
+    return result
+
+
+# Matches the lexemes of expressions that only contain numbers, operators,
+# parentheses and the names of constants and unary functions. Numbers and
+# names must not be directly followed by a letter or digit.
+NUMERIC_LEXEME_PATTERN = re.compile(
+    r'\s*(?:(\d+)(?:\.(\d+))?(?![\w.])|([a-z]+)(?!\w)|([-+*/^()]))'
+)
+
+NUMERIC_CHARACTERS_PATTERN = re.compile(r'[0-9a-zA-Z\s.+\-*/^()]*')
+
+
+def is_numeric_expression(string: str) -> bool:
+    """
+    Return true if the string only contains the ASCII characters that
+    can appear in numeric expressions, which can be processed without
+    word replacement.
+    """
+    return string.isascii() and bool(
+        NUMERIC_CHARACTERS_PATTERN.fullmatch(string)
+    )
+
+
+def scan_numeric_expression(string: str) -> Union[list, None]:
+    """
+    Convert a numeric expression into the list of tokens that
+    ``preprocess_unary_operators(tokenize(string))`` would return, with
+    the numbers already converted to their values. The tokens can be
+    evaluated with ``evaluate_infix()``.
+
+    Returns None if the string contains anything other than numbers,
+    operators, parentheses, constants and unary functions, or if the
+    expression is not well formed, such as '2pi', '-pi', '2 (3)' or
+    '2 +'. These are left to the general tokenizer, which reports them
+    in the same way as any other expression.
+    """
+    tokens = []
+    state = _scan_numeric_lexemes(string.lower(), tokens, _NUMERIC_SCAN_START)
+
+    if state is None:
+        return None
+
+    _, depth, expect_operand, _ = state
+
+    if expect_operand or depth:
+        return None
+
+    return tokens
+
+
+# The state of the numeric scanner before the first lexeme: the position in
+# the string, the depth of parentheses, whether the next token must be an
+# operand, and whether the previous token was a name
+_NUMERIC_SCAN_START = (0, 0, True, False)
+
+
+def _scan_numeric_lexemes(
+    string: str,
+    tokens: list,
+    state: tuple,
+    checkpoints: list = None
+) -> Union[tuple, None]:
+    """
+    Scan the lexemes of a lowercase numeric expression, starting from a
+    scanner state such as _NUMERIC_SCAN_START, and add their tokens to the
+    list. Returns the state at the end of the string, or None if the
+    string cannot be scanned.
+
+    If a list of checkpoints is provided, the state after each lexeme and
+    the number of tokens at that point are added to it, so that scanning
+    can be resumed from any lexeme.
+    """
+    position, depth, expect_operand, after_name = state
+    length = len(string)
+
+    # expect_operand is true when the next token must be a number,
+    # constant, unary function or opening parenthesis, and false when it
+    # must be a binary operator or closing parenthesis. after_name is true
+    # when the previous token was a constant or function name, which a
+    # minus sign without a space in between would become a part of.
+    while position < length:
+        match = NUMERIC_LEXEME_PATTERN.match(string, position)
+
+        if match is None:
+            if string[position:].strip():
+                return None
+            break
+
+        integer, fraction, name, symbol = match.groups()
+        sign = ''
+
+        if symbol == '-' and after_name and (
+            match.start(4) == match.start(0)
+        ):
+            # The minus sign is a part of the name, such as 'pi-'
+            return None
+        elif symbol == '-' and (expect_operand or after_name):
+            following = string[match.end():match.end() + 1]
+
+            if following.isdigit():
+                # The minus sign is a part of a negative number
+                match = NUMERIC_LEXEME_PATTERN.match(string, match.end())
+                if match is None or match.group(1) is None:
+                    return None
+                integer, fraction, name, symbol = match.groups()
+                sign = '-'
+            elif following and following not in ' \t\n\r\f\v(':
+                return None
+
+        position = match.end()
+        after_name = False
+
+        if integer is not None:
+            if not expect_operand:
+                return None
+            if fraction is not None:
+                tokens.append(combine_decimal_point(sign + integer, fraction))
+            elif sign and not integer.strip('0'):
+                # Keep the sign of negative zero, which is used when it is
+                # converted to a Decimal
+                tokens.append(sign + integer)
+            else:
+                tokens.append(_to_int(sign + integer))
+            expect_operand = False
+        elif name is not None:
+            if not expect_operand:
+                return None
+            if is_constant(name):
+                expect_operand = False
+            elif not is_unary(name):
+                return None
+            tokens.append(name)
+            after_name = True
+        elif symbol == '(':
+            if not expect_operand:
+                return None
+            tokens.append(symbol)
+            depth += 1
+        elif symbol == ')':
+            if expect_operand or depth == 0:
+                return None
+            tokens.append(symbol)
+            depth -= 1
+        elif expect_operand:
+            if symbol != '-':
+                return None
+            # A minus sign where an operand is expected is unary
+            tokens.append('neg')
+        else:
+            tokens.append(symbol)
+            expect_operand = True
+
+        if checkpoints is not None:
+            checkpoints.append((
+                (position, depth, expect_operand, after_name), len(tokens)
+            ))
+
+    return (position, depth, expect_operand, after_name)
+
+
+class InfixEvaluator:
+    """
+    Evaluates tokens one at a time, applying each operator to a stack of
+    values as soon as its operands are known.
+
+    This is the algorithm used by ``evaluate_infix()``. Because the
+    evaluator only holds the values and operators that are still waiting
+    to be applied, its state can be saved after any token and restored
+    later, so that an expression which shares a prefix with a previous
+    one only needs the tokens after that prefix to be evaluated.
+    """
+
+    __slots__ = (
+        'values', 'operators', 'depth', 'limits', 'started',
+        'numeric_mode', 'unary_functions'
+    )
+
+    def __init__(
+        self,
+        limits: EvaluationLimits = None,
+        started: float = None,
+        numeric_mode: str = None
+    ):
+        check_numeric_mode(numeric_mode)
+
+        if numeric_mode:
+            self.unary_functions = NUMERIC_UNARY_FUNCTIONS[numeric_mode]
+        else:
+            self.unary_functions = mathwords.UNARY_FUNCTIONS
+
+        if limits and started is None:
+            started = time.perf_counter()
+
+        self.values = []
+        self.operators = []
+        self.depth = 0
+        self.limits = limits
+        self.started = started
+        self.numeric_mode = numeric_mode
+
+    def save(self) -> tuple:
+        """
+        Return the state of the evaluator, which can be passed to
+        ``restore()``.
+        """
+        return (tuple(self.values), tuple(self.operators), self.depth)
+
+    def restore(self, state: tuple):
+        """
+        Return the evaluator to a state that was returned by ``save()``.
+        """
+        values, operators, self.depth = state
+        self.values = list(values)
+        self.operators = list(operators)
+
+    def _reduce(self):
+        values = self.values
+        numeric_mode = self.numeric_mode
+        symbol = self.operators.pop()
+
+        if symbol in self.unary_functions:
+            a = values.pop()
+            if numeric_mode:
+                total = apply_numeric_function(symbol, a, numeric_mode)
+            else:
+                total = self.unary_functions[symbol](to_number(a))
+        elif len(values) > 1:
+            b = values.pop()
+            a = values.pop()
+            if numeric_mode:
+                total = apply_numeric_operator(
+                    symbol, a, b, numeric_mode, self.limits
+                )
+            else:
+                total = apply_binary_operator(symbol, a, b, self.limits)
+        elif values:
+            raise PostfixTokenEvaluationException(
+                'Insufficient values in expression for operator "{}"'.format(
+                    symbol
+                )
+            )
+        else:
+            # Like evaluate_postfix(), an operator without any values
+            # is ignored
+            return
+
+        if self.limits:
+            self.limits.check_time(self.started)
+            self.limits.check_result(total)
+
+        values.append(total)
+
+    def push(self, token):
+        """
+        Evaluate the next token of the expression.
+        """
+        operators = self.operators
+
+        if not isinstance(token, str):
+            # Numbers that were converted when the expression was scanned
+            self.values.append(token)
+        elif token in self.unary_functions:
+            operators.append(token)
+        elif token == '(':
+            operators.append(token)
+            self.depth += 1
+            if self.limits:
+                self.limits.check_depth(self.depth)
+        elif token == ')':
+            while operators[-1] != '(':
+                self._reduce()
+            operators.pop()
+            self.depth -= 1
+        elif token in mathwords.BINARY_OPERATORS:
+            precedence = OPERATOR_PRECEDENCE[token]
+            while operators and (
+                OPERATOR_PRECEDENCE[operators[-1]] >= precedence
+                if operators[-1] in OPERATOR_PRECEDENCE
+                # The decimal point joins the parts of a single number,
+                # so it is applied before any unary function
+                else token != '.'
+            ):
+                self._reduce()
+            operators.append(token)
+        elif is_int(token) or is_float(token) or is_constant(token):
+            if self.numeric_mode:
+                token = to_numeric_mode(token, self.numeric_mode)
+            self.values.append(token)
+        else:
+            # Raise exception for unsupported mathematical terms
+            raise PostfixTokenEvaluationException(
+                'Unsupported mathematical term: "{}"'.format(token)
+            )
+
+    def result(self) -> Union[int, float, str, Decimal, Fraction]:
+        """
+        Apply the remaining operators and return the result of the
+        tokens that have been evaluated so far. The state of the
+        evaluator is unchanged, so more tokens can be evaluated after it.
+        """
+        state = self.save()
+
+        try:
+            while self.operators:
+                self._reduce()
+
+            # If the stack is empty the tokens could not be evaluated
+            if not self.values:
+                raise PostfixTokenEvaluationException(
+                    'The postfix expression resulted in an empty stack'
+                )
+
+            result = self.values[-1]
+        finally:
+            self.restore(state)
+
+        if self.numeric_mode == 'fraction' and isinstance(result, int):
+            return Fraction(result)
+
+        # Convert final result from string to number if needed
+        if isinstance(result, str):
+            if is_int(result):
+                result = int(result)
+            elif is_float(result):
+                result = float(result)
+
+        return result
+
+
+def evaluate_infix(
+    tokens: list,
+    limits: EvaluationLimits = None,
+    started: float = None,
+    numeric_mode: str = None,
+    decimal_context: Context = None
+) -> Union[int, float, str, Decimal, Fraction]:
+    """
+    Evaluate a list of tokens in a single pass.
+
+    This runs the same operator precedence algorithm as ``to_postfix()``,
+    but applies each operator to a stack of values as soon as it would be
+    added to the postfix list. The result is the same as calling
+    ``evaluate_postfix(to_postfix(tokens))`` without building the postfix
+    list or iterating over it a second time.
+
+    The limits, started, numeric_mode and decimal_context arguments have
+    the same meaning as they do for ``evaluate_postfix()``.
+    """
+    if decimal_context is not None:
+        with localcontext(decimal_context):
+            return evaluate_infix(tokens, limits, started, numeric_mode)
+
+    evaluator = InfixEvaluator(limits, started, numeric_mode)
+
+    for token in tokens:
+        evaluator.push(token)
+
+    return evaluator.result()
+
+
+_TOKENIZE_PHRASES = {}
+
+
+def _tokenize_phrases(language: str) -> tuple:
+    """
+    Return the phrases that ``tokenize()`` needs for a language, which are
+    computed once for each language.
+
+    The first item is None for languages written with spaces between
+    words. Otherwise it is a pattern that matches the phrases of the
+    language with a space between each character, such as '乘 以', longest
+    first, and a dictionary of the phrase for each match. The second item
+    is the list of phrases that contain spaces, such as 'divided by',
+    longest first.
+    """
+    phrases = _TOKENIZE_PHRASES.get(language)
+
+    if phrases is None:
+        words = mathwords.words_for_language(language)
+        spaced_phrases = None
+
+        if language in mathwords.UNSEGMENTED_LANGUAGE_CODES:
+            table = {
+                ' '.join(phrase): phrase
+                for phrase in words if len(phrase) > 1
+            }
+            pattern = re.compile('|'.join(
+                re.escape(spaced_phrase)
+                for spaced_phrase in sorted(table, key=len, reverse=True)
+            ))
+            spaced_phrases = (pattern, table)
+
+        # Longer phrases are escaped first, such as 'to the power of'
+        # before 'power of'
+        phrases = (spaced_phrases, sorted(
+            (phrase for phrase in words if ' ' in phrase),
+            key=len, reverse=True
+        ))
+        _TOKENIZE_PHRASES[language] = phrases
+
+    return phrases
+
+
+def tokenize(string: str, language: str = None, escape: str = '___') -> list:
+    """
+    Convert a string into a list of mathematical tokens for processing.
+
+    Args:
+        string (str): The input string containing a mathematical expression.
+
+        language (str, optional): ISO 639-2 language code for word-based
+            parsing. If None, only numeric expressions
+            are supported.
+
+        escape (str, optional): A string used to temporarily replace spaces
+            in multi-word phrases during tokenization.
+            Default is '___'.
+
+    Returns:
+        list: A list of tokens extracted from the input string.
+    """
+    # Set all words to lowercase
+    string = string.lower()
+
+    # Ignore punctuation, but keep combining marks such as the vowel sign
+    # at the end of 'सौ' with the letter before them
+    if len(string) and not string[-1].isalnum() and (
+        not unicodedata.category(string[-1]).startswith('M')
+    ):
+        character = string[-1]
+        string = string[:-1] + ' ' + character
+
+    # If the language is written without spaces between words, normalize
+    # compound operators by removing spaces between their characters. This
+    # handles cases like '乘 以' which should be treated as the single
+    # compound operator '乘以'.
+    if language:
+        spaced_phrases, phrases_with_spaces = _tokenize_phrases(language)
+
+        if spaced_phrases and ' ' in string:
+            pattern, phrases = spaced_phrases
+            string = pattern.sub(
+                lambda match: phrases[match.group()], string
+            )
 
     # Binary operators must have space around them to be tokenized properly
     # Special handling for minus sign: preserve leading negatives
@@ -687,28 +2497,673 @@ def tokenize(string: str, language: str = None, escape: str = '___') -> list:
         else:
             string = string.replace(operator, f' {operator} ')
 
+    # A minus sign before a word, such as '-pi' or the name of a value, is
+    # separated from it, so that the word is its own token
+    string = re.sub(r'(?<!\w)-(?=[^\W\d_])', '- ', string)
+
+    for operator in mathwords.POSTFIX_OPERATORS:
+        string = string.replace(operator, f' {operator} ')
+
     # Parenthesis must have space around them to be tokenized properly
     string = string.replace('(', ' ( ')
     string = string.replace(')', ' ) ')
 
-    if language:
-        words = mathwords.words_for_language(language)
+    if language:
+        for phrase in phrases_with_spaces:
+            if phrase in string:
+                string = string.replace(phrase, phrase.replace(' ', escape))
+
+    tokens = string.split()
+
+    for index, token in enumerate(tokens):
+        tokens[index] = token.replace(escape, ' ')
+
+    return tokens
+
+
+class CompiledExpression:
+    """
+    An expression that has been converted to postfix format so that it
+    can be evaluated repeatedly without being parsed again.
+    Instances are created by the ``compile()`` function.
+
+    Expressions without a numeric mode that only use integers and the
+    operators in INTEGER_OPERATORS are classified when they are created,
+    and evaluated using int arithmetic.
+    """
+
+    __slots__ = (
+        'postfix', 'numeric_mode', 'decimal_context', 'integer_postfix'
+    )
+
+    def __init__(
+        self,
+        postfix: list,
+        numeric_mode: str = None,
+        decimal_context: Context = None
+    ):
+        self.postfix = postfix
+        self.numeric_mode = numeric_mode
+        self.decimal_context = decimal_context
+        self.integer_postfix = None
+
+        if numeric_mode is None:
+            self.integer_postfix = to_integer_postfix(postfix)
+
+    def __repr__(self):
+        return '<CompiledExpression {}>'.format(' '.join(
+            str(token) for token in self.postfix
+        ))
+
+    def evaluate(
+        self,
+        limits: EvaluationLimits = None,
+        started: float = None,
+        decimal_context: Context = None
+    ) -> Union[int, float, str, Decimal, Fraction]:
+        """
+        Calculate the result of the expression. A decimal_context can be
+        provided to override the one that the expression was compiled with.
+        """
+        if self.integer_postfix is not None:
+            return evaluate_integer_postfix(
+                self.integer_postfix, limits, started
+            )
+
+        return evaluate_postfix(
+            self.postfix,
+            limits,
+            started,
+            self.numeric_mode,
+            decimal_context or self.decimal_context
+        )
+
+    def to_bytecode(self) -> 'Bytecode':
+        """
+        Encode the expression as compact Bytecode. The decimal context is
+        not part of the bytecode and must be passed when evaluating it.
+        """
+        return Bytecode.from_postfix(self.postfix, self.numeric_mode)
+
+
+# Opcodes of the operators in bytecode, which are numbered from 1. These
+# must not change without also changing BYTECODE_VERSION.
+BYTECODE_OPERATORS = ('+', '-', '*', '/', '^', '.', 'sqrt', 'log', 'neg')
+BYTECODE_LOAD = 0
+BYTECODE_VERSION = 2
+
+# Version 1 wrote integers and fractions in decimal rather than hexadecimal
+_BYTECODE_READABLE_VERSIONS = (1, BYTECODE_VERSION)
+
+_BYTECODE_OPCODES = {
+    operator: opcode
+    for opcode, operator in enumerate(BYTECODE_OPERATORS, start=1)
+}
+_BYTECODE_NUMERIC_MODES = (None, ) + NUMERIC_MODES
+_BYTECODE_CONSTANT_TYPES = (str, int, float, Decimal, Fraction)
+
+
+def _append_varint(buffer, value: int):
+    """
+    Append an unsigned integer to a buffer, seven bits per byte with the
+    high bit set on every byte except the last.
+    """
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _constant_text(constant) -> str:
+    """
+    Return the text that a constant is written as in bytecode, using
+    hexadecimal for integers and fractions so that huge numbers are not
+    limited by the number of digits that can be converted to a string.
+    """
+    if isinstance(constant, int):
+        return '{:x}'.format(constant)
+    if isinstance(constant, Fraction):
+        return '{:x}/{:x}'.format(constant.numerator, constant.denominator)
+    return str(constant)
+
+
+def _parse_constant(constant_type: type, text: str, version: int):
+    """
+    Return the constant of a type that was written as text by
+    ``_constant_text()``, or in decimal by version 1 of the format.
+    """
+    if constant_type is str:
+        return sys.intern(text)
+    if version == 1:
+        return constant_type(text)
+    if constant_type is int:
+        return int(text, 16)
+    if constant_type is Fraction:
+        numerator, denominator = text.split('/')
+        return Fraction(int(numerator, 16), int(denominator, 16))
+    return constant_type(text)
+
+
+def _read_varint(buffer, index: int) -> tuple:
+    """
+    Read an unsigned integer written by ``_append_varint()``, returning
+    the integer and the index of the byte after it.
+    """
+    value = 0
+    shift = 0
+
+    while True:
+        byte = buffer[index]
+        index += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, index
+        shift += 7
+
+
+class Bytecode:
+    """
+    A compact encoding of a compiled expression, made of an array of
+    opcodes and a pool of the constants that they load.
+
+    Each operator is stored as a single byte, and each operand as a
+    BYTECODE_LOAD byte followed by the index of its constant. Iterating
+    over a Bytecode decodes its postfix tokens one at a time, so it can be
+    evaluated directly without building a list of tokens.
+    Instances are created by ``CompiledExpression.to_bytecode()`` or
+    ``Bytecode.from_bytes()``.
+    """
+
+    __slots__ = ('code', 'constants', 'numeric_mode')
+
+    def __init__(
+        self,
+        code: array,
+        constants: tuple,
+        numeric_mode: str = None
+    ):
+        self.code = code
+        self.constants = constants
+        self.numeric_mode = numeric_mode
+
+    def __repr__(self):
+        return '<Bytecode {}>'.format(' '.join(
+            str(token) for token in self
+        ))
+
+    def __iter__(self):
+        code = self.code
+        constants = self.constants
+        index = 0
+
+        while index < len(code):
+            opcode = code[index]
+            index += 1
+
+            if opcode == BYTECODE_LOAD:
+                constant, index = _read_varint(code, index)
+                yield constants[constant]
+            else:
+                yield BYTECODE_OPERATORS[opcode - 1]
+
+    @classmethod
+    def from_postfix(cls, postfix: list, numeric_mode: str = None):
+        """
+        Encode a list of postfix tokens. A ValueError is raised for unary
+        functions that do not have an opcode.
+        """
+        code = array('B')
+        constants = []
+        indexes = {}
+
+        for token in postfix:
+            if isinstance(token, str) and token in _BYTECODE_OPCODES:
+                code.append(_BYTECODE_OPCODES[token])
+                continue
+
+            if isinstance(token, str) and is_unary(token):
+                raise ValueError(
+                    'The unary function "{}" cannot be encoded as '
+                    'bytecode'.format(token)
+                )
+
+            # Values that compare equal, such as 1 and 1.0, are kept apart
+            key = (
+                type(token),
+                token if isinstance(token, (int, str, Fraction))
+                else str(token)
+            )
+            index = indexes.get(key)
+
+            if index is None:
+                index = indexes[key] = len(constants)
+                if isinstance(token, str):
+                    # The same numbers appear in many expressions
+                    token = sys.intern(token)
+                constants.append(token)
+
+            code.append(BYTECODE_LOAD)
+            _append_varint(code, index)
+
+        return cls(code, tuple(constants), numeric_mode)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        Decode bytecode from any bytes-like object that was created by
+        ``to_bytes()``. A ValueError is raised if it was written using a
+        different version of the format, or if it is truncated or corrupt.
+        """
+        data = memoryview(data)
+
+        if not data or data[0] not in _BYTECODE_READABLE_VERSIONS:
+            raise ValueError(
+                'Unsupported bytecode format version, expected {}'.format(
+                    BYTECODE_VERSION
+                )
+            )
+
+        try:
+            return cls._decode(data)
+        except (IndexError, ValueError, ArithmeticError) as e:
+            raise ValueError('Bytecode is truncated or corrupt') from e
+
+    @classmethod
+    def _decode(cls, data: memoryview):
+        version = data[0]
+        numeric_mode = _BYTECODE_NUMERIC_MODES[data[1]]
+        count, index = _read_varint(data, 2)
+        constants = []
+
+        for _ in range(count):
+            constant_type = _BYTECODE_CONSTANT_TYPES[data[index]]
+            length, index = _read_varint(data, index + 1)
+            if index + length > len(data):
+                raise IndexError('Constant extends past the end of the data')
+            text = str(data[index:index + length], 'utf-8')
+            index += length
+
+            constants.append(_parse_constant(constant_type, text, version))
+
+        length, index = _read_varint(data, index)
+        if index + length != len(data):
+            raise IndexError('Opcodes do not end with the data')
+        code = array('B', data[index:index + length])
+
+        # Check every opcode, so that evaluation cannot fail part way
+        position = 0
+        while position < len(code):
+            opcode = code[position]
+            position += 1
+
+            if opcode == BYTECODE_LOAD:
+                constant, position = _read_varint(code, position)
+                if constant >= count:
+                    raise IndexError('Constant {} does not exist'.format(
+                        constant
+                    ))
+            elif opcode > len(BYTECODE_OPERATORS):
+                raise ValueError('Unknown opcode {}'.format(opcode))
+
+        return cls(code, tuple(constants), numeric_mode)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the bytecode, starting with the BYTECODE_VERSION that
+        the format was written with.
+        """
+        data = bytearray([
+            BYTECODE_VERSION,
+            _BYTECODE_NUMERIC_MODES.index(self.numeric_mode)
+        ])
+        _append_varint(data, len(self.constants))
+
+        for constant in self.constants:
+            text = _constant_text(constant).encode('utf-8')
+            data.append(_BYTECODE_CONSTANT_TYPES.index(type(constant)))
+            _append_varint(data, len(text))
+            data += text
+
+        _append_varint(data, len(self.code))
+        data += self.code.tobytes()
+
+        return bytes(data)
+
+    def to_postfix(self) -> list:
+        """
+        Return the list of postfix tokens that the bytecode encodes.
+        """
+        return list(self)
+
+    def evaluate(
+        self,
+        limits: EvaluationLimits = None,
+        started: float = None,
+        decimal_context: Context = None
+    ) -> Union[int, float, str, Decimal, Fraction]:
+        """
+        Calculate the result of the expression, decoding each token from
+        the opcode array as it is evaluated.
+        """
+        return evaluate_postfix(
+            self, limits, started, self.numeric_mode, decimal_context
+        )
+
+
+def result_cache_key(
+    string: str,
+    language: str = None,
+    stopwords: set[str] = None,
+    numeric_mode: str = None,
+    decimal_context: Context = None
+) -> str:
+    """
+    Return a key that identifies the result of parsing a string with the
+    given arguments. Runs of whitespace in the string are treated as a
+    single space.
+
+    Divisions produce Decimal values, so the key includes the precision
+    and rounding of the decimal_context, which defaults to the current
+    decimal context.
+
+    Examples:
+        >>> result_cache_key('five  plus three', 'ENG')
+        '["five plus three", "ENG", null, null, 28, "ROUND_HALF_EVEN"]'
+    """
+    if decimal_context is None:
+        decimal_context = getcontext()
+
+    return json.dumps([
+        ' '.join(string.split()),
+        language,
+        sorted(stopwords) if stopwords else None,
+        numeric_mode,
+        decimal_context.prec,
+        decimal_context.rounding
+    ], ensure_ascii=False)
+
+
+class CacheBackend(Protocol):
+    """
+    The methods that a cache must have to be passed to ``parse()`` or
+    ``compile()``. Keys are strings from ``result_cache_key()``, and values
+    are results or CompiledExpression instances. A cache may discard any
+    entry at any time.
+    """
+
+    def get(self, key: str):
+        """
+        Return the cached value for a key, or None if there is none.
+        """
+
+    def set(self, key: str, value):
+        """
+        Cache a value for a key.
+        """
+
+
+class _StageTimer:
+    """
+    Records the time taken by each stage of a call, and the number of
+    tokens in its expression, for a SlowQueryLog.
+    """
+
+    __slots__ = ('durations', 'token_count', 'last')
+
+    def __init__(self):
+        self.durations = {}
+        self.token_count = None
+        self.last = time.perf_counter()
+
+    def finish(self, stage: str):
+        """
+        Add the time since the previous stage finished to a stage.
+        """
+        now = time.perf_counter()
+        self.durations[stage] = self.durations.get(stage, 0) + now - self.last
+        self.last = now
+
+
+# Names that are defined in other modules, which are only imported when
+# one of the names is first used, so that importing the parser does not
+# import sqlite3, mmap or logging
+_LAZY_NAMES = {
+    'CACHE_POLICIES': 'caches',
+    'approximate_size': 'caches',
+    'ResultCache': 'caches',
+    'vocabulary_version': 'persistent_cache',
+    'PersistentResultCache': 'persistent_cache',
+    'CATALOG_VERSION': 'catalog',
+    'CatalogBuilder': 'catalog',
+    'ExpressionCatalog': 'catalog',
+    'SlowQueryLog': 'slow_queries'
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_NAMES:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name)
+        )
+
+    module = importlib.import_module('.' + _LAZY_NAMES[name], __package__)
+    return getattr(module, name)
+
+
+def _prepare_tokens(
+    string: str,
+    language: str,
+    stopwords: set[str],
+    limits: EvaluationLimits,
+    started: float,
+    word_cache: WordReplacementCache = None,
+    stages: _StageTimer = None
+) -> list:
+    """
+    Replace the words in a string, then tokenize it and convert unary
+    minus signs, ready for evaluation.
+    """
+    if language:
+        if word_cache is not None:
+            string = word_cache.replace_words(string, language, stopwords)
+        else:
+            string = replace_words(string, language, stopwords)
+
+        if stages:
+            stages.finish('replace_words')
+
+    tokens = tokenize(string, language)
+
+    if stages:
+        stages.token_count = len(tokens)
+        stages.finish('tokenize')
 
-        for phrase in words:
-            escaped_phrase = phrase.replace(' ', escape)
-            string = string.replace(phrase, escaped_phrase)
+    if limits:
+        limits.check_tokens(tokens)
+        limits.check_time(started)
 
-    tokens = string.split()
+    tokens = preprocess_unary_operators(tokens)
 
-    for index, token in enumerate(tokens):
-        tokens[index] = token.replace(escape, ' ')
+    if stages:
+        stages.finish('preprocess_unary_operators')
 
     return tokens
 
 
+def _compile(
+    string: Union[str, ExpressionNode],
+    language: str,
+    stopwords: set[str],
+    limits: EvaluationLimits,
+    started: float,
+    numeric_mode: str = None,
+    decimal_context: Context = None,
+    word_cache: WordReplacementCache = None,
+    stages: _StageTimer = None
+) -> CompiledExpression:
+    """
+    Run the parsing stages of the pipeline, checking the limits against
+    the time that the caller started processing the expression.
+    """
+    check_numeric_mode(numeric_mode)
+
+    if isinstance(string, ExpressionNode):
+        postfix = string.to_postfix()
+    else:
+        if limits:
+            limits.check_length(string)
+
+        if not language and not numeric_mode and (
+            is_numeric_expression(string)
+        ):
+            tokens = scan_numeric_expression(string)
+
+            if tokens is not None:
+                if stages:
+                    stages.token_count = len(tokens)
+                    stages.finish('scan_numeric_expression')
+                if limits:
+                    limits.check_tokens(tokens)
+                postfix = to_postfix(tokens, limits)
+                if stages:
+                    stages.finish('to_postfix')
+                return CompiledExpression(postfix)
+
+        tokens = _prepare_tokens(
+            string, language, stopwords, limits, started, word_cache, stages
+        )
+        postfix = to_postfix(tokens, limits)
+
+        if stages:
+            stages.finish('to_postfix')
+
+    if numeric_mode:
+        # Convert each number once so that evaluation only does arithmetic
+        postfix = to_numeric_postfix(postfix, numeric_mode)
+
+        if stages:
+            stages.finish('to_numeric_postfix')
+
+    return CompiledExpression(postfix, numeric_mode, decimal_context)
+
+
+def compile(
+    string: Union[str, ExpressionNode],
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: EvaluationLimits = None,
+    numeric_mode: str = None,
+    decimal_context: Context = None,
+    word_cache: WordReplacementCache = None,
+    cache: CacheBackend = None
+) -> CompiledExpression:
+    """
+    Parse a mathematical expression from a string without evaluating it.
+
+    This accepts the same arguments as ``parse()``. The returned
+    CompiledExpression can be evaluated any number of times, which avoids
+    repeating the word replacement, tokenization and postfix conversion.
+    An expression tree from ``parse_tree()`` can also be compiled.
+    Compiled expressions are cached under different keys from results,
+    so the same cache can be passed to both functions.
+
+    Examples:
+        >>> expression = compile('five plus three', language='ENG')
+        >>> expression.evaluate()
+        8
+    """
+    if cache is not None and decimal_context is None and (
+        isinstance(string, str)
+    ):
+        if limits:
+            limits.check_length(string)
+
+        key = 'compile:' + result_cache_key(
+            string, language, stopwords, numeric_mode
+        )
+        expression = cache.get(key)
+
+        if expression is None:
+            expression = compile(
+                string,
+                language,
+                stopwords,
+                limits,
+                numeric_mode,
+                word_cache=word_cache
+            )
+            cache.set(key, expression)
+
+        return expression
+
+    started = None
+
+    if limits:
+        started = time.perf_counter()
+
+    return _compile(
+        string,
+        language,
+        stopwords,
+        limits,
+        started,
+        numeric_mode,
+        decimal_context,
+        word_cache
+    )
+
+
+def parse_tree(
+    string: str,
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: EvaluationLimits = None,
+    word_cache: WordReplacementCache = None
+) -> ExpressionNode:
+    """
+    Parse a mathematical expression from a string into an expression tree
+    without evaluating it.
+
+    The language, stopwords, limits and word_cache are used in the same
+    way as by ``parse()``. Identical subexpressions share the same node,
+    and trees can be compiled, evaluated with ``evaluate_postfix()`` or
+    used as dictionary keys.
+
+    Examples:
+        >>> tree = parse_tree('(1 + 2) * (1 + 2)')
+        >>> tree.left is tree.right
+        True
+        >>> evaluate_postfix(tree)
+        9
+    """
+    started = None
+
+    if limits:
+        started = time.perf_counter()
+        limits.check_length(string)
+
+    tokens = _prepare_tokens(
+        string, language, stopwords, limits, started, word_cache
+    )
+
+    return to_tree(tokens, limits)
+
+
+ENGINES = ('postfix', 'fused')
+
+
 def parse(
-    string: str, language: str = None, stopwords: set[str] = None
-) -> Union[int, float, str, Decimal]:
+    string: str,
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: EvaluationLimits = None,
+    numeric_mode: str = None,
+    decimal_context: Context = None,
+    engine: str = 'postfix',
+    word_cache: WordReplacementCache = None,
+    cache: CacheBackend = None,
+    slow_query_log: 'SlowQueryLog' = None
+) -> Union[int, float, str, Decimal, Fraction]:
     """
     Parse and evaluate a mathematical expression from a string.
 
@@ -728,6 +3183,42 @@ def parse(
         stopwords (set[str], optional): A set of words to ignore during
                                        parsing. This can be used to filter out
                                        non-mathematical words in expressions.
+        limits (EvaluationLimits, optional): Bounds on the length, token
+                                            count, nesting depth, result size
+                                            and evaluation time of the
+                                            expression. If None, no limits
+                                            are enforced.
+        numeric_mode (str, optional): The numeric type used for every value.
+                                     'float' is the fastest, 'decimal' uses
+                                     the Decimal type with the precision of
+                                     the decimal_context, and 'fraction'
+                                     keeps results as exact rationals. If
+                                     None, integers, floats and decimals
+                                     are mixed.
+        decimal_context (Context, optional): The decimal context used when
+                                            evaluating the expression.
+                                            Defaults to the current context.
+        engine (str, optional): 'postfix' converts the tokens to a postfix
+                               list and then evaluates it. 'fused'
+                               evaluates the tokens in a single pass
+                               without building the postfix list, which
+                               is faster for one-off expressions. Both
+                               engines give the same results, although
+                               malformed expressions can raise a
+                               different exception.
+        word_cache (WordReplacementCache, optional): A cache of the
+                                                    result of replacing
+                                                    words, which can be
+                                                    shared between calls.
+        cache (CacheBackend, optional): A cache of results, such as a
+                                       ResultCache or a
+                                       PersistentResultCache. Only
+                                       expressions evaluated with the
+                                       default decimal context are
+                                       cached.
+        slow_query_log (SlowQueryLog, optional): Logs the expression if
+                                                parsing it takes longer
+                                                than the log's threshold.
 
     Returns:
         int, float, or str: The result of the mathematical expression.
@@ -740,6 +3231,8 @@ def parse(
             An unsupported language code was provided.
         PostfixTokenEvaluationException:
             The expression cannot be evaluated.
+        EvaluationLimitException:
+            The expression exceeds one of the provided limits.
 
     Examples:
         >>> parse('2 + 3 * 4')
@@ -767,22 +3260,1004 @@ def parse(
         - Each expression must use terms from a single language
         - Division by zero returns 'undefined' instead of raising an exception
     """
-    if language:
-        if language == 'CHI':
-            string = replace_word_tokens_simplified_chinese(
-                string, stopwords
+    if engine not in ENGINES:
+        raise ValueError(
+            '{} is not an available engine, expected one of {}'.format(
+                engine, ', '.join(ENGINES)
+            )
+        )
+
+    if slow_query_log is None:
+        return _parse(
+            string,
+            language,
+            stopwords,
+            limits,
+            numeric_mode,
+            decimal_context,
+            engine,
+            word_cache,
+            cache
+        )
+
+    return slow_query_log.measure('parse', string, language, lambda stages: (
+        _parse(
+            string,
+            language,
+            stopwords,
+            limits,
+            numeric_mode,
+            decimal_context,
+            engine,
+            word_cache,
+            cache,
+            stages
+        )
+    ))
+
+
+def _parse(
+    string: str,
+    language: str,
+    stopwords: set[str],
+    limits: EvaluationLimits,
+    numeric_mode: str,
+    decimal_context: Context,
+    engine: str,
+    word_cache: WordReplacementCache,
+    cache: CacheBackend,
+    stages: _StageTimer = None
+) -> Union[int, float, str, Decimal, Fraction]:
+    """
+    Parse and evaluate an expression, recording the time of each stage in
+    stages if it is provided.
+    """
+    if cache is not None and decimal_context is None:
+        if limits:
+            limits.check_length(string)
+
+        key = result_cache_key(string, language, stopwords, numeric_mode)
+        result = cache.get(key)
+
+        if stages:
+            stages.finish('cache')
+
+        if result is not None and limits:
+            # The result may have been cached by a call with other limits
+            limits.check_result(result)
+
+        if result is None:
+            result = _parse(
+                string,
+                language,
+                stopwords,
+                limits,
+                numeric_mode,
+                None,
+                engine,
+                word_cache,
+                None,
+                stages
+            )
+            cache.set(key, result)
+
+            if stages:
+                stages.finish('cache')
+
+        return result
+
+    started = None
+
+    if limits:
+        started = time.perf_counter()
+        limits.check_length(string)
+
+    # Numeric expressions are evaluated as soon as they are scanned
+    if not language and not numeric_mode and is_numeric_expression(string):
+        tokens = scan_numeric_expression(string)
+
+        if tokens is not None:
+            if stages:
+                stages.token_count = len(tokens)
+                stages.finish('scan_numeric_expression')
+            if limits:
+                limits.check_tokens(tokens)
+            result = evaluate_infix(tokens, limits, started)
+            if stages:
+                stages.finish('evaluate_infix')
+            return result
+
+    if engine == 'fused':
+        check_numeric_mode(numeric_mode)
+        tokens = _prepare_tokens(
+            string, language, stopwords, limits, started, word_cache, stages
+        )
+        if numeric_mode:
+            tokens = join_decimal_points(tokens)
+        result = evaluate_infix(
+            tokens, limits, started, numeric_mode, decimal_context
+        )
+        if stages:
+            stages.finish('evaluate_infix')
+        return result
+
+    expression = _compile(
+        string,
+        language,
+        stopwords,
+        limits,
+        started,
+        numeric_mode,
+        decimal_context,
+        word_cache,
+        stages
+    )
+    result = expression.evaluate(limits, started)
+
+    if stages:
+        stages.finish('evaluate_postfix')
+
+    return result
+
+
+class ParseTrace:
+    """
+    The output of each stage of parsing an expression, created by
+    ``explain()``.
+
+    Attributes:
+        string (str): The expression that was parsed.
+
+        replaced (str): The string after words were replaced, or None if
+            no language was given.
+
+        tokens (list): The tokens from ``tokenize()``.
+
+        preprocessed (list): The tokens after unary minus signs and
+            postfix operators were converted.
+
+        postfix (list): The tokens in postfix order, with numbers
+            converted to the numeric type of the numeric_mode if one was
+            given.
+
+        max_stack_depth (int): The largest number of values on the stack
+            while evaluating the postfix tokens.
+
+        durations (dict): The number of seconds that each stage took, by
+            the name of its function.
+
+        result: The result of the expression, or None if it raised an
+            exception.
+
+        error (Exception): The exception that was raised, or None.
+
+    Stages after the one that raised an exception are None.
+    """
+
+    def __init__(self, string: str):
+        self.string = string
+        self.replaced = None
+        self.tokens = None
+        self.preprocessed = None
+        self.postfix = None
+        self.max_stack_depth = None
+        self.durations = {}
+        self.result = None
+        self.error = None
+
+    def __repr__(self):
+        if self.error is not None:
+            return '<ParseTrace {!r} error={!r}>'.format(
+                self.string, self.error
             )
+        return '<ParseTrace {!r} result={!r}>'.format(
+            self.string, self.result
+        )
+
+    def __str__(self):
+        lines = ['expression: {}'.format(self.string)]
+
+        if self.replaced is not None:
+            lines.append('replaced: {}'.format(self.replaced))
+
+        for name in ['tokens', 'preprocessed', 'postfix']:
+            tokens = getattr(self, name)
+            if tokens is not None:
+                lines.append('{}: {}'.format(name, ' '.join(
+                    str(token) for token in tokens
+                )))
+
+        if self.max_stack_depth is not None:
+            lines.append('max stack depth: {}'.format(self.max_stack_depth))
+
+        for stage, seconds in self.durations.items():
+            lines.append('{}: {:.3f} ms'.format(stage, seconds * 1000))
+
+        if self.error is not None:
+            lines.append('error: {!r}'.format(self.error))
         else:
-            string = replace_word_tokens(string, language, stopwords)
+            lines.append('result: {!r}'.format(self.result))
 
-    tokens = tokenize(string, language)
-    tokens = preprocess_unary_operators(tokens)
-    postfix = to_postfix(tokens)
+        return '\n'.join(lines)
+
+
+def _max_stack_depth(postfix: list) -> int:
+    """
+    Return the largest number of values that are on the stack at once
+    while the postfix tokens are evaluated.
+    """
+    depth = 0
+    max_depth = 0
+
+    for token in postfix:
+        if isinstance(token, str) and is_unary(token):
+            continue
+
+        if isinstance(token, str) and token in mathwords.BINARY_OPERATORS:
+            if depth > 1:
+                depth -= 1
+        else:
+            depth += 1
+            max_depth = max(max_depth, depth)
+
+    return max_depth
+
+
+def explain(
+    string: str,
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: EvaluationLimits = None,
+    numeric_mode: str = None,
+    decimal_context: Context = None
+) -> ParseTrace:
+    """
+    Parse and evaluate an expression like ``parse()``, and return a
+    ParseTrace of the output and duration of each stage.
+
+    The stages are those of the 'postfix' engine, even for numeric
+    expressions that ``parse()`` would evaluate with the numeric fast path,
+    and the result is the same. An exception raised by any stage is kept
+    in the trace instead of being raised. Nothing is recorded when
+    ``parse()`` is called, so it is not slowed down.
+
+    Examples:
+        >>> trace = explain('two squared plus one', language='ENG')
+        >>> trace.postfix
+        ['2', '2', '^', '1', '+']
+        >>> trace.result
+        5
+        >>> print(trace)
+        expression: two squared plus one
+        replaced: 2 ² + 1
+        ...
+    """
+    trace = ParseTrace(string)
+    started = time.perf_counter()
+    stage = started
+
+    def finish(name: str):
+        nonlocal stage
+        now = time.perf_counter()
+        trace.durations[name] = now - stage
+        stage = now
+
+    try:
+        check_numeric_mode(numeric_mode)
+
+        if limits:
+            limits.check_length(string)
+
+        if language:
+            trace.replaced = replace_words(string, language, stopwords)
+            string = trace.replaced
+            finish('replace_words')
+
+        trace.tokens = tokenize(string, language)
+        if limits:
+            limits.check_tokens(trace.tokens)
+            limits.check_time(started)
+        finish('tokenize')
+
+        trace.preprocessed = preprocess_unary_operators(trace.tokens)
+        finish('preprocess_unary_operators')
+
+        postfix = to_postfix(trace.preprocessed, limits)
+        finish('to_postfix')
+
+        if numeric_mode:
+            postfix = to_numeric_postfix(postfix, numeric_mode)
+            finish('to_numeric_postfix')
+
+        trace.postfix = postfix
+        trace.max_stack_depth = _max_stack_depth(postfix)
+
+        trace.result = evaluate_postfix(
+            postfix, limits, started, numeric_mode, decimal_context
+        )
+        finish('evaluate_postfix')
+    except Exception as e:
+        trace.error = e
+
+    return trace
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """
+    Return the length of the longest common prefix of two strings.
+    """
+    if b.startswith(a):
+        return len(a)
+
+    low = 0
+    high = min(len(a), len(b))
+
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+
+    return low
+
+
+class ParseSession:
+    """
+    Parses successive versions of an expression as it is edited, such as
+    the input of a calculator that is evaluated on every keystroke.
+
+    The session keeps the tokens of the previous version of the string,
+    and the evaluation state after each of them. When the string is
+    updated, only the tokens after the first change are evaluated again.
+    For numeric expressions only the changed end of the string is scanned
+    again, so appending to a long expression takes about the same time as
+    appending to a short one. Expressions that contain words are tokenized
+    again in full, but evaluation still resumes from the first token that
+    changed.
+
+    Results are the same as those of ``parse()`` with ``engine='fused'``.
+
+    Examples:
+        >>> session = ParseSession()
+        >>> session.update('12 * 3')
+        36
+        >>> session.append('4')
+        408
+    """
+
+    def __init__(
+        self,
+        language: str = None,
+        stopwords: set[str] = None,
+        limits: EvaluationLimits = None,
+        numeric_mode: str = None
+    ):
+        self.language = language
+        self.stopwords = stopwords
+        self.limits = limits
+        self.numeric_mode = numeric_mode
+        self.string = ''
+
+        self._evaluator = InfixEvaluator(numeric_mode=numeric_mode)
+        self._tokens = []
+
+        # The evaluator state after each number of tokens, from zero
+        self._states = [self._evaluator.save()]
+
+        # The lowercase string and the numeric scanner checkpoints, when
+        # the tokens were produced by the numeric scanner
+        self._scanned = None
+        self._checkpoints = []
+
+    @property
+    def tokens(self) -> list:
+        """
+        The tokens of the current string.
+        """
+        return list(self._tokens)
+
+    def _scan(self, string: str) -> Union[int, None]:
+        """
+        Update the tokens by scanning the changed end of a numeric
+        expression. Returns the number of tokens that are unchanged, or
+        None if the expression must be tokenized in full.
+        """
+        string = string.lower()
+        checkpoints = self._checkpoints
+        state = _NUMERIC_SCAN_START
+        count = 0
+
+        if self._scanned is not None:
+            unchanged = _common_prefix_length(self._scanned, string)
+
+            # A lexeme is unchanged if the character after it is as well,
+            # since the scanner looks ahead by one character
+            while checkpoints and checkpoints[-1][0][0] >= unchanged:
+                checkpoints.pop()
+
+            if checkpoints:
+                state, count = checkpoints[-1]
+        else:
+            checkpoints.clear()
+
+        del self._tokens[count:]
+
+        if _scan_numeric_lexemes(
+            string, self._tokens, state, checkpoints
+        ) is None:
+            del self._tokens[count:]
+            checkpoints.clear()
+            self._scanned = None
+            return None
+
+        self._scanned = string
+        return count
+
+    def _tokenize(self, string: str, started: float) -> int:
+        """
+        Update the tokens for a new string. Returns the number of tokens
+        that are unchanged.
+        """
+        if not self.language and not self.numeric_mode and (
+            is_numeric_expression(string)
+        ):
+            unchanged = self._scan(string)
+
+            if unchanged is not None:
+                return unchanged
+
+        self._scanned = None
+        self._checkpoints.clear()
+
+        tokens = _prepare_tokens(
+            string, self.language, self.stopwords, self.limits, started
+        )
+
+        if self.numeric_mode:
+            tokens = join_decimal_points(tokens)
+
+        # These tokens are all strings, so they can only be equal to tokens
+        # from the numeric scanner that are evaluated in the same way
+        previous = self._tokens
+        unchanged = 0
+        while unchanged < min(len(tokens), len(previous)) and (
+            tokens[unchanged] == previous[unchanged]
+        ):
+            unchanged += 1
+
+        self._tokens = tokens
+        return unchanged
+
+    def update(self, string: str) -> Union[int, float, str, Decimal, Fraction]:
+        """
+        Replace the expression with a new version of it and return its
+        result. Exceptions are raised in the same way as by ``parse()``.
+        """
+        started = None
+
+        if self.limits:
+            started = time.perf_counter()
+            self.limits.check_length(string)
+
+        self.string = string
+        unchanged = self._tokenize(string, started)
+        tokens = self._tokens
+
+        if self.limits:
+            self.limits.check_tokens(tokens)
+
+        states = self._states
+        unchanged = min(unchanged, len(states) - 1)
+        del states[unchanged + 1:]
+
+        evaluator = self._evaluator
+        evaluator.restore(states[unchanged])
+        evaluator.limits = self.limits
+        evaluator.started = started
+
+        for token in tokens[unchanged:]:
+            evaluator.push(token)
+            states.append(evaluator.save())
+
+        return evaluator.result()
+
+    def append(self, text: str) -> Union[int, float, str, Decimal, Fraction]:
+        """
+        Add text to the end of the expression and return its result.
+        """
+        return self.update(self.string + text)
+
+
+class _NameReference:
+    """
+    A placeholder for the value of a named expression in the postfix
+    tokens of a Workbook expression.
+    """
+
+    __slots__ = ('name', )
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+class Workbook:
+    """
+    A collection of named expressions that can refer to each other by
+    name, such as 'total' defined as 'subtotal plus tax'.
+
+    Each expression is compiled once, when it is set. The workbook tracks
+    which expressions each one refers to, and when an expression changes
+    only the expressions that depend on it are evaluated again, in an
+    order where every expression is evaluated after the ones it refers to.
+    A CircularReferenceException is raised for expressions that would
+    refer to themselves.
+
+    Examples:
+        >>> workbook = Workbook(language='ENG')
+        >>> workbook.set('subtotal', 'five times twenty')
+        ['subtotal']
+        >>> workbook.set('tax', 'subtotal divided by ten')
+        ['tax']
+        >>> workbook.set('total', 'subtotal plus tax')
+        ['total']
+        >>> workbook['total']
+        Decimal('110')
+        >>> workbook.set('subtotal', '200')
+        ['subtotal', 'tax', 'total']
+        >>> workbook['total']
+        Decimal('220')
+    """
+
+    def __init__(
+        self,
+        language: str = None,
+        stopwords: set[str] = None,
+        limits: EvaluationLimits = None,
+        numeric_mode: str = None
+    ):
+        check_numeric_mode(numeric_mode)
+
+        self.language = language
+        self.stopwords = stopwords
+        self.limits = limits
+        self.numeric_mode = numeric_mode
+
+        self._postfix = {}
+        self._dependencies = {}
+        self._dependents = {}
+        self._values = {}
+        self._errors = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._postfix
+
+    def __iter__(self):
+        return iter(self._postfix)
+
+    def __len__(self):
+        return len(self._postfix)
+
+    def __getitem__(self, name: str):
+        """
+        Return the value of a named expression, or raise the exception
+        that prevented it from being evaluated.
+        """
+        name = name.lower()
+
+        if name not in self._postfix:
+            raise KeyError(name)
+
+        if name in self._errors:
+            raise self._errors[name]
+
+        return self._values[name]
+
+    def _check_name(self, name: str) -> str:
+        name = name.lower()
+
+        # Words are replaced within names, such as 'times' in 'timestamp',
+        # so a name must be left unchanged by word replacement
+        if not name.isidentifier() or is_symbol(name) or (
+            self.language and (
+                is_word(name, self.language) or
+                replace_words(name, self.language, self.stopwords) != name
+            )
+        ):
+            raise ValueError(
+                '"{}" cannot be used as the name of an expression'.format(
+                    name
+                )
+            )
+
+        return name
+
+    def _compile(self, expression) -> list:
+        """
+        Convert an expression to postfix tokens, where each name that it
+        refers to is a _NameReference.
+        """
+        if not isinstance(expression, str):
+            # A number, such as an input value
+            postfix = [expression]
+        else:
+            started = None
+
+            if self.limits:
+                started = time.perf_counter()
+                self.limits.check_length(expression)
+
+            tokens = [
+                _NameReference(token)
+                if token.isidentifier() and not is_symbol(token) else token
+                for token in _prepare_tokens(
+                    expression,
+                    self.language,
+                    self.stopwords,
+                    self.limits,
+                    started
+                )
+            ]
+            postfix = to_postfix(tokens, self.limits)
+
+        if self.numeric_mode:
+            postfix = to_numeric_postfix(postfix, self.numeric_mode)
+
+        return postfix
+
+    def _depends_on(self, names: set, target: str) -> bool:
+        """
+        Return true if any of the names refers to the target, directly or
+        through other expressions.
+        """
+        visited = set()
+        pending = list(names)
+
+        while pending:
+            name = pending.pop()
+            if name == target:
+                return True
+            if name not in visited:
+                visited.add(name)
+                pending.extend(self._dependencies.get(name, ()))
+
+        return False
+
+    def _downstream(self, name: str) -> list:
+        """
+        Return the name and every expression that depends on it, ordered
+        so that each expression comes after the expressions it refers to.
+        """
+        affected = {name}
+        pending = [name]
+
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+
+        # Kahn's algorithm, counting only the references between the
+        # affected expressions
+        remaining = {
+            current: len(self._dependencies.get(current, set()) & affected)
+            for current in affected
+        }
+        ready = [current for current, count in remaining.items() if not count]
+        order = []
+
+        while ready:
+            current = ready.pop()
+            order.append(current)
+            for dependent in self._dependents.get(current, ()):
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ready.append(dependent)
+
+        return order
+
+    def _evaluate(self, name: str):
+        self._values.pop(name, None)
+        self._errors.pop(name, None)
+
+        if name not in self._postfix:
+            return
+
+        postfix = []
+
+        for token in self._postfix[name]:
+            if isinstance(token, _NameReference):
+                if token.name not in self._values:
+                    self._errors[name] = PostfixTokenEvaluationException(
+                        'The value of "{}" is not available'.format(
+                            token.name
+                        )
+                    )
+                    return
+                token = self._values[token.name]
+                if token == 'undefined':
+                    self._values[name] = token
+                    return
+            postfix.append(token)
+
+        try:
+            self._values[name] = evaluate_postfix(
+                postfix, self.limits, numeric_mode=self.numeric_mode
+            )
+        except Exception as e:
+            self._errors[name] = e
+
+    def _recalculate(self, name: str) -> list:
+        order = self._downstream(name)
+
+        for current in order:
+            self._evaluate(current)
+
+        return [current for current in order if current in self._postfix]
+
+    def set(self, name: str, expression) -> list:
+        """
+        Set the expression for a name, which can be a string or a number.
+
+        Returns the names of the expressions that were evaluated as a
+        result, in the order that they were evaluated.
+        """
+        name = self._check_name(name)
+        postfix = self._compile(expression)
+        dependencies = {
+            token.name for token in postfix
+            if isinstance(token, _NameReference)
+        }
+
+        if self._depends_on(dependencies, name):
+            raise CircularReferenceException(
+                'The expression for "{}" refers to itself'.format(name)
+            )
+
+        for dependency in self._dependencies.get(name, ()):
+            self._dependents[dependency].discard(name)
+
+        for dependency in dependencies:
+            self._dependents.setdefault(dependency, set()).add(name)
+
+        self._postfix[name] = postfix
+        self._dependencies[name] = dependencies
+
+        return self._recalculate(name)
+
+    def remove(self, name: str) -> list:
+        """
+        Remove the expression for a name. Expressions that refer to it
+        can no longer be evaluated.
+
+        Returns the names of the expressions that were evaluated as a
+        result, in the order that they were evaluated.
+        """
+        name = name.lower()
+
+        if name not in self._postfix:
+            raise KeyError(name)
+
+        for dependency in self._dependencies.pop(name):
+            self._dependents[dependency].discard(name)
+
+        del self._postfix[name]
+
+        return self._recalculate(name)
+
+
+# Approximate number of bits in the result of a division, which is
+# calculated using the default 28 digit precision of the decimal module
+DIVISION_RESULT_BITS = 93
+
+
+def _multiplication_cost(bits: float) -> float:
+    """
+    Return the relative cost of producing an integer with the given number
+    of bits by multiplication, which is subquadratic in the number of
+    machine words.
+    """
+    words = bits / 64
+    if words > 1e100:
+        return math.inf
+    return words ** 1.585
 
-    return evaluate_postfix(postfix)
 
+def estimate_cost(
+    expression: Union[str, CompiledExpression, ExpressionNode],
+    language: str = None,
+    stopwords: set[str] = None
+) -> float:
+    """
+    Estimate the relative cost of evaluating an expression without
+    evaluating it.
+
+    The estimate is based on the number of tokens in the postfix program,
+    how deeply its operands are nested, and the predicted size of each
+    intermediate result. The units are arbitrary and are only meant to be
+    used to compare expressions with each other. Expressions whose results
+    would be too large to represent have a cost of infinity.
+
+    Args:
+        expression (str, CompiledExpression or ExpressionNode): The
+            expression to estimate. Strings are compiled using the language
+            and stopwords.
+
+    Examples:
+        >>> estimate_cost('2 + 2') < estimate_cost('7 ^ 300000')
+        True
+    """
+    if not isinstance(expression, CompiledExpression):
+        expression = compile(expression, language, stopwords)
+
+    cost = 0.0
+    depth = 0
+
+    # Each stack entry is the predicted size of a value in bits
+    stack = []
+
+    for token in expression.postfix:
+        if not isinstance(token, str) or (
+            is_int(token) or is_float(token) or is_constant(token)
+        ):
+            value = to_number(token)
+            stack.append(math.log2(abs(value) + 1) + 1)
+            depth = max(depth, len(stack))
+            cost += 1
+        elif is_unary(token):
+            if not stack:
+                break
+            a = stack.pop()
+            if token == 'sqrt':
+                a = a / 2 + 1
+            elif token == 'log':
+                a = math.log2(a + 1) + 1
+            stack.append(a)
+            cost += 1 + a / 64
+        elif len(stack) > 1:
+            b = stack.pop()
+            a = stack.pop()
+
+            if token == '*':
+                bits = a + b
+                cost += 1 + _multiplication_cost(bits)
+            elif token == '^':
+                # The exponent has b bits, so it is at most 2 ^ b and is
+                # calculated using about b multiplications
+                bits = a * 2.0 ** min(b, 1000)
+                cost += 1 + b * _multiplication_cost(bits)
+            elif token == '/':
+                bits = DIVISION_RESULT_BITS
+                cost += 1 + (a + b) / 64
+            else:
+                bits = max(a, b) + 1
+                cost += 1 + bits / 64
+
+            stack.append(bits)
+        else:
+            break
+
+    return cost + depth
+
+
+def _evaluate_compiled(
+    expression: CompiledExpression, limits: EvaluationLimits
+) -> Union[int, float, str, Decimal]:
+    """
+    Evaluate a compiled expression. This is defined at the module level
+    so that it can be sent to a process pool.
+    """
+    return expression.evaluate(limits)
+
+
+def parse_batch(
+    strings: list,
+    language: str = None,
+    stopwords: set[str] = None,
+    limits: EvaluationLimits = None,
+    expensive_cost: float = None,
+    executor=None,
+    return_exceptions: bool = False,
+    word_cache: WordReplacementCache = None
+) -> list:
+    """
+    Parse and evaluate a list of mathematical expressions.
+
+    Expressions are evaluated in order of their ``estimate_cost()``, so
+    that a few expensive expressions do not delay the results of many
+    cheap ones. If an executor (such as a
+    ``concurrent.futures.ProcessPoolExecutor``) is provided, expressions
+    with a cost above expensive_cost are sent to it while the remaining
+    expressions are evaluated in the current thread.
 
-def extract_expression(dirty_string: str, language: str) -> str:
+    Args:
+        strings (list): The expressions to evaluate.
+
+        language (str, optional): ISO 639-2 language code for word-based
+            parsing, used for every expression.
+
+        stopwords (set[str], optional): A set of words to ignore during
+            parsing.
+
+        limits (EvaluationLimits, optional): Limits applied to each
+            expression individually.
+
+        expensive_cost (float, optional): The estimated cost above which an
+            expression is sent to the executor.
+
+        executor (optional): A ``concurrent.futures.Executor`` used to
+            evaluate expensive expressions.
+
+        return_exceptions (bool, optional): If True, an exception raised
+            while processing an expression is placed in the results in its
+            position instead of being raised.
+
+        word_cache (WordReplacementCache, optional): A cache of the result
+            of replacing words, used for every expression.
+
+    Returns:
+        list: The results, in the same order as the expressions.
+
+    Examples:
+        >>> parse_batch(['2 ^ 4', 'five plus three'], language='ENG')
+        [16, 8]
+    """
+    results = [None] * len(strings)
+    expressions = {}
+    costs = {}
+
+    for index, string in enumerate(strings):
+        try:
+            expressions[index] = compile(
+                string, language, stopwords, limits, word_cache=word_cache
+            )
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results[index] = e
+        else:
+            costs[index] = estimate_cost(expressions[index])
+
+    futures = {}
+
+    for index in sorted(costs, key=costs.get):
+        expression = expressions[index]
+
+        if (
+            executor is not None and expensive_cost is not None and
+            costs[index] > expensive_cost
+        ):
+            futures[index] = executor.submit(
+                _evaluate_compiled, expression, limits
+            )
+            continue
+
+        try:
+            results[index] = expression.evaluate(limits)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results[index] = e
+
+    for index, future in futures.items():
+        try:
+            results[index] = future.result()
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results[index] = e
+
+    return results
+
+
+def extract_expression(
+    dirty_string: str,
+    language: str,
+    slow_query_log: 'SlowQueryLog' = None
+) -> str:
     """
     Extract a mathematical expression from a sentence containing extra text.
 
@@ -796,6 +4271,10 @@ def extract_expression(dirty_string: str, language: str) -> str:
                           expression mixed with other text.
         language (str): ISO 639-2 language code to identify mathematical
                        words in the target language.
+        slow_query_log (SlowQueryLog, optional): Logs the sentence if
+                                                extracting the expression
+                                                takes longer than the
+                                                log's threshold.
 
     Returns:
         str: The extracted mathematical expression as a string.
@@ -819,8 +4298,29 @@ def extract_expression(dirty_string: str, language: str) -> str:
         - Non-mathematical words at the beginning and end are stripped
         - The language parameter is required to identify word-based math terms
     """
+    if slow_query_log is None:
+        return _extract_expression(dirty_string, language)
+
+    return slow_query_log.measure(
+        'extract_expression', dirty_string, language, lambda stages: (
+            _extract_expression(dirty_string, language, stages)
+        )
+    )
+
+
+def _extract_expression(
+    dirty_string: str, language: str, stages: _StageTimer = None
+) -> str:
+    """
+    Extract an expression from a sentence, recording the time of each
+    stage in stages if it is provided.
+    """
     tokens = tokenize(dirty_string, language)
 
+    if stages:
+        stages.token_count = len(tokens)
+        stages.finish('tokenize')
+
     start_index = 0
     end_index = len(tokens)
 
@@ -877,4 +4377,7 @@ def extract_expression(dirty_string: str, language: str) -> str:
     # Replace " . " with "." to convert "-100 . 5" to "-100.5"
     result = result.replace(' . ', '.')
 
+    if stages:
+        stages.finish('find_expression')
+
     return result
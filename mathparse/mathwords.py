@@ -7,6 +7,13 @@ BINARY_OPERATORS = {
     '^', '*', '/', '+', '-', '.'
 }
 
+# Postfix operators apply to the value or parenthesized group before them,
+# and each is the exponent that the value is raised to
+POSTFIX_OPERATORS = {
+    '²': 2,
+    '³': 3
+}
+
 # Each key is an ISO 639-2 language code
 # https://www.loc.gov/standards/iso639-2/php/code_list.php
 MATH_WORDS = {
@@ -17,7 +24,7 @@ MATH_WORDS = {
             'logaritme van': 'log'
         },
         'postfix_unary_operators': {
-            'kwadraat': '^ 2'
+            'kwadraat': '²'
         },
         'binary_operators': {
             'plus': '+',
@@ -74,8 +81,8 @@ MATH_WORDS = {
             'log of': 'log'
         },
         'postfix_unary_operators': {
-            'squared': '^ 2',
-            'cubed': '^ 3',
+            'squared': '²',
+            'cubed': '³',
         },
         'binary_operators': {
             'plus': '+',
@@ -129,8 +136,8 @@ MATH_WORDS = {
             'logarithme de': 'log'
         },
         'postfix_unary_operators': {
-            'au carré': '^ 2',
-            'au cube': '^ 3'
+            'au carré': '²',
+            'au cube': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -190,8 +197,8 @@ MATH_WORDS = {
             'Logarithmus von': 'log'
         },
         'postfix_unary_operators': {
-            'quadriert': '^ 2',
-            'hoch drei': '^ 3'
+            'quadriert': '²',
+            'hoch drei': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -250,8 +257,8 @@ MATH_WORDS = {
             'λογάριθμος του': 'log'
         },
         'postfix_unary_operators': {
-            'στο τετράγωνο': '^ 2',
-            'στον κύβο': '^ 3',
+            'στο τετράγωνο': '²',
+            'στον κύβο': '³',
         },
         'binary_operators': {
             'συν': '+', 'και': '+',
@@ -307,8 +314,8 @@ MATH_WORDS = {
             'logaritmo di': 'log'
         },
         'postfix_unary_operators': {
-            'al quadrato': '^ 2',
-            'al cubo': '^ 3'
+            'al quadrato': '²',
+            'al cubo': '³'
         },
         'binary_operators': {
             'più': '+',
@@ -363,8 +370,8 @@ MATH_WORDS = {
             'लॉगरिथम': 'log'
         },
         'postfix_unary_operators': {
-            'वर्ग': '^ 2',
-            'घन': '^ 3'
+            'वर्ग': '²',
+            'घन': '³'
         },
         'binary_operators': {
             'बेरीज': '+',
@@ -421,8 +428,8 @@ MATH_WORDS = {
             'логарифм': 'log'
         },
         'postfix_unary_operators': {
-            'в квадрате': '^ 2',
-            'в кубе': '^ 3'
+            'в квадрате': '²',
+            'в кубе': '³'
         },
         'binary_operators': {
             'плюс': '+',
@@ -484,8 +491,8 @@ MATH_WORDS = {
             'logaritmo de': 'log'
         },
         'postfix_unary_operators': {
-            'ao quadrado': '^ 2',
-            'ao cubo': '^ 3',
+            'ao quadrado': '²',
+            'ao cubo': '³',
         },
         'binary_operators': {
             'mais': '+',
@@ -540,8 +547,8 @@ MATH_WORDS = {
             'логарифм': 'log'
         },
         'postfix_unary_operators': {
-            'у квадраті': '^ 2',
-            'у кубі': '^ 3'
+            'у квадраті': '²',
+            'у кубі': '³'
         },
         'binary_operators': {
             'додати': '+',
@@ -603,8 +610,8 @@ MATH_WORDS = {
             'logaritmo de': 'log'
         },
         'postfix_unary_operators': {
-            'al cuadrado': '^ 2',
-            'al cubo': '^ 3',
+            'al cuadrado': '²',
+            'al cubo': '³',
         },
         'binary_operators': {
             'más': '+',
@@ -659,8 +666,8 @@ MATH_WORDS = {
             'ลอการิทึม': 'log'
         },
         'postfix_unary_operators': {
-            'ยกกำลังสอง': '^ 2',
-            'ยกกำลังสาม': '^ 3'
+            'ยกกำลังสอง': '²',
+            'ยกกำลังสาม': '³'
         },
         'binary_operators': {
             'บวก': '+',
@@ -717,10 +724,10 @@ MATH_WORDS = {
             '对数': 'log'
         },
         'postfix_unary_operators': {
-            '平方': '^ 2',
-            '立方': '^ 3',
-            '的平方': '^ 2',
-            '的立方': '^ 3'
+            '平方': '²',
+            '立方': '³',
+            '的平方': '²',
+            '的立方': '³'
         },
         'binary_operators': {
             '加': '+',
@@ -804,10 +811,10 @@ MATH_WORDS = {
             '負の': 'neg'
         },
         'postfix_unary_operators': {
-            '二乗': '^ 2',
-            '三乗': '^ 3',
-            'の二乗': '^ 2',
-            'の三乗': '^ 3'
+            '二乗': '²',
+            '三乗': '³',
+            'の二乗': '²',
+            'の三乗': '³'
         },
         'binary_operators': {
             'たす': '+',
@@ -868,8 +875,8 @@ MATH_WORDS = {
             '루트': 'sqrt'
         },
         'postfix_unary_operators': {
-            '제곱': '^ 2',
-            '세제곱': '^ 3'
+            '제곱': '²',
+            '세제곱': '³'
         },
         'binary_operators': {
             '더하기': '+',
@@ -929,8 +936,8 @@ MATH_WORDS = {
             'căn': 'sqrt'
         },
         'postfix_unary_operators': {
-            'bình phương': '^ 2',
-            'lập phương': '^ 3'
+            'bình phương': '²',
+            'lập phương': '³'
         },
         'binary_operators': {
             'cộng': '+',
@@ -986,8 +993,8 @@ MATH_WORDS = {
             'ऋणात्मक': 'neg'
         },
         'postfix_unary_operators': {
-            'वर्ग': '^ 2',
-            'घन': '^ 3'
+            'वर्ग': '²',
+            'घन': '³'
         },
         'binary_operators': {
             'जोड़': '+',
@@ -1046,9 +1053,9 @@ MATH_WORDS = {
             'سالب': 'neg'
         },
         'postfix_unary_operators': {
-            'تربيع': '^ 2',
-            'مكعب': '^ 3',
-            'مربع': '^ 2'
+            'تربيع': '²',
+            'مكعب': '³',
+            'مربع': '²'
         },
         'binary_operators': {
             'زائد': '+',
@@ -1107,9 +1114,9 @@ MATH_WORDS = {
             'שלילי': 'neg'
         },
         'postfix_unary_operators': {
-            'בריבוע': '^ 2',
-            'בחזקת שלוש': '^ 3',
-            'בשלישית': '^ 3'
+            'בריבוע': '²',
+            'בחזקת שלוש': '³',
+            'בשלישית': '³'
         },
         'binary_operators': {
             'פלוס': '+',
@@ -1167,8 +1174,8 @@ MATH_WORDS = {
             'negatif': 'neg'
         },
         'postfix_unary_operators': {
-            'kare': '^ 2',
-            'küp': '^ 3'
+            'kare': '²',
+            'küp': '³'
         },
         'binary_operators': {
             'artı': '+',
@@ -1226,8 +1233,8 @@ MATH_WORDS = {
             'roten ur': 'sqrt'
         },
         'postfix_unary_operators': {
-            'i kvadrat': '^ 2',
-            'i kubik': '^ 3'
+            'i kvadrat': '²',
+            'i kubik': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -1281,8 +1288,8 @@ MATH_WORDS = {
             'rot av': 'sqrt'
         },
         'postfix_unary_operators': {
-            'i andre': '^ 2',
-            'i tredje': '^ 3'
+            'i andre': '²',
+            'i tredje': '³'
         },
         'binary_operators': {
             'pluss': '+',
@@ -1336,8 +1343,8 @@ MATH_WORDS = {
             'rod af': 'sqrt'
         },
         'postfix_unary_operators': {
-            'i anden': '^ 2',
-            'i tredje': '^ 3'
+            'i anden': '²',
+            'i tredje': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -1391,8 +1398,8 @@ MATH_WORDS = {
             'juuri': 'sqrt'
         },
         'postfix_unary_operators': {
-            'toiseen': '^ 2',
-            'kolmanteen': '^ 3'
+            'toiseen': '²',
+            'kolmanteen': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -1446,8 +1453,8 @@ MATH_WORDS = {
             'pierwiastek z': 'sqrt'
         },
         'postfix_unary_operators': {
-            'do kwadratu': '^ 2',
-            'do sześcianu': '^ 3'
+            'do kwadratu': '²',
+            'do sześcianu': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -1502,8 +1509,8 @@ MATH_WORDS = {
             'odmocnina': 'sqrt'
         },
         'postfix_unary_operators': {
-            'na druhou': '^ 2',
-            'na třetí': '^ 3'
+            'na druhou': '²',
+            'na třetí': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -1557,8 +1564,8 @@ MATH_WORDS = {
             'gyök': 'sqrt'
         },
         'postfix_unary_operators': {
-            'négyzet': '^ 2',
-            'köb': '^ 3'
+            'négyzet': '²',
+            'köb': '³'
         },
         'binary_operators': {
             'plusz': '+',
@@ -1612,8 +1619,8 @@ MATH_WORDS = {
             'rădăcină pătrată din': 'sqrt'
         },
         'postfix_unary_operators': {
-            'la pătrat': '^ 2',
-            'la cub': '^ 3'
+            'la pătrat': '²',
+            'la cub': '³'
         },
         'binary_operators': {
             'plus': '+',
@@ -1666,6 +1673,10 @@ MATH_WORDS = {
 
 LANGUAGE_CODES = list(MATH_WORDS.keys())
 
+# Languages written without spaces between words, where a phrase such as
+# '乘以' can also be typed with spaces between its characters
+UNSEGMENTED_LANGUAGE_CODES = {'CHI', 'JPN', 'KOR', 'THA'}
+
 
 CONSTANTS = {
     'pi': 3.141693,
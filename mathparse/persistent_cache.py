@@ -0,0 +1,248 @@
+"""
+A cache of results that is stored in an SQLite database, so that results
+survive restarts and are shared between processes on the same host.
+"""
+from decimal import Decimal
+from fractions import Fraction
+from . import mathwords
+from .mathparse import Bytecode, CacheInfo, CompiledExpression
+import threading
+import hashlib
+import sqlite3
+import json
+
+
+def vocabulary_version() -> str:
+    """
+    Return a hash of the words, operators, constants and functions in
+    mathwords. The hash changes whenever the vocabulary changes, so that
+    results cached for a previous vocabulary can be ignored.
+    """
+    tables = [
+        mathwords.MATH_WORDS,
+        sorted(mathwords.BINARY_OPERATORS),
+        mathwords.POSTFIX_OPERATORS,
+        mathwords.CONSTANTS,
+        sorted(mathwords.UNARY_FUNCTIONS)
+    ]
+    data = json.dumps(tables, sort_keys=True, ensure_ascii=False)
+
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def _encode_result(value) -> str:
+    """
+    Encode a result as a string, using hexadecimal for integers so that
+    huge results are not limited by the number of digits that can be
+    converted to a string.
+    """
+    if isinstance(value, int):
+        return 'i{:x}'.format(value)
+    if isinstance(value, float):
+        return 'f' + repr(value)
+    if isinstance(value, Decimal):
+        return 'd' + str(value)
+    if isinstance(value, Fraction):
+        return 'q{:x}/{:x}'.format(value.numerator, value.denominator)
+    if isinstance(value, CompiledExpression):
+        return 'c' + value.to_bytecode().to_bytes().hex()
+    return 's' + str(value)
+
+
+def _decode_result(text: str):
+    kind, text = text[0], text[1:]
+
+    if kind == 'i':
+        return int(text, 16)
+    if kind == 'f':
+        return float(text)
+    if kind == 'd':
+        return Decimal(text)
+    if kind == 'q':
+        numerator, denominator = text.split('/')
+        return Fraction(int(numerator, 16), int(denominator, 16))
+    if kind == 'c':
+        bytecode = Bytecode.from_bytes(bytes.fromhex(text))
+        return CompiledExpression(
+            bytecode.to_postfix(), bytecode.numeric_mode
+        )
+    return text
+
+
+class PersistentResultCache:
+    """
+    A cache of the results of ``parse()`` that is stored in an SQLite
+    database, so that results survive restarts and are shared between
+    processes on the same host. Compiled expressions from ``compile()``
+    are stored as bytecode.
+
+    Entries are keyed by ``result_cache_key()`` and by the
+    ``vocabulary_version()`` when the cache was opened, so entries that
+    were cached for a different vocabulary are ignored. New results are
+    written in batches of batch_size, and when the database holds more
+    than maxsize entries the oldest entries are removed. Call ``close()``,
+    or use the cache as a context manager, to write the last batch.
+
+    Args:
+        path (str): The path of the database file.
+
+        maxsize (int): The maximum number of entries in the database.
+
+        batch_size (int): The number of new results that are kept in
+            memory before they are written.
+
+    Examples:
+        >>> with PersistentResultCache('results.sqlite') as cache:
+        ...     parse('five plus three', language='ENG', cache=cache)
+        8
+    """
+
+    def __init__(
+        self, path: str, maxsize: int = 100000, batch_size: int = 100
+    ):
+        if maxsize < 1:
+            raise ValueError('The maximum size must be at least 1')
+        if batch_size < 1:
+            raise ValueError('The batch size must be at least 1')
+
+        self.path = path
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.version = vocabulary_version()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False
+        )
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'version TEXT NOT NULL, '
+            'key TEXT NOT NULL, '
+            'value TEXT NOT NULL, '
+            'PRIMARY KEY (version, key))'
+        )
+        self._connection.commit()
+
+    def get(self, key: str):
+        """
+        Return the cached result for a key, or None if there is none.
+        """
+        with self._lock:
+            if key in self._pending:
+                self._hits += 1
+                return _decode_result(self._pending[key])
+
+            row = self._connection.execute(
+                'SELECT value FROM results WHERE version = ? AND key = ?',
+                (self.version, key)
+            ).fetchone()
+
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+
+        return _decode_result(row[0])
+
+    def set(self, key: str, value):
+        """
+        Cache the result for a key. The result is written to the database
+        with the rest of its batch.
+        """
+        if isinstance(value, CompiledExpression):
+            try:
+                text = _encode_result(value)
+            except ValueError:
+                # Unary functions without an opcode cannot be stored
+                return
+        else:
+            text = _encode_result(value)
+
+        with self._lock:
+            self._pending[key] = text
+
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def flush(self):
+        """
+        Write the results that have not been written to the database yet.
+        """
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+
+        with self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO results (version, key, value) '
+                'VALUES (?, ?, ?)',
+                [
+                    (self.version, key, value)
+                    for key, value in self._pending.items()
+                ]
+            )
+
+            count, = self._connection.execute(
+                'SELECT COUNT(*) FROM results'
+            ).fetchone()
+
+            if count > self.maxsize:
+                self._connection.execute(
+                    'DELETE FROM results WHERE rowid IN ('
+                    'SELECT rowid FROM results ORDER BY rowid LIMIT ?)',
+                    (count - self.maxsize,)
+                )
+                self._evictions += count - self.maxsize
+
+        self._pending.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the number of hits, misses and evictions, and the maximum
+        and current number of entries, including those not written yet.
+        """
+        with self._lock:
+            count, = self._connection.execute(
+                'SELECT COUNT(*) FROM results'
+            ).fetchone()
+
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                count + len(self._pending)
+            )
+
+    def clear(self):
+        """
+        Remove every entry from the database and reset the statistics.
+        """
+        with self._lock:
+            self._pending.clear()
+            with self._connection:
+                self._connection.execute('DELETE FROM results')
+            self._hits = self._misses = self._evictions = 0
+
+    def close(self):
+        """
+        Write any remaining results and close the database.
+        """
+        with self._lock:
+            self._flush()
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
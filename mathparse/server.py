@@ -0,0 +1,321 @@
+"""
+A long-running server that evaluates expressions sent over a local
+socket, so that programs that evaluate expressions one at a time do not
+pay for starting Python and building the word tables of a language on
+every call.
+
+Requests and responses are JSON objects, one per line:
+
+    $ python -m mathparse serve --port 8765 &
+    $ echo '{"id": 1, "expression": "five plus three", "language": "ENG"}' \\
+        | nc localhost 8765
+    {"id": 1, "result": 8, "latency_ms": 0.05}
+"""
+from . import mathparse, mathwords
+from .cli import to_json_value
+import socketserver
+import argparse
+import signal
+import socket
+import stat
+import json
+import time
+import sys
+import os
+
+
+# The longest request line that is read, in bytes
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+def warm_up(languages: list):
+    """
+    Build the patterns and tables that are used to replace and tokenize
+    the words of each language, so that the first request in a language
+    is as fast as the rest.
+    """
+    for language in languages:
+        mathparse.tokenize(mathparse.replace_words('1', language), language)
+
+
+def evaluate_request(
+    request: dict,
+    limits: mathparse.EvaluationLimits = None,
+    cache: mathparse.CacheBackend = None,
+    word_cache: mathparse.WordReplacementCache = None
+) -> dict:
+    """
+    Evaluate the expression of a request and return the response, with
+    either the result or the error that was raised. The id of the request,
+    if it has one, is copied to the response.
+    """
+    response = {}
+
+    try:
+        if not isinstance(request, dict):
+            raise ValueError('Request must be a JSON object')
+
+        if 'id' in request:
+            response['id'] = request['id']
+
+        expression = request.get('expression')
+
+        if not isinstance(expression, str):
+            raise ValueError('Request has no expression string')
+
+        stopwords = request.get('stopwords')
+
+        if stopwords is not None and not isinstance(stopwords, list):
+            raise ValueError('Request stopwords must be a list')
+
+        result = mathparse.parse(
+            expression,
+            request.get('language'),
+            set(stopwords) if stopwords else None,
+            limits,
+            request.get('numeric_mode'),
+            word_cache=word_cache,
+            cache=cache
+        )
+        response['result'] = to_json_value(result)
+    except Exception as e:
+        response['error'] = '{}: {}'.format(type(e).__name__, e)
+
+    return response
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Reads requests from a connection until it is closed, writing the
+    response to each request before reading the next.
+    """
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+
+            if not line:
+                return
+
+            started = time.perf_counter()
+
+            if len(line) > MAX_REQUEST_BYTES:
+                self.respond({
+                    'error': 'Request is longer than {} bytes'.format(
+                        MAX_REQUEST_BYTES
+                    )
+                }, started)
+                return
+
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {
+                    'error': 'Request is not valid JSON: {}'.format(e)
+                }
+            else:
+                response = evaluate_request(
+                    request,
+                    self.server.limits,
+                    self.server.cache,
+                    self.server.word_cache
+                )
+
+            self.respond(response, started)
+
+    def respond(self, response: dict, started: float):
+        response['latency_ms'] = round(
+            (time.perf_counter() - started) * 1000, 3
+        )
+
+        try:
+            data = json.dumps(response, ensure_ascii=False)
+        except ValueError as e:
+            # Integers with too many digits cannot be converted to strings
+            del response['result']
+            response['error'] = '{}: {}'.format(type(e).__name__, e)
+            data = json.dumps(response, ensure_ascii=False)
+
+        self.wfile.write(data.encode('utf-8') + b'\n')
+
+
+class _EvaluationServer:
+    """
+    The state that is shared by every connection to a server.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        address,
+        limits: mathparse.EvaluationLimits = None,
+        cache: mathparse.CacheBackend = None,
+        word_cache: mathparse.WordReplacementCache = None
+    ):
+        self.limits = limits
+        self.cache = cache
+        self.word_cache = word_cache
+        super().__init__(address, RequestHandler)
+
+
+class TCPEvaluationServer(
+    _EvaluationServer, socketserver.ThreadingTCPServer
+):
+    """
+    Serves requests over TCP, handling each connection in its own thread.
+    """
+    pass
+
+
+if hasattr(socket, 'AF_UNIX'):
+
+    class UnixEvaluationServer(
+        _EvaluationServer, socketserver.ThreadingUnixStreamServer
+    ):
+        """
+        Serves requests over a Unix socket, handling each connection in
+        its own thread.
+        """
+        pass
+
+
+def remove_stale_socket(path: str):
+    """
+    Remove the socket file at path if no server is listening on it. An
+    OSError is raised if the path is not a socket, or if another server
+    is still listening on it.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise OSError('{} exists and is not a socket'.format(path))
+
+    with socket.socket(socket.AF_UNIX) as connection:
+        try:
+            connection.connect(path)
+        except OSError:
+            # Left behind by a server that has stopped
+            os.remove(path)
+        else:
+            raise OSError(
+                'Another server is listening on {}'.format(path)
+            )
+
+
+def create_server(
+    path: str = None,
+    host: str = '127.0.0.1',
+    port: int = 0,
+    limits: mathparse.EvaluationLimits = None,
+    cache: mathparse.CacheBackend = None,
+    word_cache: mathparse.WordReplacementCache = None
+):
+    """
+    Create a server listening on a Unix socket at path or, if no path is
+    given, on a TCP port of the host. A port of 0 uses any free port,
+    which can be found from the server's server_address.
+
+    A socket file left at path by a server that has stopped is replaced,
+    but any other file at path raises an OSError.
+    """
+    if path is not None:
+        remove_stale_socket(path)
+        return UnixEvaluationServer(path, limits, cache, word_cache)
+
+    return TCPEvaluationServer((host, port), limits, cache, word_cache)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m mathparse serve',
+        description=(
+            'Evaluate requests of one JSON object per line, sent over a '
+            'Unix socket or a local TCP port.'
+        )
+    )
+    address = parser.add_mutually_exclusive_group(required=True)
+    address.add_argument('--socket', help='the path of a Unix socket')
+    address.add_argument('--port', type=int, help='a TCP port')
+    parser.add_argument(
+        '--host', default='127.0.0.1',
+        help='the address to listen on with --port (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--languages', default=','.join(mathwords.LANGUAGE_CODES),
+        help='a comma separated list of languages to prepare before '
+             'listening (default: all)'
+    )
+    parser.add_argument(
+        '--cache-size', type=int, default=10000,
+        help='the number of results to cache, or 0 to cache none '
+             '(default: 10000)'
+    )
+    parser.add_argument(
+        '--no-limits', action='store_true',
+        help='evaluate expressions without the default EvaluationLimits'
+    )
+
+    return parser
+
+
+def main(arguments: list = None) -> int:
+    """
+    Run the server until it is interrupted and return its exit status.
+    """
+    options = create_parser().parse_args(arguments)
+
+    languages = [
+        language.strip() for language in options.languages.split(',')
+        if language.strip()
+    ]
+
+    try:
+        warm_up(languages)
+    except mathwords.InvalidLanguageCodeException as e:
+        print('mathparse: {}'.format(e), file=sys.stderr)
+        return 1
+
+    cache = None
+
+    if options.cache_size > 0:
+        cache = mathparse.ResultCache(maxsize=options.cache_size)
+
+    try:
+        server = create_server(
+            options.socket,
+            options.host,
+            options.port,
+            None if options.no_limits else mathparse.EvaluationLimits(),
+            cache,
+            mathparse.WordReplacementCache(maxsize=10000)
+        )
+    except OSError as e:
+        print('mathparse: {}'.format(e), file=sys.stderr)
+        return 1
+
+    def stop(signal_number, frame):
+        raise KeyboardInterrupt
+
+    # Stop cleanly when terminated by a process manager
+    signal.signal(signal.SIGTERM, stop)
+
+    with server:
+        print('Listening on {}'.format(server.server_address), file=sys.stderr)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if options.socket is not None and os.path.exists(options.socket):
+                os.remove(options.socket)
+
+    return 0
@@ -0,0 +1,181 @@
+"""
+Logging of the calls that take longer than a threshold, with the time
+taken by each stage of the call.
+"""
+from typing import Union
+from .mathparse import _StageTimer
+import threading
+import logging
+import time
+
+
+class SlowQueryLog:
+    """
+    Logs the calls to ``parse()`` or ``extract_expression()`` that take
+    longer than a threshold, when it is passed to them as slow_query_log.
+
+    Each record includes the duration of the call, the input truncated to
+    max_input_length characters, the language, the number of tokens and
+    the time taken by each stage. The data is also attached to the record
+    as its slow_query attribute. At most max_records records are emitted
+    in each interval of seconds, so that a flood of slow inputs cannot
+    overwhelm the logs, and the number of calls that were not logged is
+    included in the next record that is.
+
+    Args:
+        threshold (float): The number of seconds above which a call is
+            logged.
+
+        logger (logging.Logger, optional): The logger to use, which
+            defaults to the 'mathparse.slow_queries' logger.
+
+        level (int): The level of the records.
+
+        max_input_length (int): The number of characters of the input
+            that are logged.
+
+        max_records (int): The number of records that can be emitted in
+            each interval.
+
+        interval (float): The length of the rate limiting interval in
+            seconds.
+
+        timer (callable): The clock used for rate limiting, which defaults
+            to ``time.monotonic()``.
+
+    Examples:
+        >>> slow_query_log = SlowQueryLog(threshold=0.05)
+        >>> parse('five plus three', 'ENG', slow_query_log=slow_query_log)
+        8
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        logger: logging.Logger = None,
+        level: int = logging.WARNING,
+        max_input_length: int = 200,
+        max_records: int = 10,
+        interval: float = 60.0,
+        timer=time.monotonic
+    ):
+        self.threshold = threshold
+        self.logger = logger or logging.getLogger('mathparse.slow_queries')
+        self.level = level
+        self.max_input_length = max_input_length
+        self.max_records = max_records
+        self.interval = interval
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._interval_started = None
+        self._records = 0
+        self._suppressed = 0
+
+    def measure(self, function_name: str, string: str, language: str, call):
+        """
+        Call a function with a _StageTimer for it to record its stages in,
+        and log the call if it takes longer than the threshold, including
+        when it raises an exception.
+        """
+        stages = _StageTimer()
+        started = stages.last
+        error = None
+
+        try:
+            return call(stages)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            seconds = time.perf_counter() - started
+
+            if seconds > self.threshold:
+                self._log(
+                    function_name, string, language, seconds, stages, error
+                )
+
+    def _allow(self) -> Union[int, None]:
+        """
+        Return the number of calls that were not logged since the last
+        record, or None if a record cannot be emitted now.
+        """
+        with self._lock:
+            now = self.timer()
+
+            if self._interval_started is None or (
+                now - self._interval_started >= self.interval
+            ):
+                self._interval_started = now
+                self._records = 0
+
+            if self._records >= self.max_records:
+                self._suppressed += 1
+                return None
+
+            self._records += 1
+            suppressed = self._suppressed
+            self._suppressed = 0
+
+            return suppressed
+
+    def _log(
+        self,
+        function_name: str,
+        string: str,
+        language: str,
+        seconds: float,
+        stages: _StageTimer,
+        error: Exception
+    ):
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        suppressed = self._allow()
+
+        if suppressed is None:
+            return
+
+        text = string
+        if len(text) > self.max_input_length:
+            text = text[:self.max_input_length] + '...'
+
+        data = {
+            'function': function_name,
+            'seconds': seconds,
+            'input': text,
+            'input_length': len(string),
+            'language': language,
+            'token_count': stages.token_count,
+            'stages': dict(stages.durations),
+            'error': repr(error) if error is not None else None,
+            'suppressed': suppressed
+        }
+
+        message = (
+            'Slow %s call took %.1f ms: %r (%d characters), language=%s, '
+            'tokens=%s, stages: %s'
+        )
+        arguments = [
+            function_name,
+            seconds * 1000,
+            text,
+            len(string),
+            language,
+            stages.token_count,
+            ', '.join(
+                '{}={:.1f} ms'.format(stage, stage_seconds * 1000)
+                for stage, stage_seconds in stages.durations.items()
+            ) or 'none'
+        ]
+
+        if error is not None:
+            message += ', raised %r'
+            arguments.append(error)
+
+        if suppressed:
+            message += ' (%d slow calls were not logged)'
+            arguments.append(suppressed)
+
+        self.logger.log(
+            self.level, message, *arguments, extra={'slow_query': data}
+        )
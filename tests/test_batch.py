@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class CompileTestCase(TestCase):
+
+    def test_compile(self):
+        expression = mathparse.compile('five plus three', language='ENG')
+
+        self.assertEqual(expression.postfix, ['5', '3', '+'])
+
+    def test_evaluate_repeatedly(self):
+        expression = mathparse.compile('2 * (3 + 4)')
+
+        self.assertEqual(expression.evaluate(), 14)
+        self.assertEqual(expression.evaluate(), 14)
+
+    def test_compile_with_limits(self):
+        limits = mathparse.EvaluationLimits(max_tokens=2)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.compile('1 + 2', limits=limits)
+
+    def test_evaluate_with_limits(self):
+        expression = mathparse.compile('10 ^ 10000000')
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            expression.evaluate(mathparse.EvaluationLimits())
+
+
+class EstimateCostTestCase(TestCase):
+
+    def test_cost_increases_with_tokens(self):
+        self.assertLess(
+            mathparse.estimate_cost('1 + 2'),
+            mathparse.estimate_cost('1 + 2 + 3 + 4 + 5')
+        )
+
+    def test_cost_increases_with_nesting(self):
+        self.assertLess(
+            mathparse.estimate_cost('1 + 2 + 3'),
+            mathparse.estimate_cost('1 + (2 + (3))')
+        )
+
+    def test_cost_increases_with_magnitude(self):
+        self.assertLess(
+            mathparse.estimate_cost('7 ^ 2'),
+            mathparse.estimate_cost('7 ^ 300000')
+        )
+
+    def test_large_exponent_is_expensive(self):
+        self.assertGreater(
+            mathparse.estimate_cost('10 ^ 10000000'),
+            mathparse.estimate_cost(' + '.join(['1'] * 10000))
+        )
+
+    def test_unbounded_cost(self):
+        cost = mathparse.estimate_cost('2 ^ (2 ^ 2000)')
+
+        self.assertEqual(cost, float('inf'))
+
+    def test_compiled_expression(self):
+        expression = mathparse.compile('five plus three', language='ENG')
+
+        self.assertEqual(
+            mathparse.estimate_cost(expression),
+            mathparse.estimate_cost('5 + 3')
+        )
+
+
+class ParseBatchTestCase(TestCase):
+
+    def test_results_in_order(self):
+        results = mathparse.parse_batch(
+            ['2 ^ 400', 'five plus three', '1 + 1'], language='ENG'
+        )
+
+        self.assertEqual(results, [2 ** 400, 8, 2])
+
+    def test_exception(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            mathparse.parse_batch(['1 + 1', 'one & two'])
+
+    def test_return_exceptions(self):
+        results = mathparse.parse_batch(
+            ['1 + 1', 'one & two', '10 ^ 10000000'],
+            limits=mathparse.EvaluationLimits(),
+            return_exceptions=True
+        )
+
+        self.assertEqual(results[0], 2)
+        self.assertIsInstance(
+            results[1], mathparse.PostfixTokenEvaluationException
+        )
+        self.assertIsInstance(
+            results[2], mathparse.EvaluationLimitException
+        )
+
+    def test_executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = mathparse.parse_batch(
+                ['7 ^ 3000', '1 + 1'],
+                expensive_cost=100,
+                executor=executor
+            )
+
+        self.assertEqual(results, [7 ** 3000, 2])
@@ -0,0 +1,144 @@
+from decimal import Context, Decimal
+from fractions import Fraction
+from unittest import TestCase
+from unittest.mock import patch
+from mathparse import mathparse, mathwords
+
+
+class BytecodeTestCase(TestCase):
+
+    def test_encoding(self):
+        bytecode = mathparse.compile('2 * (3 + 2)').to_bytecode()
+
+        self.assertEqual(bytecode.constants, (2, 3))
+        self.assertEqual(list(bytecode.code), [0, 0, 0, 1, 0, 0, 1, 3])
+
+    def test_to_postfix(self):
+        expression = mathparse.compile('five plus three', language='ENG')
+
+        self.assertEqual(
+            expression.to_bytecode().to_postfix(), expression.postfix
+        )
+
+    def test_evaluate(self):
+        bytecode = mathparse.compile('12.5 * (3 + 4)').to_bytecode()
+
+        self.assertEqual(bytecode.evaluate(), 87.5)
+
+    def test_evaluate_postfix(self):
+        bytecode = mathparse.compile('sqrt 16 * 3').to_bytecode()
+
+        self.assertEqual(mathparse.evaluate_postfix(bytecode), 12)
+
+    def test_many_constants(self):
+        string = ' + '.join(str(number) for number in range(300))
+        bytecode = mathparse.compile(string).to_bytecode()
+
+        self.assertEqual(len(bytecode.constants), 300)
+        self.assertEqual(bytecode.evaluate(), sum(range(300)))
+
+    def test_limits(self):
+        bytecode = mathparse.compile('10 ^ 10000000').to_bytecode()
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            bytecode.evaluate(mathparse.EvaluationLimits())
+
+    def test_unknown_unary_function(self):
+        with patch.dict(mathwords.UNARY_FUNCTIONS, {'cos': lambda x: x}):
+            with self.assertRaises(ValueError):
+                mathparse.Bytecode.from_postfix(['2', 'cos'])
+
+
+class BytecodeSerializationTestCase(TestCase):
+
+    def assertRoundTrip(self, expression):
+        bytecode = expression.to_bytecode()
+        data = bytecode.to_bytes()
+        loaded = mathparse.Bytecode.from_bytes(data)
+
+        self.assertEqual(data[0], mathparse.BYTECODE_VERSION)
+        self.assertEqual(loaded.to_postfix(), expression.postfix)
+        self.assertEqual(loaded.numeric_mode, expression.numeric_mode)
+        self.assertEqual(
+            repr(loaded.evaluate()), repr(expression.evaluate())
+        )
+
+    def test_words(self):
+        self.assertRoundTrip(
+            mathparse.compile('seven times nine plus 8', language='ENG')
+        )
+
+    def test_scanned_numbers(self):
+        self.assertRoundTrip(mathparse.compile('-2.5 * 4 / 3'))
+
+    def test_negative_zero(self):
+        self.assertRoundTrip(mathparse.compile('-0 / 12', language='ENG'))
+
+    def test_numeric_modes(self):
+        self.assertRoundTrip(
+            mathparse.compile('0.1 + 0.2', numeric_mode='float')
+        )
+        self.assertRoundTrip(
+            mathparse.compile('0.1 + 0.2', numeric_mode='decimal')
+        )
+        self.assertRoundTrip(
+            mathparse.compile('1 / 3 + pi', numeric_mode='fraction')
+        )
+
+    def test_decimal_context(self):
+        data = mathparse.compile(
+            '1 / 3', numeric_mode='decimal'
+        ).to_bytecode().to_bytes()
+        bytecode = mathparse.Bytecode.from_bytes(data)
+
+        self.assertEqual(
+            bytecode.evaluate(decimal_context=Context(prec=3)),
+            Decimal('0.333')
+        )
+
+    def test_from_memoryview(self):
+        bytecode = mathparse.compile('1 / 4', numeric_mode='fraction')
+        data = bytecode.to_bytecode().to_bytes()
+        view = memoryview(b'header' + data)[6:]
+
+        self.assertEqual(
+            mathparse.Bytecode.from_bytes(view).evaluate(), Fraction(1, 4)
+        )
+
+    def test_unsupported_version(self):
+        data = bytearray(mathparse.compile('1 + 1').to_bytecode().to_bytes())
+        data[0] = mathparse.BYTECODE_VERSION + 1
+
+        with self.assertRaises(ValueError):
+            mathparse.Bytecode.from_bytes(bytes(data))
+
+    def test_truncated_data(self):
+        data = mathparse.compile('12 + 3.5').to_bytecode().to_bytes()
+
+        for length in range(1, len(data)):
+            with self.assertRaises(ValueError):
+                mathparse.Bytecode.from_bytes(data[:length])
+
+    def test_unknown_opcode(self):
+        data = bytearray(mathparse.compile('1 + 1').to_bytecode().to_bytes())
+        data[-1] = 255
+
+        with self.assertRaises(ValueError):
+            mathparse.Bytecode.from_bytes(bytes(data))
+
+    def test_huge_integer_constant(self):
+        number = 10 ** 5000
+        bytecode = mathparse.Bytecode.from_postfix(
+            [number, Fraction(number, 3), '+']
+        )
+        loaded = mathparse.Bytecode.from_bytes(bytecode.to_bytes())
+
+        self.assertEqual(
+            loaded.to_postfix(), [number, Fraction(number, 3), '+']
+        )
+
+    def test_version_1(self):
+        # The integer 12 written in decimal, followed by a load opcode
+        data = bytes([1, 0, 1, 1, 2]) + b'12' + bytes([2, 0, 0])
+
+        self.assertEqual(mathparse.Bytecode.from_bytes(data).evaluate(), 12)
@@ -0,0 +1,91 @@
+import os
+import tempfile
+from fractions import Fraction
+from unittest import TestCase
+from unittest.mock import patch
+from mathparse import mathparse
+
+
+class ExpressionCatalogTestCase(TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.path = os.path.join(directory, 'expressions.catalog')
+        self.addCleanup(os.rmdir, directory)
+        self.addCleanup(os.remove, self.path)
+
+        builder = mathparse.CatalogBuilder(language='ENG')
+        builder.add('total', 'five plus three')
+        builder.add('ratio', mathparse.compile(
+            '1 / 4', numeric_mode='fraction'
+        ))
+        builder.add('power', mathparse.compile('2 ^ 10').to_bytecode())
+        builder.add('número', 'seven times nine')
+        builder.write(self.path)
+
+        self.catalog = mathparse.ExpressionCatalog(self.path)
+        self.addCleanup(self.catalog.close)
+
+    def test_length(self):
+        self.assertEqual(len(self.catalog), 4)
+
+    def test_keys(self):
+        self.assertEqual(
+            list(self.catalog), ['número', 'power', 'ratio', 'total']
+        )
+
+    def test_contains(self):
+        self.assertIn('total', self.catalog)
+        self.assertNotIn('missing', self.catalog)
+
+    def test_evaluate(self):
+        self.assertEqual(self.catalog.evaluate('total'), 8)
+        self.assertEqual(self.catalog.evaluate('power'), 1024)
+        self.assertEqual(self.catalog.evaluate('número'), 63)
+
+    def test_numeric_mode(self):
+        self.assertEqual(self.catalog.evaluate('ratio'), Fraction(1, 4))
+
+    def test_bytecode(self):
+        self.assertEqual(
+            self.catalog['total'].to_postfix(), ['5', '3', '+']
+        )
+
+    def test_missing_key(self):
+        with self.assertRaises(KeyError):
+            self.catalog['missing']
+
+    def test_replace_key(self):
+        builder = mathparse.CatalogBuilder()
+        builder.add('total', '1 + 1')
+        builder.add('total', '2 + 2')
+        builder.write(self.path)
+
+        with mathparse.ExpressionCatalog(self.path) as catalog:
+            self.assertEqual(len(catalog), 1)
+            self.assertEqual(catalog.evaluate('total'), 4)
+
+    def test_invalid_file(self):
+        path = self.path + '.invalid'
+        self.addCleanup(os.remove, path)
+
+        with open(path, 'wb') as catalog_file:
+            catalog_file.write(b'not a catalog')
+
+        with self.assertRaises(ValueError):
+            mathparse.ExpressionCatalog(path)
+
+    def test_failed_write(self):
+        builder = mathparse.CatalogBuilder()
+        builder.add('total', '1 + 1')
+
+        with patch('mathparse.catalog.os.fsync', side_effect=OSError):
+            with self.assertRaises(OSError):
+                builder.write(self.path)
+
+        self.assertEqual(
+            os.listdir(os.path.dirname(self.path)), ['expressions.catalog']
+        )
+
+        with mathparse.ExpressionCatalog(self.path) as catalog:
+            self.assertEqual(catalog.evaluate('total'), 8)
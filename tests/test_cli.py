@@ -0,0 +1,165 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import TestCase
+from mathparse import cli
+
+
+class CommandLineTestCase(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as input_file:
+            input_file.write(text)
+        return path
+
+    def run_main(self, *arguments):
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(io.StringIO()):
+            status = cli.main(list(arguments))
+        return status, [
+            json.loads(line) for line in output.getvalue().splitlines()
+        ]
+
+    def test_text(self):
+        path = self.write('input.txt', 'five plus three\n\n10 / 4\n1 / 0\n')
+
+        status, results = self.run_main(path, '--language', 'ENG')
+
+        self.assertEqual(status, 0)
+        self.assertEqual(results, [
+            {
+                'file': path, 'line': 1,
+                'expression': 'five plus three', 'result': 8
+            },
+            {
+                'file': path, 'line': 3,
+                'expression': '10 / 4', 'result': '2.5'
+            },
+            {
+                'file': path, 'line': 4,
+                'expression': '1 / 0', 'result': 'undefined'
+            },
+        ])
+
+    def test_errors(self):
+        path = self.write('input.txt', '1 +\n2 ^ 100000000\n')
+
+        status, results = self.run_main(path)
+
+        self.assertEqual(status, 0)
+        self.assertTrue(results[0]['error'].startswith(
+            'PostfixTokenEvaluationException: '
+        ))
+        self.assertTrue(results[1]['error'].startswith(
+            'EvaluationLimitException: '
+        ))
+        self.assertNotIn('result', results[0])
+
+    def test_no_limits(self):
+        path = self.write('input.txt', ' + '.join(['1'] * 600))
+
+        status, results = self.run_main(path)
+        self.assertIn('EvaluationLimitException', results[0]['error'])
+
+        status, results = self.run_main(path, '--no-limits')
+        self.assertEqual(results[0]['result'], 600)
+
+    def test_csv(self):
+        path = self.write(
+            'input.csv', 'id,question\n1,seven times six\n2\n3,"2, 3"\n'
+        )
+
+        status, results = self.run_main(
+            path, '--format', 'csv', '--column', 'question',
+            '--language', 'ENG'
+        )
+
+        self.assertEqual(results[0]['result'], 42)
+        self.assertEqual(results[1]['line'], 3)
+        self.assertIn('InputRecordException', results[1]['error'])
+        self.assertEqual(results[2]['expression'], '2, 3')
+
+    def test_csv_column_index(self):
+        path = self.write('input.csv', 'a,b\nx,2 * 4\n')
+
+        status, results = self.run_main(
+            path, '--format', 'csv', '--column', '1'
+        )
+
+        self.assertEqual(results[0]['result'], 8)
+
+    def test_missing_csv_column(self):
+        path = self.write('input.csv', 'a,b\nx,2 * 4\n')
+
+        status, results = self.run_main(
+            path, '--format', 'csv', '--column', 'c'
+        )
+
+        self.assertEqual(status, 1)
+        self.assertEqual(results, [])
+
+    def test_jsonl(self):
+        path = self.write(
+            'input.jsonl',
+            '{"q": "cinq plus trois"}\nnot json\n{"q": 5}\n{"x": "1"}\n'
+        )
+
+        status, results = self.run_main(
+            path, '--format', 'jsonl', '--field', 'q', '--language', 'FRE'
+        )
+
+        self.assertEqual(results[0]['result'], 8)
+        for result in results[1:]:
+            self.assertIsNone(result['expression'])
+            self.assertIn('InputRecordException', result['error'])
+
+    def test_stopwords(self):
+        path = self.write('input.txt', 'what is five plus three\n')
+
+        status, results = self.run_main(
+            path, '--language', 'ENG', '--stopwords', 'what, is'
+        )
+
+        self.assertEqual(results[0]['result'], 8)
+
+    def test_jobs_keep_order(self):
+        expressions = ['{} * 2'.format(number) for number in range(50)]
+        path = self.write('input.txt', '\n'.join(expressions))
+
+        status, results = self.run_main(
+            path, '--jobs', '2', '--chunk-size', '3'
+        )
+
+        self.assertEqual(
+            [result['result'] for result in results],
+            [number * 2 for number in range(50)]
+        )
+
+    def test_missing_file(self):
+        status, results = self.run_main(
+            os.path.join(self.directory, 'missing.txt')
+        )
+
+        self.assertEqual(status, 1)
+
+    def test_module(self):
+        output = subprocess.run(
+            [sys.executable, '-m', 'mathparse', '--language', 'ENG'],
+            input='five times six\n', capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.dirname(__file__))
+        )
+
+        self.assertEqual(json.loads(output.stdout), {
+            'file': '-', 'line': 1,
+            'expression': 'five times six', 'result': 30
+        })
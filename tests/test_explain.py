@@ -0,0 +1,76 @@
+from fractions import Fraction
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class ExplainTestCase(TestCase):
+
+    def test_stages(self):
+        trace = mathparse.explain('two squared plus one', language='ENG')
+
+        self.assertEqual(trace.string, 'two squared plus one')
+        self.assertEqual(trace.replaced, '2 ² + 1')
+        self.assertEqual(trace.tokens, ['2', '²', '+', '1'])
+        self.assertEqual(
+            trace.preprocessed, ['(', '2', '^', '2', ')', '+', '1']
+        )
+        self.assertEqual(trace.postfix, ['2', '2', '^', '1', '+'])
+        self.assertEqual(trace.max_stack_depth, 2)
+        self.assertEqual(trace.result, 5)
+        self.assertIsNone(trace.error)
+        self.assertEqual(list(trace.durations), [
+            'replace_words',
+            'tokenize',
+            'preprocess_unary_operators',
+            'to_postfix',
+            'evaluate_postfix',
+        ])
+
+    def test_same_result_as_parse(self):
+        for expression in [
+            '2 + 3 * 4', '10 / 4', '1 / 0', '-(2 ^ 3)', 'sqrt 16', 'pi * 2'
+        ]:
+            trace = mathparse.explain(expression)
+            self.assertEqual(trace.result, mathparse.parse(expression))
+            self.assertIsNone(trace.replaced)
+
+    def test_max_stack_depth(self):
+        trace = mathparse.explain('1 + (2 * (3 - (4 / sqrt 16)))')
+
+        self.assertEqual(trace.max_stack_depth, 5)
+
+    def test_numeric_mode(self):
+        trace = mathparse.explain('1 / 3 * 3', numeric_mode='fraction')
+
+        self.assertEqual(trace.postfix, [
+            Fraction(1), Fraction(3), '/', Fraction(3), '*'
+        ])
+        self.assertIn('to_numeric_postfix', trace.durations)
+        self.assertEqual(trace.result, Fraction(1))
+
+    def test_error(self):
+        trace = mathparse.explain('1 +')
+
+        self.assertIsInstance(
+            trace.error, mathparse.PostfixTokenEvaluationException
+        )
+        self.assertIsNone(trace.result)
+        self.assertEqual(trace.postfix, ['1', '+'])
+        self.assertNotIn('evaluate_postfix', trace.durations)
+        self.assertIn('error', repr(trace))
+
+    def test_limits(self):
+        trace = mathparse.explain(
+            '2 ^ 1000000', limits=mathparse.EvaluationLimits()
+        )
+
+        self.assertIsInstance(
+            trace.error, mathparse.EvaluationLimitException
+        )
+
+    def test_str(self):
+        text = str(mathparse.explain('cinq plus trois', language='FRE'))
+
+        self.assertIn('replaced: 5 + 3', text)
+        self.assertIn('postfix: 5 3 +', text)
+        self.assertIn('result: 8', text)
@@ -0,0 +1,133 @@
+import pickle
+from fractions import Fraction
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class ToTreeTestCase(TestCase):
+
+    def test_precedence(self):
+        tree = mathparse.parse_tree('2 + 3 * 4')
+
+        self.assertEqual(tree.operator, '+')
+        self.assertEqual(tree.right.operator, '*')
+
+    def test_left_associative(self):
+        tree = mathparse.parse_tree('8 - 4 - 2')
+
+        self.assertEqual(tree.left.operator, '-')
+        self.assertEqual(tree.right, mathparse.Operand('2'))
+
+    def test_unary_function_includes_decimal_point(self):
+        tree = mathparse.parse_tree('sqrt 2.25 * 2')
+
+        self.assertEqual(tree.operator, '*')
+        self.assertEqual(tree.left.operator, 'sqrt')
+        self.assertEqual(tree.left.operand.operator, '.')
+
+    def test_same_postfix_as_to_postfix(self):
+        expressions = [
+            '(7 * 9) + 8 - (45 + 2)',
+            '2 ^ 3 ^ 2 * 4',
+            'sqrt 16 + log 100 * pi',
+            '- (2 - 3) * 4',
+            '12 . 5 / 2 . 5',
+        ]
+
+        for string in expressions:
+            tokens = mathparse.preprocess_unary_operators(
+                mathparse.tokenize(string)
+            )
+
+            self.assertEqual(
+                mathparse.to_tree(tokens).to_postfix(),
+                mathparse.to_postfix(tokens),
+                string
+            )
+
+    def test_malformed_expressions(self):
+        for string in ['2 3', '(2', '2)', '* 2', 'sqrt', '2 +']:
+            with self.assertRaises(
+                mathparse.PostfixTokenEvaluationException
+            ):
+                mathparse.parse_tree(string)
+
+    def test_unsupported_term(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException) as e:
+            mathparse.parse_tree('1 & 2')
+
+        self.assertEqual(
+            str(e.exception), 'Unsupported mathematical term: "&"'
+        )
+
+    def test_limits(self):
+        limits = mathparse.EvaluationLimits(max_depth=1)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse_tree('((1 + 2))', limits=limits)
+
+
+class ExpressionNodeTestCase(TestCase):
+
+    def test_identical_subexpressions_are_shared(self):
+        tree = mathparse.parse_tree('(1 + 2) * (1 + 2)')
+
+        self.assertIs(tree.left, tree.right)
+
+    def test_equal_trees_are_the_same_object(self):
+        self.assertIs(
+            mathparse.parse_tree('one plus two', language='ENG'),
+            mathparse.parse_tree('1 + 2')
+        )
+
+    def test_operands_of_different_types(self):
+        self.assertIsNot(mathparse.Operand(1), mathparse.Operand(1.0))
+        self.assertIsNot(mathparse.Operand('0'), mathparse.Operand('-0'))
+
+    def test_dictionary_key(self):
+        results = {mathparse.parse_tree('1 + 2'): 3}
+
+        self.assertEqual(results[mathparse.parse_tree('1 + 2')], 3)
+
+    def test_immutable(self):
+        tree = mathparse.parse_tree('1 + 2')
+
+        with self.assertRaises(AttributeError):
+            tree.operator = '-'
+
+    def test_pickle(self):
+        tree = mathparse.parse_tree('sqrt 16 * 3')
+
+        self.assertIs(pickle.loads(pickle.dumps(tree)), tree)
+
+    def test_deep_tree(self):
+        tree = mathparse.parse_tree(' + '.join(['1'] * 5000))
+
+        self.assertEqual(mathparse.evaluate_postfix(tree), 5000)
+
+
+class TreeConsumersTestCase(TestCase):
+
+    def test_evaluate_postfix(self):
+        tree = mathparse.parse_tree('five plus three', language='ENG')
+
+        self.assertEqual(mathparse.evaluate_postfix(tree), 8)
+
+    def test_compile(self):
+        expression = mathparse.compile(mathparse.parse_tree('2 * (3 + 4)'))
+
+        self.assertEqual(expression.postfix, ['2', '3', '4', '+', '*'])
+        self.assertEqual(expression.evaluate(), 14)
+
+    def test_compile_numeric_mode(self):
+        expression = mathparse.compile(
+            mathparse.parse_tree('12 . 05 / 2'), numeric_mode='fraction'
+        )
+
+        self.assertEqual(expression.evaluate(), Fraction(241, 40))
+
+    def test_estimate_cost(self):
+        self.assertEqual(
+            mathparse.estimate_cost(mathparse.parse_tree('7 ^ 300')),
+            mathparse.estimate_cost('7 ^ 300')
+        )
@@ -0,0 +1,85 @@
+from decimal import Decimal
+from fractions import Fraction
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class EvaluateInfixTestCase(TestCase):
+
+    def test_precedence(self):
+        tokens = mathparse.tokenize('2 + 3 * 4')
+
+        self.assertEqual(mathparse.evaluate_infix(tokens), 14)
+
+    def test_parentheses(self):
+        tokens = mathparse.tokenize('(2 + 3) * 4')
+
+        self.assertEqual(mathparse.evaluate_infix(tokens), 20)
+
+    def test_unary_functions(self):
+        tokens = mathparse.preprocess_unary_operators(
+            mathparse.tokenize('sqrt 16 * 3')
+        )
+
+        self.assertEqual(mathparse.evaluate_infix(tokens), 12)
+
+    def test_division(self):
+        tokens = mathparse.tokenize('1 / 4')
+
+        self.assertEqual(mathparse.evaluate_infix(tokens), Decimal('0.25'))
+
+    def test_numeric_mode(self):
+        tokens = mathparse.join_decimal_points(mathparse.tokenize('1 / 3'))
+
+        self.assertEqual(
+            mathparse.evaluate_infix(tokens, numeric_mode='fraction'),
+            Fraction(1, 3)
+        )
+
+
+class FusedEngineTestCase(TestCase):
+
+    def test_same_results_as_postfix_engine(self):
+        expressions = [
+            ('five plus three', 'ENG'),
+            ('(seven times nine) plus 8 minus (45 plus two)', 'ENG'),
+            ('square root of sixteen times three', 'ENG'),
+            ('ten divided by zero', 'ENG'),
+            ('twelve point five times two', 'ENG'),
+            ('dos más dos', 'ESP'),
+            ('2 + 3 * 4 - 1 / 2', None),
+            ('-0 / 12', None),
+            ('pi', None),
+        ]
+
+        for string, language in expressions:
+            self.assertEqual(
+                repr(mathparse.parse(string, language, engine='fused')),
+                repr(mathparse.parse(string, language, engine='postfix')),
+                string
+            )
+
+    def test_numeric_mode(self):
+        result = mathparse.parse(
+            'one divided by three', language='ENG',
+            numeric_mode='fraction', engine='fused'
+        )
+
+        self.assertEqual(result, Fraction(1, 3))
+
+    def test_limits(self):
+        limits = mathparse.EvaluationLimits(max_depth=1)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse(
+                '((one plus two))', language='ENG',
+                limits=limits, engine='fused'
+            )
+
+    def test_invalid_term(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            mathparse.parse('one & two', language='ENG', engine='fused')
+
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            mathparse.parse('1 + 1', engine='tree')
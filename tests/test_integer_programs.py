@@ -0,0 +1,85 @@
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class ToIntegerPostfixTestCase(TestCase):
+
+    def test_integer_program(self):
+        integers = mathparse.to_integer_postfix(
+            ['40', '2', '+', '100', '*']
+        )
+
+        self.assertEqual(integers, [40, 2, '+', 100, '*'])
+
+    def test_scanned_numbers(self):
+        integers = mathparse.to_integer_postfix([-3, 2, '^', 'neg'])
+
+        self.assertEqual(integers, [-3, 2, '^', 'neg'])
+
+    def test_division(self):
+        self.assertIsNone(mathparse.to_integer_postfix(['1', '3', '/']))
+
+    def test_float(self):
+        self.assertIsNone(mathparse.to_integer_postfix([2.5, '1', '+']))
+
+    def test_decimal_point(self):
+        self.assertIsNone(mathparse.to_integer_postfix(['2', '5', '.']))
+
+    def test_constant(self):
+        self.assertIsNone(mathparse.to_integer_postfix(['pi', '2', '*']))
+
+    def test_function(self):
+        self.assertIsNone(mathparse.to_integer_postfix(['16', 'sqrt']))
+
+    def test_missing_operand(self):
+        self.assertIsNone(mathparse.to_integer_postfix(['1', '+']))
+
+    def test_extra_operand(self):
+        self.assertIsNone(mathparse.to_integer_postfix(['1', '2']))
+
+
+class EvaluateIntegerPostfixTestCase(TestCase):
+
+    def test_words(self):
+        expression = mathparse.compile(
+            'forty two times one hundred', language='ENG'
+        )
+
+        self.assertIsNotNone(expression.integer_postfix)
+        self.assertEqual(expression.evaluate(), 4200)
+
+    def test_negative(self):
+        expression = mathparse.compile(
+            'negative three times four', language='ENG'
+        )
+
+        self.assertEqual(expression.evaluate(), -12)
+
+    def test_negative_exponent(self):
+        result = mathparse.evaluate_integer_postfix(
+            [2, 2, 'neg', '^', 4, '*']
+        )
+
+        self.assertEqual(result, 1)
+        self.assertEqual(
+            result,
+            mathparse.evaluate_postfix(['2', '2', 'neg', '^', '4', '*'])
+        )
+
+    def test_power_limit(self):
+        expression = mathparse.compile('2 ^ 100000000')
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            expression.evaluate(mathparse.EvaluationLimits())
+
+    def test_division_not_classified(self):
+        expression = mathparse.compile('eight divided by two', language='ENG')
+
+        self.assertIsNone(expression.integer_postfix)
+        self.assertEqual(expression.evaluate(), 4)
+
+    def test_numeric_mode_not_classified(self):
+        expression = mathparse.compile('1 + 2', numeric_mode='float')
+
+        self.assertIsNone(expression.integer_postfix)
+        self.assertEqual(expression.evaluate(), 3.0)
@@ -0,0 +1,136 @@
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class EvaluationLimitsTestCase(TestCase):
+
+    def setUp(self):
+        self.limits = mathparse.EvaluationLimits()
+
+    def test_within_limits(self):
+        result = mathparse.parse('(2 ^ 10) + 3', limits=self.limits)
+
+        self.assertEqual(result, 1027)
+
+    def test_words_within_limits(self):
+        result = mathparse.parse(
+            'four thousand two hundred one plus five hundred',
+            language='ENG',
+            limits=self.limits
+        )
+
+        self.assertEqual(result, 4701)
+
+    def test_limit_exception_is_evaluation_exception(self):
+        self.assertTrue(issubclass(
+            mathparse.EvaluationLimitException,
+            mathparse.PostfixTokenEvaluationException
+        ))
+
+    def test_max_length(self):
+        limits = mathparse.EvaluationLimits(max_length=5)
+
+        with self.assertRaises(mathparse.EvaluationLimitException) as e:
+            mathparse.parse('1 + 2 + 3', limits=limits)
+
+        self.assertEqual(
+            str(e.exception),
+            'Expression length of 9 exceeds the limit of 5'
+        )
+
+    def test_max_tokens(self):
+        limits = mathparse.EvaluationLimits(max_tokens=3)
+
+        with self.assertRaises(mathparse.EvaluationLimitException) as e:
+            mathparse.parse('1 + 2 + 3', limits=limits)
+
+        self.assertEqual(
+            str(e.exception),
+            'Expression token count of 5 exceeds the limit of 3'
+        )
+
+    def test_max_depth(self):
+        limits = mathparse.EvaluationLimits(max_depth=2)
+
+        self.assertEqual(mathparse.parse('((1 + 2))', limits=limits), 3)
+
+        with self.assertRaises(mathparse.EvaluationLimitException) as e:
+            mathparse.parse('(((1 + 2)))', limits=limits)
+
+        self.assertEqual(
+            str(e.exception),
+            'Expression nesting depth of 3 exceeds the limit of 2'
+        )
+
+    def test_large_exponent(self):
+        with self.assertRaises(mathparse.EvaluationLimitException) as e:
+            mathparse.parse('10 ^ 10000000', limits=self.limits)
+
+        self.assertEqual(
+            str(e.exception),
+            'Result of exponentiation exceeds the limit of 100000 bits'
+        )
+
+    def test_repeated_exponent(self):
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse('9 ^ 9 ^ 9 ^ 9 ^ 9 ^ 9', limits=self.limits)
+
+    def test_large_negative_exponent_of_fraction(self):
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse('0.5 ^ -100000000', limits=self.limits)
+
+    def test_decimal_exponent(self):
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse('10 ^ (100000000 / 1)', limits=self.limits)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse('10 ^ (100000 / 1)', limits=self.limits)
+
+    def test_float_overflow(self):
+        with self.assertRaises(mathparse.EvaluationLimitException) as e:
+            mathparse.parse('10 ^ 400.5', limits=self.limits)
+
+        self.assertEqual(
+            str(e.exception),
+            'Result of exponentiation is too large to represent'
+        )
+
+    def test_small_negative_exponent(self):
+        result = mathparse.parse('2 ^ -2', limits=self.limits)
+
+        self.assertEqual(result, 0.25)
+
+    def test_max_result_bits(self):
+        limits = mathparse.EvaluationLimits(max_result_bits=16)
+
+        with self.assertRaises(mathparse.EvaluationLimitException) as e:
+            mathparse.parse('1000 * 1000', limits=limits)
+
+        self.assertEqual(
+            str(e.exception),
+            'Result size of 20 bits exceeds the limit of 16 bits'
+        )
+
+    def test_timeout(self):
+        limits = mathparse.EvaluationLimits(timeout=0)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse('1 + 2', limits=limits)
+
+    def test_disabled_limits(self):
+        limits = mathparse.EvaluationLimits(
+            max_length=None,
+            max_tokens=None,
+            max_depth=None,
+            max_result_bits=None,
+            timeout=None
+        )
+
+        result = mathparse.parse('2 ^ 200000', limits=limits)
+
+        self.assertEqual(result, 2 ** 200000)
+
+    def test_no_limits_by_default(self):
+        result = mathparse.parse('2 ^ 200000')
+
+        self.assertEqual(result, 2 ** 200000)
@@ -0,0 +1,126 @@
+from decimal import Decimal
+from unittest import TestCase
+from mathparse import mathparse
+
+
+def parse_general(string):
+    tokens = mathparse.tokenize(string)
+    tokens = mathparse.preprocess_unary_operators(tokens)
+    return mathparse.evaluate_postfix(mathparse.to_postfix(tokens))
+
+
+class NumericExpressionDetectionTestCase(TestCase):
+
+    def test_numeric_expression(self):
+        self.assertTrue(mathparse.is_numeric_expression('12.5 * (3 + 4)'))
+
+    def test_functions_and_constants(self):
+        self.assertTrue(mathparse.is_numeric_expression('sqrt 16 + pi'))
+
+    def test_non_ascii(self):
+        self.assertFalse(mathparse.is_numeric_expression('π * 2'))
+
+    def test_punctuation(self):
+        self.assertFalse(mathparse.is_numeric_expression('What is 2 + 2?'))
+
+
+class ScanNumericExpressionTestCase(TestCase):
+
+    def test_scan(self):
+        tokens = mathparse.scan_numeric_expression('12.5 * (3 + 4)')
+
+        self.assertEqual(tokens, [12.5, '*', '(', 3, '+', 4, ')'])
+
+    def test_negative_numbers(self):
+        tokens = mathparse.scan_numeric_expression('-3 - -2.5')
+
+        self.assertEqual(tokens, [-3, '-', -2.5])
+
+    def test_unary_minus(self):
+        tokens = mathparse.scan_numeric_expression('- (2) * 5 -3')
+
+        self.assertEqual(tokens, ['neg', '(', 2, ')', '*', 5, '-', 3])
+
+    def test_unsupported_words(self):
+        self.assertIsNone(mathparse.scan_numeric_expression('2 plus 2'))
+
+    def test_ambiguous_sequences(self):
+        for string in ['2pi', '-pi', 'pi-3', '2 (3)', '2 3', '--3', '3.']:
+            self.assertIsNone(mathparse.scan_numeric_expression(string))
+
+    def test_malformed_expressions(self):
+        for string in ['2 +', '(2', '2)', '* 2', 'sqrt', '']:
+            self.assertIsNone(mathparse.scan_numeric_expression(string))
+
+
+class NumericFastPathTestCase(TestCase):
+
+    def test_same_results_as_general_path(self):
+        expressions = [
+            '12.5 * (3 + 4)',
+            '2 * 3 ^ 2',
+            '2 ^ 3 ^ 2',
+            '-3.5 + 1',
+            '-0.5 * 4',
+            '10.0 / 4',
+            '3.05 - 0.95',
+            '-0 / 12',
+            '10 / 0',
+            'sqrt 16 + log 100 * pi',
+            'neg sqrt 2.25 - e',
+            '- (2 - 3) * 4',
+            '5 - - 3',
+            '2 ^ -2',
+            'pi',
+            'PI * 2',
+        ]
+
+        for string in expressions:
+            self.assertEqual(
+                repr(mathparse.parse(string)), repr(parse_general(string)),
+                string
+            )
+
+    def test_decimal_division(self):
+        result = mathparse.parse('1 / 3')
+
+        self.assertEqual(result, Decimal(1) / Decimal(3))
+
+    def test_fallback_error(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException) as e:
+            mathparse.parse('2 + 3pi')
+
+        self.assertEqual(
+            str(e.exception),
+            'Unsupported mathematical term: "3pi"'
+        )
+
+    def test_negative_constant(self):
+        self.assertEqual(mathparse.parse('2 + -pi'), mathparse.parse('2 - pi'))
+
+    def test_number_with_too_many_digits(self):
+        for string in ['9' * 5000 + ' + 1', '9' * 500 + '.5']:
+            with self.assertRaises(
+                mathparse.PostfixTokenEvaluationException
+            ):
+                mathparse.parse(string)
+
+            with self.assertRaises(
+                mathparse.PostfixTokenEvaluationException
+            ):
+                mathparse.parse(string, language='ENG')
+
+    def test_limits(self):
+        limits = mathparse.EvaluationLimits(max_depth=1)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse('((1 + 2))', limits=limits)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse('10 ^ 10000000', limits=limits)
+
+    def test_compile(self):
+        expression = mathparse.compile('12.5 * (3 + 4)')
+
+        self.assertEqual(expression.postfix, [12.5, 3, 4, '+', '*'])
+        self.assertEqual(expression.evaluate(), 87.5)
@@ -0,0 +1,273 @@
+from decimal import Context, Decimal
+from fractions import Fraction
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class FloatModeTestCase(TestCase):
+
+    def test_integers(self):
+        result = mathparse.parse('2 ^ 10', numeric_mode='float')
+
+        self.assertEqual(result, 1024.0)
+        self.assertIsInstance(result, float)
+
+    def test_division(self):
+        result = mathparse.parse('100 / 8', numeric_mode='float')
+
+        self.assertEqual(result, 12.5)
+        self.assertIsInstance(result, float)
+
+    def test_decimal_point(self):
+        result = mathparse.parse('12.5 * (3 + 4)', numeric_mode='float')
+
+        self.assertEqual(result, 87.5)
+
+    def test_words(self):
+        result = mathparse.parse(
+            'five divided by two', language='ENG', numeric_mode='float'
+        )
+
+        self.assertEqual(result, 2.5)
+
+    def test_division_by_zero(self):
+        result = mathparse.parse('10 / 0', numeric_mode='float')
+
+        self.assertEqual(result, 'undefined')
+
+
+class DecimalModeTestCase(TestCase):
+
+    def test_decimal_point(self):
+        result = mathparse.parse('0.1 + 0.2', numeric_mode='decimal')
+
+        self.assertEqual(result, Decimal('0.3'))
+
+    def test_leading_zeros(self):
+        result = mathparse.parse('3.05', numeric_mode='decimal')
+
+        self.assertEqual(result, Decimal('3.05'))
+
+    def test_negative(self):
+        result = mathparse.parse('-3.5 + 1', numeric_mode='decimal')
+
+        self.assertEqual(result, Decimal('-2.5'))
+
+    def test_context_precision(self):
+        result = mathparse.parse(
+            '1 / 3', numeric_mode='decimal', decimal_context=Context(prec=5)
+        )
+
+        self.assertEqual(result, Decimal('0.33333'))
+
+    def test_square_root(self):
+        result = mathparse.parse('sqrt 2.25', numeric_mode='decimal')
+
+        self.assertEqual(result, Decimal('1.5'))
+
+    def test_compiled_context_override(self):
+        expression = mathparse.compile(
+            '2 / 3', numeric_mode='decimal', decimal_context=Context(prec=3)
+        )
+
+        self.assertEqual(expression.evaluate(), Decimal('0.667'))
+        self.assertEqual(
+            expression.evaluate(decimal_context=Context(prec=2)),
+            Decimal('0.67')
+        )
+
+
+class FractionModeTestCase(TestCase):
+
+    def test_exact_division(self):
+        result = mathparse.parse('1 / 3 * 3', numeric_mode='fraction')
+
+        self.assertEqual(result, 1)
+        self.assertIsInstance(result, Fraction)
+
+    def test_decimal_point(self):
+        result = mathparse.parse('2.5 + 0.25', numeric_mode='fraction')
+
+        self.assertEqual(result, Fraction(11, 4))
+
+    def test_decimal_point_of_group(self):
+        result = mathparse.parse('(1 + 2) . 5', numeric_mode='fraction')
+
+        self.assertEqual(result, Fraction(7, 2))
+
+    def test_negative_exponent(self):
+        result = mathparse.parse('2 ^ -2', numeric_mode='fraction')
+
+        self.assertEqual(result, Fraction(1, 4))
+
+    def test_irrational_exponent(self):
+        result = mathparse.parse('4 ^ 0.5', numeric_mode='fraction')
+
+        self.assertEqual(result, 2)
+        self.assertIsInstance(result, Fraction)
+
+    def test_square_root(self):
+        result = mathparse.parse('sqrt 16', numeric_mode='fraction')
+
+        self.assertEqual(result, 4)
+        self.assertIsInstance(result, Fraction)
+
+    def test_square_root_of_large_value(self):
+        result = mathparse.parse('sqrt (10 ^ 400)', numeric_mode='fraction')
+
+        self.assertEqual(result, 10 ** 200)
+
+    def test_logarithm_of_large_value(self):
+        result = mathparse.parse(
+            'log (10 ^ 400)',
+            numeric_mode='fraction',
+            limits=mathparse.EvaluationLimits()
+        )
+
+        self.assertEqual(result, 400)
+
+    def test_square_root_of_fraction(self):
+        result = mathparse.parse('sqrt (9 / 4)', numeric_mode='fraction')
+
+        self.assertEqual(result, Fraction(3, 2))
+
+    def test_fraction_power_limit(self):
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse(
+                '(1 / 3) ^ 1000000',
+                numeric_mode='fraction',
+                limits=mathparse.EvaluationLimits()
+            )
+
+    def test_integers_kept_until_division(self):
+        expression = mathparse.compile('12 * (3 + 4)', numeric_mode='fraction')
+
+        self.assertEqual(
+            [type(token) for token in expression.postfix],
+            [int, int, int, str, str]
+        )
+
+    def test_integer_result(self):
+        result = mathparse.parse('12 * (3 + 4)', numeric_mode='fraction')
+
+        self.assertEqual(result, 84)
+        self.assertIsInstance(result, Fraction)
+
+    def test_exact_division_of_integers(self):
+        result = mathparse.parse(
+            '1000000 / 3 / 7 / 11 * 231', numeric_mode='fraction'
+        )
+
+        self.assertEqual(result, 1000000)
+
+    def test_negative_power_of_integer_limit(self):
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse(
+                '3 ^ -1000000',
+                numeric_mode='fraction',
+                limits=mathparse.EvaluationLimits()
+            )
+
+    def test_division_by_zero(self):
+        result = mathparse.parse('1 / 0', numeric_mode='fraction')
+
+        self.assertEqual(result, 'undefined')
+
+    def test_undefined_operand(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            mathparse.parse('(1 / 0) * 2', numeric_mode='fraction')
+
+
+class FromFractionTestCase(TestCase):
+
+    def test_integer(self):
+        result = mathparse.from_fraction(Fraction(84))
+
+        self.assertEqual(result, 84)
+        self.assertIsInstance(result, int)
+
+    def test_decimal(self):
+        result = mathparse.from_fraction(
+            Fraction(1, 3), decimal_context=Context(prec=5)
+        )
+
+        self.assertEqual(result, Decimal('0.33333'))
+
+    def test_float(self):
+        result = mathparse.from_fraction(Fraction(1, 4), numeric_mode='float')
+
+        self.assertEqual(result, 0.25)
+        self.assertIsInstance(result, float)
+
+    def test_undefined(self):
+        self.assertEqual(mathparse.from_fraction('undefined'), 'undefined')
+
+
+class UndefinedResultTestCase(TestCase):
+
+    def assert_undefined(self, string):
+        for numeric_mode in mathparse.NUMERIC_MODES:
+            with self.subTest(numeric_mode=numeric_mode):
+                result = mathparse.parse(string, numeric_mode=numeric_mode)
+
+                self.assertEqual(result, 'undefined')
+
+    def test_negative_power_of_zero(self):
+        self.assert_undefined('0 ^ -1')
+
+    def test_square_root_of_negative_number(self):
+        self.assert_undefined('sqrt (0 - 4)')
+
+    def test_logarithm_of_zero(self):
+        self.assert_undefined('log 0')
+
+    def test_fractional_power_of_negative_number(self):
+        self.assert_undefined('(0 - 8) ^ 0.5')
+
+    def test_zero_to_the_power_of_zero(self):
+        for numeric_mode in mathparse.NUMERIC_MODES:
+            with self.subTest(numeric_mode=numeric_mode):
+                result = mathparse.parse('0 ^ 0', numeric_mode=numeric_mode)
+
+                self.assertEqual(result, 1)
+
+    def test_float_overflow(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            mathparse.parse('10 ^ 400', numeric_mode='float')
+
+    def test_undefined_operand(self):
+        for numeric_mode in mathparse.NUMERIC_MODES:
+            with self.subTest(numeric_mode=numeric_mode):
+                with self.assertRaises(
+                    mathparse.PostfixTokenEvaluationException
+                ):
+                    mathparse.parse(
+                        'sqrt (1 / 0)', numeric_mode=numeric_mode
+                    )
+
+
+class NumericModeTestCase(TestCase):
+
+    def test_operands_converted_when_compiled(self):
+        expression = mathparse.compile(
+            '12.5 * (3 + 4)', numeric_mode='fraction'
+        )
+
+        self.assertEqual(
+            expression.postfix,
+            [Fraction(25, 2), Fraction(3), Fraction(4), '+', '*']
+        )
+
+    def test_evaluate_postfix_strings(self):
+        result = mathparse.evaluate_postfix(
+            ['1', '3', '/'], numeric_mode='fraction'
+        )
+
+        self.assertEqual(result, Fraction(1, 3))
+
+    def test_invalid_numeric_mode(self):
+        with self.assertRaises(ValueError):
+            mathparse.parse('1 + 1', numeric_mode='complex')
+
+    def test_square_root_of_decimal_number(self):
+        self.assertEqual(mathparse.parse('sqrt 2.25'), 1.5)
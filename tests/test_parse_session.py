@@ -0,0 +1,115 @@
+from fractions import Fraction
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class ParseSessionTestCase(TestCase):
+
+    def test_update(self):
+        session = mathparse.ParseSession()
+
+        self.assertEqual(session.update('12 * 3'), 36)
+        self.assertEqual(session.update('12 * 34'), 408)
+
+    def test_append(self):
+        session = mathparse.ParseSession()
+        session.update('2 ^ 10')
+
+        self.assertEqual(session.append(' + 3'), 2 ** 13)
+        self.assertEqual(session.string, '2 ^ 10 + 3')
+
+    def test_typing(self):
+        session = mathparse.ParseSession()
+        string = '(12.5 * 4 - sqrt 16) / 2'
+
+        for end in range(1, len(string) + 1):
+            try:
+                session.update(string[:end])
+            except Exception:
+                pass
+
+        self.assertEqual(session.update(string), mathparse.parse(string))
+
+    def test_edit_in_middle(self):
+        session = mathparse.ParseSession()
+        session.update('1 + 2 * 3 + 4')
+
+        self.assertEqual(session.update('1 + 5 * 3 + 4'), 20)
+
+    def test_delete(self):
+        session = mathparse.ParseSession()
+        session.update('100 + 25')
+
+        self.assertEqual(session.update('100 + 2'), 102)
+
+    def test_tokens(self):
+        session = mathparse.ParseSession()
+        session.update('12 * 3')
+        session.append('4')
+
+        self.assertEqual(session.tokens, [12, '*', 34])
+
+    def test_incomplete_expression(self):
+        session = mathparse.ParseSession()
+
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            session.update('12 +')
+
+        self.assertEqual(session.append(' 3'), 15)
+
+    def test_switch_to_general_tokenizer(self):
+        session = mathparse.ParseSession()
+        session.update('2 * 3')
+
+        self.assertEqual(session.update('2 * 3 * π'), 6 * 3.141693)
+        self.assertEqual(session.update('2 * 3'), 6)
+
+    def test_words(self):
+        session = mathparse.ParseSession(language='ENG')
+        session.update('five plus three')
+
+        self.assertEqual(session.append(' times two'), 11)
+
+    def test_numeric_mode(self):
+        session = mathparse.ParseSession(numeric_mode='fraction')
+        session.update('1 / 3')
+
+        self.assertEqual(session.append(' + 0.5'), Fraction(5, 6))
+
+    def test_limits(self):
+        session = mathparse.ParseSession(
+            limits=mathparse.EvaluationLimits(max_depth=1)
+        )
+        session.update('(1 + 2)')
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            session.update('(1 + (2))')
+
+
+class InfixEvaluatorTestCase(TestCase):
+
+    def test_result_does_not_change_state(self):
+        evaluator = mathparse.InfixEvaluator()
+
+        for token in [2, '*', 3]:
+            evaluator.push(token)
+
+        self.assertEqual(evaluator.result(), 6)
+
+        for token in ['+', 4]:
+            evaluator.push(token)
+
+        self.assertEqual(evaluator.result(), 10)
+
+    def test_save_and_restore(self):
+        evaluator = mathparse.InfixEvaluator()
+        evaluator.push(2)
+        evaluator.push('*')
+        state = evaluator.save()
+
+        evaluator.push(3)
+        self.assertEqual(evaluator.result(), 6)
+
+        evaluator.restore(state)
+        evaluator.push(5)
+        self.assertEqual(evaluator.result(), 10)
@@ -0,0 +1,182 @@
+import os
+import subprocess
+import sys
+import tempfile
+from decimal import Decimal
+from fractions import Fraction
+from unittest import TestCase, mock
+from mathparse import mathparse, persistent_cache
+
+
+class PersistentResultCacheTestCase(TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'results.sqlite')
+
+        self.cache = mathparse.PersistentResultCache(self.path, batch_size=2)
+        self.addCleanup(self.cache.close)
+
+    def test_hit(self):
+        first = mathparse.parse(
+            'five plus three', language='ENG', cache=self.cache
+        )
+        second = mathparse.parse(
+            'five  plus three', language='ENG', cache=self.cache
+        )
+
+        self.assertEqual(first, 8)
+        self.assertEqual(second, 8)
+        self.assertEqual(
+            self.cache.cache_info(),
+            mathparse.CacheInfo(1, 1, 0, 100000, 1)
+        )
+
+    def test_key_includes_arguments(self):
+        mathparse.parse('1 / 4', cache=self.cache)
+        result = mathparse.parse(
+            '1 / 4', numeric_mode='fraction', cache=self.cache
+        )
+
+        self.assertEqual(result, Fraction(1, 4))
+        self.assertEqual(self.cache.cache_info().misses, 2)
+
+    def test_result_types(self):
+        results = {
+            'a': 2 ** 20000,
+            'b': -7,
+            'c': 0.1,
+            'd': Decimal('0.3333333333333333333333333333'),
+            'e': Fraction(-1, 3),
+            'f': 'undefined',
+        }
+
+        for key, value in results.items():
+            self.cache.set(key, value)
+        self.cache.flush()
+
+        with mathparse.PersistentResultCache(self.path) as cache:
+            for key, value in results.items():
+                self.assertEqual(cache.get(key), value)
+                self.assertIs(type(cache.get(key)), type(value))
+
+    def test_survives_restart(self):
+        mathparse.parse('2 ^ 10', cache=self.cache)
+        self.cache.close()
+
+        with mathparse.PersistentResultCache(self.path) as cache:
+            key = mathparse.result_cache_key('2 ^ 10')
+            self.assertEqual(cache.get(key), 1024)
+
+    def test_writes_are_batched(self):
+        self.cache.set('a', 1)
+
+        with mathparse.PersistentResultCache(self.path) as cache:
+            self.assertIsNone(cache.get('a'))
+
+        self.cache.set('b', 2)
+
+        with mathparse.PersistentResultCache(self.path) as cache:
+            self.assertEqual(cache.get('a'), 1)
+            self.assertEqual(cache.get('b'), 2)
+
+    def test_oldest_entries_are_removed(self):
+        with mathparse.PersistentResultCache(
+            self.path, maxsize=3, batch_size=1
+        ) as cache:
+            for key in 'abcde':
+                cache.set(key, 1)
+
+            info = cache.cache_info()
+            self.assertEqual(info.evictions, 2)
+            self.assertEqual(info.currsize, 3)
+            self.assertIsNone(cache.get('a'))
+            self.assertEqual(cache.get('e'), 1)
+
+    def test_other_vocabulary_is_ignored(self):
+        self.cache.set('a', 1)
+        self.cache.close()
+
+        with mock.patch.object(
+            persistent_cache, 'vocabulary_version', return_value='other'
+        ):
+            with mathparse.PersistentResultCache(self.path) as cache:
+                self.assertIsNone(cache.get('a'))
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            mathparse.parse('1 +', cache=self.cache)
+
+        self.assertEqual(self.cache.cache_info().currsize, 0)
+
+    def test_shared_between_processes(self):
+        self.cache.set('shared', 42)
+        self.cache.flush()
+
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys\n'
+            'from mathparse import mathparse\n'
+            'with mathparse.PersistentResultCache(sys.argv[1]) as cache:\n'
+            '    print(cache.get("shared"))\n',
+            self.path
+        ], cwd=os.path.dirname(os.path.dirname(__file__)))
+
+        self.assertEqual(output.strip(), b'42')
+
+    def test_sqlite_is_imported_when_used(self):
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys\n'
+            'from mathparse import mathparse\n'
+            'print("sqlite3" in sys.modules)\n'
+            'mathparse.PersistentResultCache\n'
+            'print("sqlite3" in sys.modules)\n'
+        ], cwd=os.path.dirname(os.path.dirname(__file__)))
+
+        self.assertEqual(output.split(), [b'False', b'True'])
+
+    def test_clear(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.clear()
+
+        self.assertEqual(
+            self.cache.cache_info(),
+            mathparse.CacheInfo(0, 0, 0, 100000, 0)
+        )
+
+
+class VocabularyVersionTestCase(TestCase):
+
+    def test_changes_with_vocabulary(self):
+        version = mathparse.vocabulary_version()
+
+        with mock.patch.dict(mathparse.mathwords.CONSTANTS, {'tau': 6.28}):
+            self.assertNotEqual(mathparse.vocabulary_version(), version)
+
+        self.assertEqual(mathparse.vocabulary_version(), version)
+
+
+class PersistentCompiledExpressionTestCase(TestCase):
+
+    def test_compiled_expression(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'results.sqlite')
+
+        with mathparse.PersistentResultCache(path) as cache:
+            mathparse.compile(
+                'one divided by three', 'ENG', numeric_mode='fraction',
+                cache=cache
+            )
+
+        with mathparse.PersistentResultCache(path) as cache:
+            expression = mathparse.compile(
+                'one divided by three', 'ENG', numeric_mode='fraction',
+                cache=cache
+            )
+
+            self.assertEqual(cache.cache_info().hits, 1)
+            self.assertEqual(expression.evaluate(), Fraction(1, 3))
@@ -21,22 +21,20 @@ class EnglishWordTokenTestCase(TestCase):
             'five thousand + 30', language='ENG'
         )
 
-        # Note: this ends up with double parentheses because it is both a
-        # scaled number ("thousand") and a word group ("five thousand")
-        self.assertEqual(result, '(5 * 1000) + 30')
+        self.assertEqual(result, '5000 + 30')
 
     def test_double_digit_multiplier_for_scale(self):
         result = mathparse.replace_word_tokens(
             'fifty thousand + 1', language='ENG'
         )
 
-        self.assertEqual(result, '(50 * 1000) + 1')
+        self.assertEqual(result, '50000 + 1')
 
     def test_numeric_values_with_squared_word_operator(self):
         result = mathparse.replace_word_tokens(
             '10 plus 2 squared times 3', language='ENG'
         )
-        self.assertEqual(result, '10 + (2 ^ 2) * 3')
+        self.assertEqual(result, '10 + 2 ² * 3')
 
     def test_numeric_values_with_squared_unary_operator(self):
         result = mathparse.replace_word_tokens(
@@ -68,7 +66,7 @@ class EnglishWordTokenTestCase(TestCase):
         result = mathparse.replace_word_tokens(
             'one hundred times fifty four', language='ENG'
         )
-        self.assertEqual(result, '(1 * 100) * (50 + 4)')
+        self.assertEqual(result, '100 * (50 + 4)')
 
     def test_tens_with_hundreds_multiplier(self):
         result = mathparse.replace_word_tokens(
@@ -76,10 +74,81 @@ class EnglishWordTokenTestCase(TestCase):
             language='ENG',
             stopwords={'and'}
         )
-        self.assertEqual(result, '(18 * 100) + (20 + 1)')
+        self.assertEqual(result, '1821')
 
     def test_hyphenated_numbers(self):
         result = mathparse.replace_word_tokens(
             'one hundred times fifty-four', language='ENG'
          )
-        self.assertEqual(result, '(1 * 100) * (50 + 4)')
+        self.assertEqual(result, '100 * (50 + 4)')
+
+    def test_number_phrase(self):
+        result = mathparse.replace_word_tokens(
+            'three thousand six hundred two', language='ENG'
+        )
+        self.assertEqual(result, '3602')
+
+    def test_number_phrase_with_digits(self):
+        result = mathparse.replace_word_tokens(
+            '5 million 200 thousand', language='ENG'
+        )
+        self.assertEqual(result, '5200000')
+
+    def test_number_phrase_with_compound_numbers(self):
+        result = mathparse.replace_word_tokens(
+            'twenty one thousand three hundred forty five', language='ENG'
+        )
+        self.assertEqual(result, '21345')
+
+    def test_consecutive_scales(self):
+        result = mathparse.replace_word_tokens(
+            'two hundred thousand', language='ENG'
+        )
+        self.assertEqual(result, '200000')
+
+    def test_decimal_number_phrase(self):
+        result = mathparse.parse('two point five million', language='ENG')
+        self.assertEqual(result, 2500000)
+
+    def test_decimal_number_phrase_in_expression(self):
+        result = mathparse.parse(
+            'two point five thousand plus one', language='ENG'
+        )
+        self.assertEqual(result, 2501)
+
+    def test_phrase_does_not_start_after_decimal_point(self):
+        result = mathparse.replace_number_phrases(
+            '(1 + 2) . 5 thousand', {'thousand': 1000}
+        )
+        self.assertEqual(result, '(1 + 2) . 5 thousand')
+
+
+class NumberWordTestCase(TestCase):
+
+    def test_hyphenated_number_word(self):
+        result = mathparse.replace_word_tokens('dix-neuf plus un', 'FRE')
+
+        self.assertEqual(result, '19 + 1')
+
+    def test_number_word_with_spaces(self):
+        result = mathparse.replace_word_tokens('on beş artı on', 'TUR')
+
+        self.assertEqual(result, '15 + 10')
+
+    def test_non_ascii_number_words(self):
+        result = mathparse.replace_word_tokens('שלושה עשר פעמים ארבע', 'HEB')
+
+        self.assertEqual(result, '13 * 4')
+
+    def test_partial_words_are_not_replaced(self):
+        result = mathparse.replace_word_tokens('nine nineteens', 'ENG')
+
+        self.assertEqual(result, '9 nineteens')
+
+    def test_pattern_is_cached(self):
+        numbers = {'one': 1, 'two': 2}
+
+        self.assertIs(
+            mathparse.number_word_pattern(numbers),
+            mathparse.number_word_pattern(dict(numbers))
+        )
@@ -0,0 +1,195 @@
+from decimal import localcontext
+from fractions import Fraction
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class ResultCacheTestCase(TestCase):
+
+    def test_parse(self):
+        cache = mathparse.ResultCache()
+
+        for _ in range(2):
+            result = mathparse.parse(
+                'two to the power of twenty', language='ENG', cache=cache
+            )
+            self.assertEqual(result, 1048576)
+
+        self.assertEqual(cache.cache_info(), mathparse.CacheInfo(
+            1, 1, 0, 1024, 1
+        ))
+
+    def test_compile(self):
+        cache = mathparse.ResultCache()
+
+        first = mathparse.compile('five plus three', 'ENG', cache=cache)
+        second = mathparse.compile('five plus three', 'ENG', cache=cache)
+        result = mathparse.parse('five plus three', 'ENG', cache=cache)
+
+        self.assertIs(first, second)
+        self.assertEqual(result, 8)
+        self.assertEqual(len(cache), 2)
+
+    def test_least_recently_used(self):
+        cache = mathparse.ResultCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.cache_info().evictions, 1)
+
+    def test_least_frequently_used(self):
+        cache = mathparse.ResultCache(maxsize=2, policy='lfu')
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        cache.set('c', 3)
+        cache.set('d', 4)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(cache.get('d'), 4)
+
+    def test_byte_limit(self):
+        cache = mathparse.ResultCache(maxbytes=4000)
+        cache.set('small', 1)
+        cache.set('large', 2 ** 50000)
+
+        self.assertIsNone(cache.get('large'))
+        self.assertEqual(cache.get('small'), 1)
+
+        for index in range(100):
+            cache.set(str(index), 2 ** 2000)
+
+        self.assertLessEqual(cache.currbytes, 4000)
+        self.assertLess(len(cache), 20)
+        self.assertEqual(cache.get('99'), 2 ** 2000)
+
+    def test_replace_entry(self):
+        cache = mathparse.ResultCache(maxbytes=10000)
+        cache.set('a', 2 ** 2000)
+        size = cache.currbytes
+        cache.set('a', 2 ** 2000)
+
+        self.assertEqual(cache.currbytes, size)
+        self.assertEqual(len(cache), 1)
+
+    def test_ttl(self):
+        clock = Clock()
+        cache = mathparse.ResultCache(ttl=10, timer=clock)
+        cache.set('a', 1)
+
+        clock.now = 9
+        self.assertEqual(cache.get('a'), 1)
+
+        clock.now = 10
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.cache_info().evictions, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_ttl_with_lfu(self):
+        clock = Clock()
+        cache = mathparse.ResultCache(
+            maxsize=2, ttl=10, policy='lfu', timer=clock
+        )
+        cache.set('a', 1)
+        cache.get('a')
+        clock.now = 10
+        cache.get('a')
+        cache.set('b', 2)
+        cache.set('c', 3)
+
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            mathparse.ResultCache(maxsize=0)
+
+        with self.assertRaises(ValueError):
+            mathparse.ResultCache(policy='fifo')
+
+    def test_clear(self):
+        cache = mathparse.ResultCache(policy='lfu')
+        cache.set('a', 1)
+        cache.clear()
+        cache.set('b', 2)
+
+        self.assertEqual(cache.currbytes, mathparse.approximate_size(
+            'b'
+        ) + mathparse.approximate_size(2))
+        self.assertEqual(len(cache), 1)
+
+
+class CustomBackendTestCase(TestCase):
+
+    def test_dictionary_backend(self):
+
+        class DictionaryCache(dict):
+
+            def set(self, key, value):
+                self[key] = value
+
+        cache = DictionaryCache()
+        mathparse.parse('1 / 3', numeric_mode='fraction', cache=cache)
+        mathparse.compile('1 / 3', cache=cache)
+
+        key = mathparse.result_cache_key('1 / 3', numeric_mode='fraction')
+        self.assertEqual(cache[key], Fraction(1, 3))
+        self.assertEqual(len(cache), 2)
+
+    def test_limits_checked_on_hit(self):
+        cache = mathparse.ResultCache()
+        mathparse.parse('2 ^ 5000', cache=cache)
+
+        with self.assertRaises(mathparse.EvaluationLimitException):
+            mathparse.parse(
+                '2 ^ 5000',
+                limits=mathparse.EvaluationLimits(max_result_bits=64),
+                cache=cache
+            )
+
+    def test_decimal_precision_in_key(self):
+        cache = mathparse.ResultCache()
+        default = mathparse.parse('1 / 3', numeric_mode='decimal', cache=cache)
+
+        with localcontext() as context:
+            context.prec = 50
+            result = mathparse.parse(
+                '1 / 3', numeric_mode='decimal', cache=cache
+            )
+
+        self.assertEqual(len(str(default)), 30)
+        self.assertEqual(len(str(result)), 52)
+
+
+class ApproximateSizeTestCase(TestCase):
+
+    def test_grows_with_value(self):
+        self.assertGreater(
+            mathparse.approximate_size(2 ** 8000),
+            mathparse.approximate_size(2 ** 80)
+        )
+        self.assertGreater(
+            mathparse.approximate_size(Fraction(2 ** 8000, 3)),
+            mathparse.approximate_size(Fraction(1, 3))
+        )
+        self.assertGreater(
+            mathparse.approximate_size(mathparse.compile('1 + 2 + 3 + 4')),
+            mathparse.approximate_size(mathparse.compile('1 + 2'))
+        )
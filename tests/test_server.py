@@ -0,0 +1,195 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+from unittest import TestCase, skipUnless
+from mathparse import mathparse, server
+
+
+class EvaluationServerTestCase(TestCase):
+
+    def start(self, **kwargs):
+        evaluation_server = server.create_server(**kwargs)
+        thread = threading.Thread(
+            target=evaluation_server.serve_forever, args=(0.05, )
+        )
+        thread.start()
+
+        def stop():
+            evaluation_server.shutdown()
+            thread.join()
+            evaluation_server.server_close()
+
+        self.addCleanup(stop)
+        return evaluation_server
+
+    def connect(self, evaluation_server):
+        if evaluation_server.address_family == socket.AF_INET:
+            connection = socket.create_connection(
+                evaluation_server.server_address
+            )
+        else:
+            connection = socket.socket(socket.AF_UNIX)
+            connection.connect(evaluation_server.server_address)
+
+        self.addCleanup(connection.close)
+        return connection
+
+    def send(self, connection, *lines):
+        connection.sendall(''.join(
+            line + '\n' for line in lines
+        ).encode('utf-8'))
+        responses = connection.makefile('r', encoding='utf-8')
+        return [json.loads(responses.readline()) for _ in lines]
+
+    def test_requests(self):
+        evaluation_server = self.start(
+            cache=mathparse.ResultCache(),
+            word_cache=mathparse.WordReplacementCache()
+        )
+        connection = self.connect(evaluation_server)
+
+        responses = self.send(
+            connection,
+            json.dumps({
+                'id': 1, 'expression': 'five plus three', 'language': 'ENG'
+            }),
+            json.dumps({'id': 'b', 'expression': '1 / 3',
+                        'numeric_mode': 'fraction'}),
+            json.dumps({
+                'expression': 'what is five plus three', 'language': 'ENG',
+                'stopwords': ['what', 'is']
+            }),
+        )
+
+        self.assertEqual(responses[0]['id'], 1)
+        self.assertEqual(responses[0]['result'], 8)
+        self.assertEqual(responses[1]['result'], '1/3')
+        self.assertEqual(responses[2]['result'], 8)
+        for response in responses:
+            self.assertGreaterEqual(response['latency_ms'], 0)
+
+    def test_errors(self):
+        evaluation_server = self.start()
+        connection = self.connect(evaluation_server)
+
+        responses = self.send(
+            connection,
+            'not json',
+            '[1, 2]',
+            json.dumps({'id': 3}),
+            json.dumps({'id': 4, 'expression': '1 +'}),
+            json.dumps({'expression': '1', 'stopwords': 'what'}),
+            json.dumps({'expression': '2 + 2'}),
+        )
+
+        self.assertIn('not valid JSON', responses[0]['error'])
+        self.assertIn('JSON object', responses[1]['error'])
+        self.assertEqual(responses[2]['id'], 3)
+        self.assertIn('no expression', responses[2]['error'])
+        self.assertIn(
+            'PostfixTokenEvaluationException', responses[3]['error']
+        )
+        self.assertIn('stopwords', responses[4]['error'])
+        self.assertEqual(responses[5]['result'], 4)
+
+    def test_limits(self):
+        evaluation_server = self.start(limits=mathparse.EvaluationLimits())
+        connection = self.connect(evaluation_server)
+
+        response, = self.send(
+            connection, json.dumps({'expression': '10 ^ 10000000'})
+        )
+
+        self.assertIn('EvaluationLimitException', response['error'])
+
+    def test_concurrent_connections(self):
+        evaluation_server = self.start(cache=mathparse.ResultCache())
+        results = {}
+
+        def request(number):
+            connection = socket.create_connection(
+                evaluation_server.server_address
+            )
+            with connection:
+                response, = self.send(connection, json.dumps({
+                    'expression': '{} * 2'.format(number)
+                }))
+            results[number] = response['result']
+
+        threads = [
+            threading.Thread(target=request, args=(number, ))
+            for number in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {number: number * 2 for number in range(8)})
+
+    @skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are unavailable')
+    def test_unix_socket(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'mathparse.sock')
+
+        evaluation_server = self.start(path=path)
+        connection = self.connect(evaluation_server)
+
+        response, = self.send(connection, json.dumps({
+            'expression': 'seven times six', 'language': 'ENG'
+        }))
+
+        self.assertEqual(response['result'], 42)
+
+    @skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are unavailable')
+    def test_stale_unix_socket(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'mathparse.sock')
+
+        with socket.socket(socket.AF_UNIX) as stale:
+            stale.bind(path)
+
+        evaluation_server = self.start(path=path)
+        connection = self.connect(evaluation_server)
+
+        response, = self.send(connection, json.dumps({'expression': '1 + 1'}))
+
+        self.assertEqual(response['result'], 2)
+
+    @skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are unavailable')
+    def test_socket_in_use(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'mathparse.sock')
+
+        self.start(path=path)
+
+        with self.assertRaises(OSError):
+            server.create_server(path=path)
+
+        self.assertTrue(os.path.exists(path))
+
+    def test_path_is_not_a_socket(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'results.txt')
+
+        with open(path, 'w') as existing_file:
+            existing_file.write('keep')
+
+        with self.assertRaises(OSError):
+            server.create_server(path=path)
+
+        with open(path) as existing_file:
+            self.assertEqual(existing_file.read(), 'keep')
+
+
+class WarmUpTestCase(TestCase):
+
+    def test_invalid_language(self):
+        with self.assertRaises(server.mathwords.InvalidLanguageCodeException):
+            server.warm_up(['XYZ'])
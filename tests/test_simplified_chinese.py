@@ -165,3 +165,17 @@ class SimplifiedChineseTestCase(TestCase):
         result = mathparse.parse('二立方', language='CHI')
 
         self.assertEqual(result, 8)
+
+    def test_digits_without_scales(self):
+        result = mathparse.parse('一九八四加一', language='CHI')
+
+        self.assertEqual(result, 1985)
+
+    def test_many_scales(self):
+        result = mathparse.replace_word_tokens_simplified_chinese('十' * 5000)
+
+        self.assertEqual(result, '10 ')
+
+    def test_number_with_too_many_digits(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            mathparse.parse('九' * 5000, language='CHI')
@@ -0,0 +1,141 @@
+import logging
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowQueryLogTestCase(TestCase):
+
+    def setUp(self):
+        self.logger = logging.getLogger('tests.slow_queries')
+        self.clock = Clock()
+        self.log = mathparse.SlowQueryLog(
+            threshold=0, logger=self.logger, max_records=2, timer=self.clock
+        )
+
+    def test_parse(self):
+        with self.assertLogs(self.logger, logging.WARNING) as logs:
+            result = mathparse.parse(
+                'five plus three', 'ENG', slow_query_log=self.log
+            )
+
+        self.assertEqual(result, 8)
+        record, = logs.records
+        self.assertIn('Slow parse call took', record.getMessage())
+        self.assertIn("'five plus three'", record.getMessage())
+        self.assertEqual(record.slow_query['language'], 'ENG')
+        self.assertEqual(record.slow_query['token_count'], 3)
+        self.assertEqual(list(record.slow_query['stages']), [
+            'replace_words',
+            'tokenize',
+            'preprocess_unary_operators',
+            'to_postfix',
+            'evaluate_postfix',
+        ])
+
+    def test_numeric_fast_path(self):
+        with self.assertLogs(self.logger) as logs:
+            mathparse.parse('2 + 3 * 4', slow_query_log=self.log)
+
+        self.assertEqual(list(logs.records[0].slow_query['stages']), [
+            'scan_numeric_expression', 'evaluate_infix'
+        ])
+
+    def test_compiled_numeric_fast_path(self):
+        stages = mathparse._StageTimer()
+        expression = mathparse._compile(
+            '2 + 3 * 4', None, None, None, None, stages=stages
+        )
+
+        self.assertEqual(expression.evaluate(), 14)
+        self.assertEqual(stages.token_count, 5)
+        self.assertEqual(list(stages.durations), [
+            'scan_numeric_expression', 'to_postfix'
+        ])
+
+    def test_cache(self):
+        cache = mathparse.ResultCache()
+
+        with self.assertLogs(self.logger) as logs:
+            for _ in range(2):
+                mathparse.parse(
+                    'two times three', 'ENG', engine='fused', cache=cache,
+                    slow_query_log=self.log
+                )
+
+        self.assertIn('evaluate_infix', logs.records[0].slow_query['stages'])
+        self.assertEqual(list(logs.records[1].slow_query['stages']), [
+            'cache'
+        ])
+
+    def test_extract_expression(self):
+        with self.assertLogs(self.logger) as logs:
+            result = mathparse.extract_expression(
+                'What is 5 plus 3?', 'ENG', slow_query_log=self.log
+            )
+
+        self.assertEqual(result, '5 plus 3')
+        self.assertEqual(logs.records[0].slow_query['function'], (
+            'extract_expression'
+        ))
+        self.assertEqual(list(logs.records[0].slow_query['stages']), [
+            'tokenize', 'find_expression'
+        ])
+
+    def test_error(self):
+        with self.assertLogs(self.logger) as logs:
+            with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+                mathparse.parse('1 +', slow_query_log=self.log)
+
+        self.assertIn('raised', logs.records[0].getMessage())
+        self.assertIn(
+            'PostfixTokenEvaluationException',
+            logs.records[0].slow_query['error']
+        )
+
+    def test_input_is_truncated(self):
+        log = mathparse.SlowQueryLog(
+            threshold=0, logger=self.logger, max_input_length=10
+        )
+        string = ' + '.join(['1'] * 100)
+
+        with self.assertLogs(self.logger) as logs:
+            mathparse.parse(string, slow_query_log=log)
+
+        data = logs.records[0].slow_query
+        self.assertEqual(data['input'], string[:10] + '...')
+        self.assertEqual(data['input_length'], len(string))
+        self.assertIn('({} characters)'.format(len(string)), (
+            logs.records[0].getMessage()
+        ))
+
+    def test_rate_limit(self):
+        with self.assertLogs(self.logger) as logs:
+            for _ in range(5):
+                mathparse.parse('1 + 1', slow_query_log=self.log)
+
+            self.clock.now = 60
+            mathparse.parse('1 + 1', slow_query_log=self.log)
+
+        self.assertEqual(len(logs.records), 3)
+        self.assertEqual(logs.records[2].slow_query['suppressed'], 3)
+        self.assertIn('3 slow calls were not logged', (
+            logs.records[2].getMessage()
+        ))
+
+    def test_threshold(self):
+        log = mathparse.SlowQueryLog(threshold=60, logger=self.logger)
+
+        with self.assertLogs(self.logger) as logs:
+            mathparse.parse('1 + 1', slow_query_log=log)
+            self.logger.warning('Finished')
+
+        self.assertEqual(logs.output, ['WARNING:tests.slow_queries:Finished'])
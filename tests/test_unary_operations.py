@@ -144,3 +144,78 @@ class UnaryWordOperatorTestCase(TestCase):
         result = mathparse.parse('(log 100) ^ 2')
 
         self.assertEqual(result, 4.0)
+
+
+class PostfixOperatorTestCase(TestCase):
+
+    def test_squared(self):
+        result = mathparse.parse('three squared', language='ENG')
+
+        self.assertEqual(result, 9)
+
+    def test_group(self):
+        result = mathparse.parse('(2 + 3) squared', language='ENG')
+
+        self.assertEqual(result, 25)
+
+    def test_precedence(self):
+        result = mathparse.parse('2 times 3 squared plus 1', language='ENG')
+
+        self.assertEqual(result, 19)
+
+    def test_decimal(self):
+        result = mathparse.parse('2.5 squared', language='ENG')
+
+        self.assertEqual(result, 6.25)
+
+    def test_repeated(self):
+        result = mathparse.parse('2 squared cubed', language='ENG')
+
+        self.assertEqual(result, 64)
+
+    def test_negative(self):
+        result = mathparse.parse('negative 3 squared', language='ENG')
+
+        self.assertEqual(result, -9)
+
+    def test_negative_number(self):
+        result = mathparse.parse('-2 squared', language='ENG')
+
+        self.assertEqual(result, -4)
+        self.assertEqual(
+            result, mathparse.parse('- 2 squared', language='ENG')
+        )
+
+    def test_negative_decimal(self):
+        self.assertEqual(mathparse.parse('3 * -2.5²'), -18.75)
+
+    def test_negative_group(self):
+        self.assertEqual(mathparse.parse('(-2)²'), 4)
+
+    def test_symbol(self):
+        self.assertEqual(mathparse.parse('2 * (1 + 2)²'), 18)
+
+    def test_chinese(self):
+        result = mathparse.parse('一加二平方', language='CHI')
+
+        self.assertEqual(result, 5)
+
+    def test_missing_value(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            mathparse.parse('2 + squared', language='ENG')
+
+    def test_preprocess(self):
+        tokens = mathparse.preprocess_unary_operators(
+            ['2', '*', '(', '1', '+', '2', ')', '²']
+        )
+
+        self.assertEqual(tokens, [
+            '2', '*', '(', '(', '1', '+', '2', ')', '^', '2', ')'
+        ])
+
+    def test_preprocess_negative_number(self):
+        tokens = mathparse.preprocess_unary_operators(['-2', '²', '²'])
+
+        self.assertEqual(tokens, [
+            'neg', '(', '(', '2', '^', '2', ')', '^', '2', ')'
+        ])
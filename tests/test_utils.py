@@ -62,6 +62,27 @@ class TokenizationTestCase(TestCase):
         with self.assertRaises(InvalidLanguageCodeException):
             mathparse.tokenize('Three PLUS five', language='123')
 
+    def test_spaced_phrase(self):
+        result = mathparse.tokenize('二 乘 以 三', language='CHI')
+
+        self.assertEqual(result, ['二', '乘以', '三'])
+
+    def test_spaced_letters_in_segmented_language(self):
+        result = mathparse.tokenize('opløftet i to', language='DAN')
+
+        self.assertEqual(result, ['opløftet i', 'to'])
+
+    def test_longest_phrase_with_spaces(self):
+        result = mathparse.tokenize(
+            'квадратный корень из девяти', language='RUS'
+        )
+
+        self.assertEqual(result, ['квадратный корень из', 'девяти'])
+
+    def test_combining_mark_at_end(self):
+        self.assertEqual(mathparse.tokenize('สี่', language='THA'), ['สี่'])
+        self.assertEqual(mathparse.tokenize('सौ', language='HIN'), ['सौ'])
+
     def test_load_english_words(self):
         from mathparse import mathwords
 
@@ -115,3 +136,68 @@ class ExtractExpressionTestCase(TestCase):
         )
 
         self.assertEqual(result, 'three plus three')
+
+
+class NumberPhraseTestCase(TestCase):
+
+    scales = {'hundred': 100, 'thousand': 1000, 'million': 1000000}
+
+    def test_phrase(self):
+        result = mathparse.replace_number_phrases(
+            '3 thousand 6 hundred 2 + 1', self.scales
+        )
+
+        self.assertEqual(result, '3602 + 1')
+
+    def test_numbers_without_scale(self):
+        result = mathparse.replace_number_phrases(
+            '1 2 hundred 3 4', self.scales
+        )
+
+        self.assertEqual(result, '1 203 4')
+
+    def test_scale_without_number(self):
+        result = mathparse.replace_number_phrases(
+            'hundred + 5 thousand', self.scales
+        )
+
+        self.assertEqual(result, 'hundred + 5000')
+
+    def test_decimal_number(self):
+        result = mathparse.replace_number_phrases('1.5 million', self.scales)
+
+        self.assertEqual(result, '1500000')
+
+    def test_long_number(self):
+        string = ' '.join(['9 hundred 9 thousand'] * 1000)
+        result = mathparse.replace_number_phrases(string, self.scales)
+
+        self.assertEqual(result, str(909000 * 1000))
+
+    def test_number_with_too_many_digits(self):
+        string = '1' * 5000 + ' thousand 2 hundred'
+        result = mathparse.replace_number_phrases(string, self.scales)
+
+        self.assertEqual(result, '1' * 5000 + ' thousand 200')
+
+
+class FindWordGroupsTestCase(TestCase):
+
+    scales = ['hundred', 'thousand']
+
+    def test_find_word_groups(self):
+        result = mathparse.find_word_groups(
+            '3 thousand 6 hundred 2 apples and 4 hundred', self.scales
+        )
+
+        self.assertEqual(result, ['3 thousand 6 hundred 2', '4 hundred'])
+
+    def test_whole_words(self):
+        result = mathparse.find_word_groups('3 hundreds', self.scales)
+
+        self.assertEqual(result, [])
+
+    def test_digits_followed_by_spaces(self):
+        string = '1' * 50000 + ' ' * 50000 + 'x'
+
+        self.assertEqual(mathparse.find_word_groups(string, self.scales), [])
@@ -0,0 +1,137 @@
+import threading
+from unittest import TestCase
+from mathparse import mathparse
+from mathparse.mathwords import InvalidLanguageCodeException
+
+
+class WordReplacementCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = mathparse.WordReplacementCache(maxsize=2)
+
+    def test_hit(self):
+        result = self.cache.replace_words('five plus three', 'ENG')
+        cached = self.cache.replace_words('five plus three', 'ENG')
+
+        self.assertEqual(result, '5 + 3')
+        self.assertEqual(cached, result)
+        self.assertEqual(
+            self.cache.cache_info(),
+            mathparse.CacheInfo(1, 1, 0, 2, 1)
+        )
+
+    def test_whitespace_is_normalized(self):
+        self.cache.replace_words('five plus three', 'ENG')
+        result = self.cache.replace_words(' five  plus\tthree ', 'ENG')
+
+        self.assertEqual(result, '5 + 3')
+        self.assertEqual(self.cache.cache_info().hits, 1)
+
+    def test_key_includes_language_and_stopwords(self):
+        self.cache.replace_words('what is cinq plus trois', 'ENG')
+        self.cache.replace_words('what is cinq plus trois', 'FRE')
+        result = self.cache.replace_words(
+            'what is cinq plus trois', 'FRE', stopwords={'what', 'is'}
+        )
+
+        self.assertEqual(result, '5 + 3')
+        self.assertEqual(self.cache.cache_info().misses, 3)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.replace_words('one plus one', 'ENG')
+        self.cache.replace_words('two plus two', 'ENG')
+        self.cache.replace_words('one plus one', 'ENG')
+        self.cache.replace_words('three plus three', 'ENG')
+        self.cache.replace_words('one plus one', 'ENG')
+
+        info = self.cache.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.currsize, 2)
+
+    def test_simplified_chinese(self):
+        result = self.cache.replace_words('三加五', 'CHI')
+
+        self.assertEqual(
+            result,
+            mathparse.replace_word_tokens_simplified_chinese('三加五')
+        )
+        self.assertEqual(mathparse.tokenize(result, 'CHI'), ['3', '+', '5'])
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaises(InvalidLanguageCodeException):
+            self.cache.replace_words('five plus three', 'XYZ')
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self):
+        self.cache.replace_words('five plus three', 'ENG')
+        self.cache.clear()
+
+        self.assertEqual(
+            self.cache.cache_info(),
+            mathparse.CacheInfo(0, 0, 0, 2, 0)
+        )
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            mathparse.WordReplacementCache(maxsize=0)
+
+    def test_threads(self):
+        cache = mathparse.WordReplacementCache(maxsize=10)
+
+        def replace():
+            for number in ['one', 'two', 'three'] * 100:
+                cache.replace_words(number + ' plus one', 'ENG')
+
+        threads = [threading.Thread(target=replace) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 1200)
+        self.assertEqual(info.currsize, 3)
+
+
+class WordCacheParameterTestCase(TestCase):
+
+    def setUp(self):
+        self.cache = mathparse.WordReplacementCache()
+
+    def test_parse(self):
+        for engine in mathparse.ENGINES:
+            result = mathparse.parse(
+                'seven times nine plus eight', language='ENG',
+                engine=engine, word_cache=self.cache
+            )
+            self.assertEqual(result, 71)
+
+        self.assertEqual(self.cache.cache_info().hits, 1)
+
+    def test_compile(self):
+        expression = mathparse.compile(
+            'five plus three', language='ENG', word_cache=self.cache
+        )
+
+        self.assertEqual(expression.evaluate(), 8)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_parse_tree(self):
+        tree = mathparse.parse_tree(
+            'one plus two', language='ENG', word_cache=self.cache
+        )
+
+        self.assertEqual(mathparse.evaluate_postfix(tree), 3)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_parse_batch(self):
+        results = mathparse.parse_batch(
+            ['two times three', 'two times three', '1 + 1'],
+            language='ENG',
+            word_cache=self.cache
+        )
+
+        self.assertEqual(results, [6, 6, 2])
+        self.assertEqual(self.cache.cache_info().hits, 1)
@@ -0,0 +1,127 @@
+from decimal import Decimal
+from fractions import Fraction
+from unittest import TestCase
+from mathparse import mathparse
+
+
+class WorkbookTestCase(TestCase):
+
+    def setUp(self):
+        self.workbook = mathparse.Workbook(language='ENG')
+        self.workbook.set('subtotal', 'five times twenty')
+        self.workbook.set('tax', 'subtotal divided by ten')
+        self.workbook.set('total', 'subtotal plus tax')
+
+    def test_values(self):
+        self.assertEqual(self.workbook['subtotal'], 100)
+        self.assertEqual(self.workbook['tax'], 10)
+        self.assertEqual(self.workbook['total'], 110)
+
+    def test_recalculate_dependents_in_order(self):
+        recalculated = self.workbook.set('subtotal', '200')
+
+        self.assertEqual(recalculated, ['subtotal', 'tax', 'total'])
+        self.assertEqual(self.workbook['total'], Decimal('220'))
+
+    def test_recalculate_only_dependents(self):
+        recalculated = self.workbook.set('tax', 'twenty')
+
+        self.assertEqual(recalculated, ['tax', 'total'])
+        self.assertEqual(self.workbook['total'], 120)
+
+    def test_number(self):
+        self.workbook.set('subtotal', 50)
+
+        self.assertEqual(self.workbook['total'], 55)
+
+    def test_names_are_case_insensitive(self):
+        self.workbook.set('Discount', '5')
+        self.workbook.set('net', 'total minus DISCOUNT')
+
+        self.assertEqual(self.workbook['NET'], 105)
+
+    def test_circular_reference(self):
+        with self.assertRaises(mathparse.CircularReferenceException):
+            self.workbook.set('subtotal', 'total plus one')
+
+        self.assertEqual(self.workbook['total'], 110)
+
+    def test_self_reference(self):
+        with self.assertRaises(mathparse.CircularReferenceException):
+            self.workbook.set('count', 'count plus one')
+
+    def test_undefined_name(self):
+        self.workbook.set('net', 'total minus discount')
+
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            self.workbook['net']
+
+        self.assertEqual(self.workbook.set('discount', '10'), [
+            'discount', 'net'
+        ])
+        self.assertEqual(self.workbook['net'], 100)
+
+    def test_remove(self):
+        self.assertEqual(self.workbook.remove('tax'), ['total'])
+
+        self.assertNotIn('tax', self.workbook)
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            self.workbook['total']
+
+    def test_division_by_zero(self):
+        self.workbook.set('subtotal', '0')
+        self.workbook.set('ratio', 'tax divided by subtotal')
+        self.workbook.set('doubled', 'ratio times two')
+
+        self.assertEqual(self.workbook['doubled'], 'undefined')
+
+    def test_invalid_expression(self):
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            self.workbook.set('total', 'subtotal & tax')
+
+        self.assertEqual(self.workbook['total'], 110)
+
+    def test_invalid_name(self):
+        for name in ['one', 'pi', 'sqrt', '2x', 'net total']:
+            with self.assertRaises(ValueError):
+                self.workbook.set(name, '1')
+
+    def test_name_containing_words(self):
+        with self.assertRaises(ValueError):
+            self.workbook.set('timestamp', '5')
+
+        self.workbook.set('overhead', '5')
+
+        self.assertEqual(self.workbook['overhead'], 5)
+
+    def test_words_within_unknown_name(self):
+        self.workbook.set('doubled', 'plusminus * 2')
+
+        with self.assertRaises(mathparse.PostfixTokenEvaluationException):
+            self.workbook['doubled']
+
+    def test_negative_name(self):
+        for expression in ['-subtotal', '(-subtotal)', '- subtotal']:
+            self.workbook.set('refund', expression)
+
+            self.assertEqual(self.workbook['refund'], -100)
+
+    def test_subtract_negative_name(self):
+        self.workbook.set('difference', 'tax -subtotal')
+
+        self.assertEqual(self.workbook['difference'], -90)
+
+    def test_missing_name(self):
+        with self.assertRaises(KeyError):
+            self.workbook['missing']
+
+    def test_names(self):
+        self.assertEqual(list(self.workbook), ['subtotal', 'tax', 'total'])
+        self.assertEqual(len(self.workbook), 3)
+
+    def test_numeric_mode(self):
+        workbook = mathparse.Workbook(numeric_mode='fraction')
+        workbook.set('third', '1 / 3')
+        workbook.set('total', 'third * 3 + 0.5')
+
+        self.assertEqual(workbook['total'], Fraction(3, 2))